@@ -24,6 +24,7 @@
 
 #define DATE_LEN	128
 #define EXTNAME_LEN	128
+#define FINGERPRINT_LEN	(EVP_MAX_MD_SIZE * 3)
 
 int convert_ASN1TIME(ASN1_TIME *t, char *buf, size_t len)
 {
@@ -43,74 +44,64 @@ int convert_ASN1TIME(ASN1_TIME *t, char *buf, size_t len)
 	return EXIT_SUCCESS;
 }
 
-static PyObject * get_cert_info(PyObject *self, PyObject *args)
+/*
+ * Parse the certificate read from the given BIO, which may be PEM, DER or PKCS12 encoded. The
+ * BIO must support BIO_reset() so that each encoding can be tried in turn. 'func' is the name of
+ * the calling Python function, used to prefix error messages.
+ */
+static PyObject * parse_cert_info(BIO *bio, const char *password, const char *func)
 {
-	const char *path = NULL;
-	const char *password = NULL;
-	FILE *fp = NULL;
 	X509 *cert = NULL;
-	char *serial_number;
-	char *subject;
-	char *issuer;
+	char *serial_number = NULL;
+	char *subject = NULL;
+	char *issuer = NULL;
 	BIGNUM *serial_number_bn = NULL;
 	int version = 0;
 	ASN1_TIME *not_before;
 	ASN1_TIME *not_after;
 	char not_before_str[DATE_LEN];
 	char not_after_str[DATE_LEN];
+	unsigned char digest[EVP_MAX_MD_SIZE];
+	unsigned int digest_len = 0;
+	char fingerprint[FINGERPRINT_LEN] = "";
 	const STACK_OF(X509_EXTENSION) *exts = NULL;
 	X509_EXTENSION *ex = NULL;
 	ASN1_OBJECT *obj = NULL;
 	int num_of_exts = -1;
-	EVP_PKEY *pkey;
+	EVP_PKEY *pkey = NULL;
 	STACK_OF(X509) *ca = NULL;
-	PKCS12 *p12;
+	PKCS12 *p12 = NULL;
 	PyObject *extensions_list = NULL;
 	PyObject *result = NULL;
 
-	if (!PyArg_ParseTuple(args, "z|z", &path, &password)) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: PyArg_ParseTuple failed");
-		goto exit;
-	}
-	if (!(path && *path)) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: path is required");
-		goto exit;
-	}
 	OpenSSL_add_all_algorithms();
 
-	fp = fopen(path, "r");
-	if (!fp) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: unable to open certificate");
-		goto exit;
-	}
-
-	cert = PEM_read_X509(fp, NULL, NULL, NULL);
+	cert = PEM_read_bio_X509(bio, NULL, NULL, NULL);
 	if (!cert) {
 		// Could not open the cert as a PEM, let's try DER
 		ERR_clear_error();
-		rewind(fp);
-		cert = d2i_X509_fp(fp, NULL);
+		BIO_reset(bio);
+		cert = d2i_X509_bio(bio, NULL);
 		if (!cert) {
 			// Could not open the cert as a DER either, let's try PKCS12
 			ERR_clear_error();
 			if (!(password && *password))
 				password = "";
-			rewind(fp);
-			p12 = d2i_PKCS12_fp(fp, NULL);
+			BIO_reset(bio);
+			p12 = d2i_PKCS12_bio(bio, NULL);
 			if (!p12) {
-				PyErr_SetString(PyExc_RuntimeError,
-					"get_cert_info: unable to read certificate");
+				PyErr_Format(PyExc_RuntimeError,
+					"%s: unable to read certificate", func);
 				goto exit;
 			}
 			if (!PKCS12_parse(p12, password, &pkey, &cert, &ca)) {
-				PyErr_SetString(PyExc_RuntimeError,
-					"get_cert_info: unable to parse PKCS12 certificate");
+				PyErr_Format(PyExc_RuntimeError,
+					"%s: unable to parse PKCS12 certificate", func);
 				goto exit;
 			}
-			PKCS12_free(p12);
 			if (!cert) {
-				PyErr_SetString(PyExc_RuntimeError,
-					"get_cert_info: unable to parse certificate");
+				PyErr_Format(PyExc_RuntimeError,
+					"%s: unable to parse certificate", func);
 				goto exit;
 			}
 		}
@@ -124,29 +115,37 @@ static PyObject * get_cert_info(PyObject *self, PyObject *args)
 
 	serial_number_bn = ASN1_INTEGER_to_BN(X509_get_serialNumber(cert), NULL);
 	if (!serial_number_bn) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: unable to read serial number");
+		PyErr_Format(PyExc_RuntimeError, "%s: unable to read serial number", func);
 		goto exit;
 	}
 
 	serial_number = BN_bn2dec(serial_number_bn);
 	if (!serial_number) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: unable to parse serial number");
+		PyErr_Format(PyExc_RuntimeError, "%s: unable to parse serial number", func);
 		goto exit;
 	}
 
 	not_before = X509_get_notBefore(cert);
 	not_after = X509_get_notAfter(cert);
 	if (convert_ASN1TIME(not_before, not_before_str, DATE_LEN) == EXIT_FAILURE) {
-		PyErr_SetString(PyExc_RuntimeError,
-			"get_cert_info: unable to parse not before date");
+		PyErr_Format(PyExc_RuntimeError,
+			"%s: unable to parse not before date", func);
 		goto exit;
 	}
 	if (convert_ASN1TIME(not_after, not_after_str, DATE_LEN) == EXIT_FAILURE) {
-		PyErr_SetString(PyExc_RuntimeError,
-			"get_cert_info: unable to parse not after date");
+		PyErr_Format(PyExc_RuntimeError,
+			"%s: unable to parse not after date", func);
 		goto exit;
 	}
 
+	// SHA-256 fingerprint of the DER encoded certificate, as colon separated hex bytes
+	if (!X509_digest(cert, EVP_sha256(), digest, &digest_len)) {
+		PyErr_Format(PyExc_RuntimeError, "%s: unable to compute fingerprint", func);
+		goto exit;
+	}
+	for (unsigned int i = 0; i < digest_len; i++)
+		snprintf(&fingerprint[i * 3], 4, i + 1 < digest_len ? "%02X:" : "%02X", digest[i]);
+
 #if OPENSSL_VERSION_NUMBER >= 0x10100000L
 	exts = X509_get0_extensions(cert);
 #else
@@ -154,29 +153,31 @@ static PyObject * get_cert_info(PyObject *self, PyObject *args)
 #endif
 	num_of_exts = exts ? sk_X509_EXTENSION_num(exts) : 0;
 	if (num_of_exts < 0) {
-		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: unable to parse extensions");
+		PyErr_Format(PyExc_RuntimeError, "%s: unable to parse extensions", func);
 		goto exit;
 	}
 	extensions_list = PyList_New(num_of_exts);
+	if (extensions_list == NULL)
+		goto exit;
 
 	for (int i = 0; i < num_of_exts; i++) {
 		ex = sk_X509_EXTENSION_value(exts, i);
 		if (ex == NULL) {
-			PyErr_SetString(PyExc_RuntimeError,
-				"get_cert_info: unable to extract extension from stack");
+			PyErr_Format(PyExc_RuntimeError,
+				"%s: unable to extract extension from stack", func);
 			goto exit;
 		}
 		obj = X509_EXTENSION_get_object(ex);
 		if (obj == NULL) {
-			PyErr_SetString(PyExc_RuntimeError,
-				"get_cert_info: unable to extract ASN1 object from extension");
+			PyErr_Format(PyExc_RuntimeError,
+				"%s: unable to extract ASN1 object from extension", func);
 			goto exit;
 		}
 
 		BIO *ext_bio = BIO_new(BIO_s_mem());
 		if (ext_bio == NULL) {
-			PyErr_SetString(PyExc_RuntimeError,
-				"get_cert_info: unable to allocate memory for extension value BIO");
+			PyErr_Format(PyExc_RuntimeError,
+				"%s: unable to allocate memory for extension value BIO", func);
 			goto exit;
 		}
 		if (!X509V3_EXT_print(ext_bio, ex, 0, 0)) {
@@ -189,14 +190,13 @@ static PyObject * get_cert_info(PyObject *self, PyObject *args)
 
 		BUF_MEM *bptr;
 		BIO_get_mem_ptr(ext_bio, &bptr);
-		BIO_set_close(ext_bio, BIO_NOCLOSE);
-		BIO_free(ext_bio);
 
 		// Decode data value string as UTF-8 using the 'replace' error handling method
 		PyObject *value = PyUnicode_DecodeUTF8(bptr->data, bptr->length, "replace");
+		BIO_free(ext_bio);
 		if (value == NULL) {
-			PyErr_SetString(PyExc_RuntimeError,
-				"get_cert_info: unable to parse extension value");
+			PyErr_Format(PyExc_RuntimeError,
+				"%s: unable to parse extension value", func);
 			goto exit;
 
 		}
@@ -214,8 +214,8 @@ static PyObject * get_cert_info(PyObject *self, PyObject *args)
 			const char *c_ext_name = OBJ_nid2ln(nid);
 			if (c_ext_name == NULL) {
 				Py_XDECREF(value);
-				PyErr_SetString(PyExc_RuntimeError,
-					"get_cert_info: invalid X509v3 extension name");
+				PyErr_Format(PyExc_RuntimeError,
+					"%s: invalid X509v3 extension name", func);
 				goto exit;
 			}
 			PyList_SET_ITEM(extensions_list,
@@ -225,25 +225,105 @@ static PyObject * get_cert_info(PyObject *self, PyObject *args)
 		Py_XDECREF(value);
 	}
 
-	result = Py_BuildValue("{s:i,s:s,s:s,s:s,s:s,s:s,s:O}",
+	result = Py_BuildValue("{s:i,s:s,s:s,s:s,s:s,s:s,s:s,s:O}",
 		"version", version,
 		"serial_number", serial_number,
 		"subject", subject,
 		"issuer", issuer,
 		"not_before", not_before_str,
 		"not_after", not_after_str,
+		"fingerprint", fingerprint,
 		"extensions", extensions_list);
-	Py_XDECREF(extensions_list);
 
 exit:
+	Py_XDECREF(extensions_list);
+	if (p12)
+		PKCS12_free(p12);
+	if (pkey)
+		EVP_PKEY_free(pkey);
 	if (ca)
 		sk_X509_pop_free(ca, X509_free);
 	if (cert)
 		X509_free(cert);
+	if (serial_number)
+		OPENSSL_free(serial_number);
 	if (serial_number_bn)
 		BN_free(serial_number_bn);
-	if (fp)
-		fclose(fp);
+	if (subject)
+		OPENSSL_free(subject);
+	if (issuer)
+		OPENSSL_free(issuer);
+
+	ERR_clear_error();
+
+	return result;
+}
+
+static PyObject * get_cert_info(PyObject *self, PyObject *args)
+{
+	const char *path = NULL;
+	const char *password = NULL;
+	BIO *bio = NULL;
+	PyObject *result = NULL;
+
+	if (!PyArg_ParseTuple(args, "z|z", &path, &password)) {
+		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: PyArg_ParseTuple failed");
+		goto exit;
+	}
+	if (!(path && *path)) {
+		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: path is required");
+		goto exit;
+	}
+
+	bio = BIO_new_file(path, "r");
+	if (!bio) {
+		PyErr_SetString(PyExc_RuntimeError, "get_cert_info: unable to open certificate");
+		goto exit;
+	}
+
+	result = parse_cert_info(bio, password, "get_cert_info");
+
+exit:
+	if (bio)
+		BIO_free(bio);
+
+	ERR_clear_error();
+
+	return result;
+}
+
+static PyObject * get_cert_info_from_buffer(PyObject *self, PyObject *args)
+{
+	Py_buffer data = { 0 };
+	const char *password = NULL;
+	BIO *bio = NULL;
+	PyObject *result = NULL;
+
+	if (!PyArg_ParseTuple(args, "y*|z", &data, &password)) {
+		PyErr_SetString(PyExc_RuntimeError,
+			"get_cert_info_from_buffer: PyArg_ParseTuple failed");
+		return NULL;
+	}
+	if (data.len <= 0 || data.len > INT_MAX) {
+		PyErr_SetString(PyExc_RuntimeError,
+			"get_cert_info_from_buffer: invalid certificate length");
+		goto exit;
+	}
+
+	// The memory BIO reads the caller's buffer in place, without copying it
+	bio = BIO_new_mem_buf(data.buf, (int) data.len);
+	if (!bio) {
+		PyErr_SetString(PyExc_RuntimeError,
+			"get_cert_info_from_buffer: unable to allocate certificate BIO");
+		goto exit;
+	}
+
+	result = parse_cert_info(bio, password, "get_cert_info_from_buffer");
+
+exit:
+	if (bio)
+		BIO_free(bio);
+	PyBuffer_Release(&data);
 
 	ERR_clear_error();
 
@@ -253,6 +333,7 @@ exit:
 static PyMethodDef openssl_extension_methods[] =
 {
 	{ "get_cert_info",		get_cert_info,  METH_VARARGS, "Return the basic information about a certificate"	},
+	{ "get_cert_info_from_buffer",	get_cert_info_from_buffer,  METH_VARARGS, "Return the basic information about a certificate held in memory"	},
 	{ NULL,			NULL,		    0,		  NULL				     }
 };
 
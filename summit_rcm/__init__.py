@@ -12,7 +12,7 @@ import pkgutil
 import signal
 from syslog import LOG_ERR, syslog, openlog
 from types import ModuleType
-from typing import Any, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import os
 
 try:
@@ -22,17 +22,22 @@ except ImportError as error:
     if os.environ.get("DOCS_GENERATION") != "True":
         raise error
 
-from summit_rcm.utils import Singleton
-from summit_rcm.services.date_time_service import DateTimeService
-from summit_rcm.settings import ServerConfig, SystemSettingsManage
-from summit_rcm.definition import RouteAdd
+# Imported first so that the startup profiler, if enabled, can time every other import
+from summit_rcm.startup_profiler import startup_profiler
+from summit_rcm.utils import PrefixTrie, Singleton, VersionedList
+from summit_rcm.settings import (
+    ServerConfig,
+    SummitRCMConfigManage,
+    SystemSettingsManage,
+)
+from summit_rcm.definition import RouteAdd, RouteWarmupStrategyEnum
+from summit_rcm.services.login_service import LoginService
 
 
 try:
     import falcon.asgi
 
     try:
-        from summit_rcm.rest_api.services.spectree_service import SpectreeService
         import uvicorn.config
     except ImportError as error:
         # Ignore the error if the uvicorn module is not available if generating documentation
@@ -48,7 +53,10 @@ try:
     X509_V_FLAG_NO_CHECK_TIME = 0x200000
     """Flags for OpenSSL 1.1.1 or newer to disable time checking during certificate verification"""
 
-    summit_rcm_plugins: List[str] = []
+    summit_rcm_plugins: List[str] = VersionedList()
+
+    PATH_LOOKUP_CACHE_SIZE = 1024
+    """Maximum number of request paths whose route/restriction lookup results are cached"""
 
     discovered_plugins: dict[str, ModuleType] = {}
 
@@ -81,40 +89,63 @@ try:
         """Middleware that handles enforcing checking for a valid session"""
 
         def __init__(self) -> None:
-            self.paths = [
-                "connections",
-                "connection",
-                "accesspoints",
-                "networkInterfaces",
-                "networkInterface",
-                "file",
-                "users",
-                "firmware",
-                "logData",
-                "logSetting",
-                "logWebserver",
-                "poweroff",
-                "suspend",
-                "files",
-                "certificates",
-                "datetime",
-                "fips",
-                "/api/v2/network/interfaces",
-                "/api/v2/network/connections",
-                "/api/v2/network/accessPoints",
-                "/api/v2/network/certificates",
-                "/api/v2/network/wifi",
-                "/api/v2/system/power",
-                "/api/v2/system/update",
-                "/api/v2/system/fips",
-                "/api/v2/system/factoryReset",
-                "/api/v2/system/datetime",
-                "/api/v2/system/config",
-                "/api/v2/system/logs",
-                "/api/v2/system/debug",
-                "/api/v2/system/version",
-                "/api/v2/login/users",
-            ]
+            self.paths = VersionedList(
+                [
+                    "connections",
+                    "connection",
+                    "accesspoints",
+                    "networkInterfaces",
+                    "networkInterface",
+                    "file",
+                    "users",
+                    "firmware",
+                    "logData",
+                    "logSetting",
+                    "logWebserver",
+                    "poweroff",
+                    "suspend",
+                    "files",
+                    "certificates",
+                    "datetime",
+                    "fips",
+                    "/api/v2/network/status/cache",
+                    "/api/v2/network/interfaces",
+                    "/api/v2/network/connections",
+                    "/api/v2/network/accessPoints",
+                    "/api/v2/network/certificates",
+                    "/api/v2/network/wifi",
+                    "/api/v2/system/power",
+                    "/api/v2/system/update",
+                    "/api/v2/system/fips",
+                    "/api/v2/system/factoryReset",
+                    "/api/v2/system/datetime",
+                    "/api/v2/system/config",
+                    "/api/v2/system/logs",
+                    "/api/v2/system/debug",
+                    "/api/v2/system/exports",
+                    "/api/v2/system/version",
+                    "/api/v2/login/users",
+                ]
+            )
+            self._restricted_version: Optional[Tuple[int, int, int]] = None
+            self._restricted_roots: Set[str] = set()
+            self._restricted_prefixes = PrefixTrie()
+            self._restricted_lookups: Dict[str, bool] = {}
+
+        def _update_restricted_paths(self) -> None:
+            """
+            Rebuild the restricted path lookup structures if the restricted paths have changed
+            """
+            version = (id(self.paths), self.paths.version, summit_rcm_plugins.version)
+            if version == self._restricted_version:
+                return
+
+            self._restricted_roots = set(self.paths) | set(summit_rcm_plugins)
+            self._restricted_prefixes = PrefixTrie()
+            for path in self._restricted_roots:
+                self._restricted_prefixes.insert(path)
+            self._restricted_lookups = {}
+            self._restricted_version = version
 
         def session_is_valid(self, req: falcon.asgi.Request) -> bool:
             """Determine if the current request's session is valid"""
@@ -143,20 +174,23 @@ try:
             if ".js" in url:
                 return False
 
-            path_root = req.path.split("/")[1]
-            if path_root in self.paths or path_root in summit_rcm_plugins:
-                return True
-
-            # For v2 routes, check if the requested path starts with a restricted path string
-            for path in self.paths:
-                if req.path.startswith(path):
-                    return True
+            self._update_restricted_paths()
+            restricted = self._restricted_lookups.get(req.path, None)
+            if restricted is not None:
+                return restricted
 
-            for plugin in summit_rcm_plugins:
-                if req.path.startswith(plugin):
-                    return True
+            # Check if the path's root is restricted, or for v2 routes, if the requested path
+            # starts with a restricted path string
+            path_root = req.path.split("/")[1]
+            restricted = (
+                path_root in self._restricted_roots
+                or self._restricted_prefixes.has_prefix(req.path)
+            )
 
-            return False
+            if len(self._restricted_lookups) >= PATH_LOOKUP_CACHE_SIZE:
+                self._restricted_lookups = {}
+            self._restricted_lookups[req.path] = restricted
+            return restricted
 
         async def process_request(
             self, req: falcon.asgi.Request, resp: falcon.asgi.Response
@@ -253,6 +287,7 @@ try:
         """
         Add the following v2 routes, if enabled:
         - /api/v2/network/status
+        - /api/v2/network/status/cache
         - /api/v2/network/interfaces
         - /api/v2/network/interfaces/{name}
         - /api/v2/network/interfaces/{name}/stats
@@ -265,11 +300,15 @@ try:
         - /api/v2/network/accessPoints
         - /api/v2/network/accessPoints/scan
         - /api/v2/network/certificates
+        - /api/v2/network/certificates/details
         - /api/v2/network/certificates/{name}
         - /api/v2/network/wifi
         """
         try:
-            from summit_rcm.rest_api.v2.network.status import NetworkStatusResource
+            from summit_rcm.rest_api.v2.network.status import (
+                NetworkStatusResource,
+                NetworkStatusCacheResource,
+            )
             from summit_rcm.rest_api.v2.network.interfaces import (
                 NetworkInterfacesResource,
                 NetworkInterfaceResource,
@@ -288,6 +327,9 @@ try:
                 AccessPointsScanResource,
             )
             from summit_rcm.rest_api.v2.network.certificates import CertificatesResource
+            from summit_rcm.rest_api.v2.network.certificates import (
+                CertificatesDetailsResource,
+            )
             from summit_rcm.rest_api.v2.network.certificates import CertificateResource
             from summit_rcm.rest_api.v2.network.wifi import WiFiResource
 
@@ -301,6 +343,7 @@ try:
                     section="summit-rcm", option="network_status_restricted", fallback=False
                 ):
                     SessionCheckingMiddleware().paths.append("/api/v2/network/status")
+                add_route("/api/v2/network/status/cache", NetworkStatusCacheResource())
                 add_route("/api/v2/network/interfaces", NetworkInterfacesResource())
                 add_route(
                     "/api/v2/network/interfaces/{name}", NetworkInterfaceResource()
@@ -335,6 +378,10 @@ try:
                     "/api/v2/network/accessPoints/scan", AccessPointsScanResource()
                 )
                 add_route("/api/v2/network/certificates", CertificatesResource())
+                add_route(
+                    "/api/v2/network/certificates/details",
+                    CertificatesDetailsResource(),
+                )
                 add_route("/api/v2/network/certificates/{name}", CertificateResource())
                 add_route("/api/v2/network/wifi", WiFiResource())
             except Exception as exception:
@@ -460,6 +507,7 @@ try:
         """Add the /datetime legacy route, if enabled"""
         try:
             from summit_rcm.rest_api.legacy.date_time import DateTimeSetting
+            from summit_rcm.services.date_time_service import DateTimeService
         except ImportError:
             DateTimeSetting = None
 
@@ -545,7 +593,12 @@ try:
         - /api/v2/system/logs/forwarding
         - /api/v2/system/logs/export
         - /api/v2/system/logs/webserver
+        - /api/v2/system/logs/tail
         - /api/v2/system/debug/export
+        - /api/v2/system/debug/startupProfile
+        - /api/v2/system/exports
+        - /api/v2/system/exports/{job_id}
+        - /api/v2/system/exports/{job_id}/file
         - /api/v2/system/version
         """
         try:
@@ -565,10 +618,20 @@ try:
                 LogsDataResource,
                 LogsConfigResource,
                 LogsExportResource,
+                LogsTailResource,
                 LogsWebserverResource,
             )
-            from summit_rcm.rest_api.v2.system.debug import DebugExportResource
+            from summit_rcm.rest_api.v2.system.debug import (
+                DebugExportResource,
+                DebugStartupProfileResource,
+            )
+            from summit_rcm.rest_api.v2.system.exports import (
+                ExportJobsResource,
+                ExportJobResource,
+                ExportJobFileResource,
+            )
             from summit_rcm.rest_api.v2.system.version import VersionResource
+            from summit_rcm.services.date_time_service import DateTimeService
 
         except ImportError:
             PowerResource = None
@@ -590,7 +653,16 @@ try:
                 add_route("/api/v2/system/logs/config", LogsConfigResource())
                 add_route("/api/v2/system/logs/export", LogsExportResource())
                 add_route("/api/v2/system/logs/webserver", LogsWebserverResource())
+                add_route("/api/v2/system/logs/tail", LogsTailResource())
                 add_route("/api/v2/system/debug/export", DebugExportResource())
+                add_route(
+                    "/api/v2/system/debug/startupProfile", DebugStartupProfileResource()
+                )
+                add_route("/api/v2/system/exports", ExportJobsResource())
+                add_route("/api/v2/system/exports/{job_id}", ExportJobResource())
+                add_route(
+                    "/api/v2/system/exports/{job_id}/file", ExportJobFileResource()
+                )
                 add_route("/api/v2/system/version", VersionResource())
             except Exception as exception:
                 syslog(LOG_ERR, f"Could not load system endpoints - {str(exception)}")
@@ -619,7 +691,10 @@ try:
                 syslog(LOG_ERR, f"Could not load login endpoints - {str(exception)}")
                 raise exception
 
-    class LazyLoadRoutesMiddleware:
+    ROUTE_WARMUP_IDLE_DELAY_S = 0.1
+    """Delay between route groups when loading routes in the background"""
+
+    class LazyLoadRoutesMiddleware(metaclass=Singleton):
         """Middleware that lazy-loads routes"""
 
         legacy_network_routes = RouteAdd(add_network_legacy())
@@ -658,58 +733,155 @@ try:
             "/datetime": RouteAdd(add_date_time_legacy()),
         }
 
+        def __init__(self) -> None:
+            self._route_table: Optional[PrefixTrie] = None
+            self._route_table_lock = asyncio.Lock()
+            self._route_adds: List[Tuple[str, RouteAdd]] = []
+            self._missing_paths: Set[str] = set()
+
+        @staticmethod
+        async def add_plugin_routes(routes, get_routes) -> None:
+            """
+            Add a plugin's routes. If the plugin only listed its supported routes, the routes
+            themselves are retrieved (and imported) now.
+            """
+            if isinstance(routes, list):
+                routes = await get_routes()
+            for route in routes:
+                add_route(route, routes[route])
+                summit_rcm_plugins.append(route[1:])
+
+        async def build_route_table(self) -> PrefixTrie:
+            """
+            Build the table mapping route prefixes to the functions that add the routes under
+            them. Built-in routes come first, followed by plugin v2 and legacy routes.
+            """
+            global discovered_plugins
+
+            route_table = PrefixTrie()
+            route_adds: List[Tuple[str, RouteAdd]] = []
+            for route, route_add in self.routes_dict.items():
+                route_table.insert(route, route_add)
+                route_adds.append((route, route_add))
+
+            for name, module in discovered_plugins.items():
+                try:
+                    # If optional method for supported routes is implemented, use it
+                    if hasattr(module, "get_legacy_supported_routes") and hasattr(
+                        module, "get_v2_supported_routes"
+                    ):
+                        legacy_module_routes = (
+                            await module.get_legacy_supported_routes()
+                        )
+                        v2_module_routes = await module.get_v2_supported_routes()
+                    else:
+                        legacy_module_routes = await module.get_legacy_routes()
+                        v2_module_routes = await module.get_v2_routes()
+                except Exception as exception:
+                    syslog(
+                        LOG_ERR,
+                        f"Error retrieving routes for plugin {name}: {str(exception)}",
+                    )
+                    continue
+
+                v2_route_add = RouteAdd(
+                    self.add_plugin_routes(v2_module_routes, module.get_v2_routes),
+                    name=f"{name} (v2)",
+                )
+                for route in v2_module_routes:
+                    route_table.insert(route, v2_route_add)
+                    route_adds.append((route, v2_route_add))
+
+                legacy_route_add = RouteAdd(
+                    self.add_plugin_routes(
+                        legacy_module_routes, module.get_legacy_routes
+                    ),
+                    name=f"{name} (legacy)",
+                )
+                for route in legacy_module_routes:
+                    route_table.insert(route, legacy_route_add)
+                    route_adds.append((route, legacy_route_add))
+
+            self._route_adds = route_adds
+            return route_table
+
+        async def get_route_table(self) -> PrefixTrie:
+            """Retrieve the route table, building it if necessary"""
+            if self._route_table is None:
+                async with self._route_table_lock:
+                    if self._route_table is None:
+                        self._route_table = await self.build_route_table()
+            return self._route_table
+
+        async def warm_up(self, idle_delay: float = 0) -> None:
+            """
+            Load every group of routes ahead of the first request for it. Groups with a route
+            listed in the 'route_warmup_priority' option (a comma-separated list of route
+            prefixes) are loaded first, in the order listed, followed by the rest in route table
+            order. When an idle delay is given, it is slept between groups so that requests can
+            be served in between.
+            """
+            await self.get_route_table()
+
+            priority = [
+                prefix.strip()
+                for prefix in ServerConfig()
+                .get_parser()
+                .get("summit-rcm", "route_warmup_priority", fallback="")
+                .strip('"')
+                .split(",")
+                if prefix.strip()
+            ]
+            ordered: List[RouteAdd] = []
+            for prefix in priority:
+                for route, route_add in self._route_adds:
+                    if route.startswith(prefix) and route_add not in ordered:
+                        ordered.append(route_add)
+            for _, route_add in self._route_adds:
+                if route_add not in ordered:
+                    ordered.append(route_add)
+
+            for route_add in ordered:
+                if route_add.awaited:
+                    continue
+                try:
+                    await route_add.load()
+                except Exception as exception:
+                    syslog(
+                        LOG_ERR,
+                        f"Error loading routes for {route_add.name}: {str(exception)}",
+                    )
+                if idle_delay:
+                    await asyncio.sleep(idle_delay)
+
         async def process_request(self, req, resp):
             """Load the routes when the first request is received"""
-            global discovered_plugins
 
             # Check if the requested path is already loaded
             if app._router.find(req.path):
                 return True
 
-            # Check if the requested path is a known route and load it
-            for route, route_add in self.routes_dict.items():
-                if req.path.startswith(route):
-                    if route_add.awaited:
-                        break
-                    await route_add.route
-                    route_add.awaited = True
-                    if app._router.find(req.path):
-                        return True
-                    break
-
-            # Check if the requested path is a plugin route and load it
-            for name, module in discovered_plugins.items():
-                # If optional method for supported routes is implemented, use it
-                if hasattr(module, "get_legacy_supported_routes") and hasattr(
-                    module, "get_v2_supported_routes"
-                ):
-                    legacy_module_routes = await module.get_legacy_supported_routes()
-                    v2_module_routes = await module.get_v2_supported_routes()
-                else:
-                    legacy_module_routes = await module.get_legacy_routes()
-                    v2_module_routes = await module.get_v2_routes()
+            # Check if every route that could serve the requested path was already loaded
+            if req.path in self._missing_paths:
+                return
 
-                for route in v2_module_routes:
-                    if req.path.startswith(route):
-                        if isinstance(v2_module_routes, list):
-                            v2_module_routes_dict = await module.get_v2_routes()
-                        else:
-                            v2_module_routes_dict = v2_module_routes
-                        for route in v2_module_routes_dict:
-                            add_route(route, v2_module_routes_dict[route])
-                            summit_rcm_plugins.append(route[1:])
-                        return True
+            # Load each group of routes with a prefix matching the requested path until the path
+            # can be found
+            route_table = await self.get_route_table()
+            for route_add in route_table.find_prefixes(req.path):
+                if route_add.awaited:
+                    continue
+                await route_add.load()
+                if app._router.find(req.path):
+                    return True
 
-                for route in legacy_module_routes:
-                    if req.path.startswith(route):
-                        if isinstance(legacy_module_routes, list):
-                            legacy_module_routes_dict = await module.get_legacy_routes()
-                        else:
-                            legacy_module_routes_dict = legacy_module_routes
-                        for route in legacy_module_routes_dict:
-                            add_route(route, legacy_module_routes_dict[route])
-                            summit_rcm_plugins.append(route[1:])
-                        return True
+            if len(self._missing_paths) >= PATH_LOOKUP_CACHE_SIZE:
+                self._missing_paths = set()
+            self._missing_paths.add(req.path)
+
+        async def process_request_ws(self, req, _):
+            """Load the routes when the first WebSocket request is received"""
+            return await self.process_request(req, None)
 
     def add_default_middleware() -> None:
         """Add middleware to the ASGI application"""
@@ -728,6 +900,8 @@ try:
             app.add_middleware(SessionCheckingMiddleware())
 
         if ServerConfig().rest_api_docs_enabled:
+            from summit_rcm.rest_api.services.spectree_service import SpectreeService
+
             SpectreeService().register(app)
 
     def add_route(route_path: str, resource: Any, **kwargs):
@@ -740,15 +914,44 @@ try:
         """Discover all plugins"""
         global discovered_plugins
 
-        discovered_plugins = {
-            name: importlib.import_module(name)
-            for finder, name, ispkg in pkgutil.iter_modules(path=path)
-            if name.startswith("summit_rcm_")
-        }
+        discovered_plugins = {}
+        for _, name, _ in pkgutil.iter_modules(path=path):
+            if not name.startswith("summit_rcm_"):
+                continue
+
+            with startup_profiler.phase(f"plugin {name} import"):
+                discovered_plugins[name] = importlib.import_module(name)
+
+    route_warmup_task: Optional[asyncio.Task] = None
+    startup_profile_task: Optional[asyncio.Task] = None
+
+    async def wait_until_started(server: "uvicorn.Server") -> bool:
+        """
+        Wait for the server to start listening. Returns False if the server exited first.
+        """
+        while not server.started:
+            if server.should_exit:
+                return False
+            await asyncio.sleep(ROUTE_WARMUP_IDLE_DELAY_S)
+        return True
+
+    async def warm_up_routes_when_started(server: "uvicorn.Server") -> None:
+        """Load all routes in the background once the server is listening"""
+        if not await wait_until_started(server):
+            return
+
+        await LazyLoadRoutesMiddleware().warm_up(idle_delay=ROUTE_WARMUP_IDLE_DELAY_S)
+
+    async def finish_startup_profile_when_started(server: "uvicorn.Server") -> None:
+        """Stop the startup profiler and log its results once the server is listening"""
+        if await wait_until_started(server):
+            startup_profiler.finish()
 
     async def start_server():
         """Start the webserver and add middleware"""
         global discovered_plugins
+        global route_warmup_task
+        global startup_profile_task
 
         syslog("Starting webserver")
 
@@ -811,7 +1014,8 @@ try:
         # Call any plugin config pre-load hooks
         for name, module in discovered_plugins.items():
             try:
-                await module.server_config_preload_hook(config)
+                with startup_profiler.phase(f"plugin {name} config pre-load hook"):
+                    await module.server_config_preload_hook(config)
             except Exception as exception:
                 syslog(
                     LOG_ERR,
@@ -819,7 +1023,8 @@ try:
                 )
 
         # Load the Uvicorn server config
-        config.load()
+        with startup_profiler.phase("server config load"):
+            config.load()
 
         # Update Uvicorn server's SSL context configuration to require client authentication and
         # certificate expiration validation if enabled
@@ -848,7 +1053,8 @@ try:
         # Call any plugin config post-load hooks
         for name, module in discovered_plugins.items():
             try:
-                await module.server_config_postload_hook(config)
+                with startup_profiler.phase(f"plugin {name} config post-load hook"):
+                    await module.server_config_postload_hook(config)
             except Exception as exception:
                 syslog(
                     LOG_ERR,
@@ -858,16 +1064,26 @@ try:
         if config.ssl.verify_mode == ssl.CERT_REQUIRED:
             syslog("SSL client authentication enabled")
 
+        try:
+            route_warmup = RouteWarmupStrategyEnum(
+                parser.get("summit-rcm", "route_warmup", fallback="lazy").strip('"')
+            )
+        except ValueError:
+            syslog(LOG_ERR, "Invalid route_warmup strategy, falling back to 'lazy'")
+            route_warmup = RouteWarmupStrategyEnum.LAZY
+
         server = uvicorn.Server(config)
 
         # Save off a reference to the uvicorn server for later use
         ServerConfig().uvicorn_server = server
 
         # Add any middleware
-        add_default_middleware()
+        with startup_profiler.phase("default middleware"):
+            add_default_middleware()
         for name, module in discovered_plugins.items():
             try:
-                app.add_middleware(await module.get_middleware())
+                with startup_profiler.phase(f"plugin {name} middleware"):
+                    app.add_middleware(await module.get_middleware())
             except Exception as exception:
                 syslog(
                     LOG_ERR,
@@ -877,6 +1093,18 @@ try:
         # Register uncaught exception handler
         app.add_error_handler(Exception, custom_handle_uncaught_exception)
 
+        # Load routes up front if configured to do so
+        if route_warmup == RouteWarmupStrategyEnum.EAGER:
+            with startup_profiler.phase("route warm-up"):
+                await LazyLoadRoutesMiddleware().warm_up()
+        elif route_warmup == RouteWarmupStrategyEnum.BACKGROUND:
+            route_warmup_task = asyncio.create_task(warm_up_routes_when_started(server))
+
+        if startup_profiler.recording:
+            startup_profile_task = asyncio.create_task(
+                finish_startup_profile_when_started(server)
+            )
+
         # Start serving
         await server.serve()
 
@@ -941,4 +1169,9 @@ async def start():
 
 def main():
     """Main entry point"""
-    asyncio.run(start())
+    try:
+        asyncio.run(start())
+    finally:
+        # Write out any settings changes and sessions that are still waiting to be saved
+        SummitRCMConfigManage.flush()
+        LoginService().session_store.flush()
@@ -10,6 +10,7 @@ from syslog import LOG_ERR, syslog
 import asyncio
 import serial_asyncio
 from summit_rcm.at_interface.fsm import ATInterfaceFSM
+from summit_rcm.at_interface.line_discipline import ATLineDiscipline
 from summit_rcm.services.date_time_service import DateTimeService
 from summit_rcm.settings import ServerConfig
 
@@ -19,12 +20,14 @@ class ATInterfaceSerialProtocol(asyncio.Protocol):
 
     def connection_made(self, transport) -> None:
         self.transport = transport
+        self.line_discipline = ATLineDiscipline(ATInterfaceFSM(), transport)
+        self.line_discipline.start()
 
     def data_received(self, data) -> None:
-        asyncio.ensure_future(ATInterfaceFSM().on_input_received(data))
+        self.line_discipline.feed(data)
 
     def connection_lost(self, exc) -> None:
-        pass
+        self.line_discipline.stop()
 
 
 class ATInterface:
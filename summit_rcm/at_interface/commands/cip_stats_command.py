@@ -0,0 +1,88 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+File that consists of the CIPStats Command Functionality
+"""
+from syslog import LOG_ERR, syslog
+from typing import List, Tuple
+from summit_rcm.at_interface.commands.command import Command
+from summit_rcm.at_interface.services.connection_service import ConnectionService
+
+
+class CIPStatsCommand(Command):
+    """
+    AT Command to retrieve connection establishment and data mode throughput statistics for an
+    IP connection
+    """
+
+    NAME: str = "IP connection statistics"
+    SIGNATURE: str = "at+cipstats"
+    VALID_NUM_PARAMS: List[int] = [1]
+
+    @staticmethod
+    async def execute(params: str) -> Tuple[bool, str]:
+        (valid, params_dict) = CIPStatsCommand.parse_params(params)
+        if not valid:
+            syslog(LOG_ERR, "Invalid Parameters")
+            return (True, "ERROR")
+        try:
+            stats = ConnectionService().get_connect_stats(params_dict["connection_id"])
+            data_stats = ConnectionService().get_data_mode_stats(
+                params_dict["connection_id"]
+            )
+            if stats is None or data_stats is None:
+                return (True, "ERROR")
+
+            # +CIPSTATS: <connection_id>,<connects>,<failures>,<last DNS ms>,
+            # <last connect ms>,<last TLS handshake ms>,<average connect ms>,<address family>,
+            # <remote address>,<bytes sent>,<bytes received>,<completed sends>,<escapes>,
+            # <write errors>,<last send bytes/s>
+            stats_str = f"{params_dict['connection_id']},"
+            stats_str += f"{stats.connects},"
+            stats_str += f"{stats.failures},"
+            stats_str += f"{round(stats.last_dns_ms)},"
+            stats_str += f"{round(stats.last_connect_ms)},"
+            stats_str += f"{round(stats.last_handshake_ms)},"
+            stats_str += f"{round(stats.avg_connect_ms)},"
+            stats_str += f"{stats.last_family},"
+            stats_str += f"{stats.last_address},"
+            stats_str += f"{data_stats.tx_bytes},"
+            stats_str += f"{data_stats.rx_bytes},"
+            stats_str += f"{data_stats.sends},"
+            stats_str += f"{data_stats.escapes},"
+            stats_str += f"{data_stats.write_errors},"
+            stats_str += f"{round(data_stats.last_send_bps)}"
+            return (True, f"+CIPSTATS: {stats_str}\r\nOK")
+        except Exception as exception:
+            syslog(LOG_ERR, f"Error getting connection statistics: {str(exception)}")
+            return (True, "ERROR")
+
+    @staticmethod
+    def parse_params(params: str) -> Tuple[bool, dict]:
+        valid = True
+        params_dict = {}
+        params_list = params.split(",")
+        valid &= len(params_list) in CIPStatsCommand.VALID_NUM_PARAMS
+        for param in params_list:
+            valid &= param != ""
+        if not valid:
+            return (False, {})
+        try:
+            params_dict["connection_id"] = int(params_list[0])
+        except ValueError:
+            valid = False
+        return (valid, params_dict)
+
+    @staticmethod
+    def usage() -> str:
+        return "AT+CIPSTATS=<connection_id>"
+
+    @staticmethod
+    def signature() -> str:
+        return CIPStatsCommand.SIGNATURE
+
+    @staticmethod
+    def name() -> str:
+        return CIPStatsCommand.NAME
@@ -72,13 +72,13 @@ class FilesExportCommand(Command):
                     params_dict["password"]
                 )
             elif filetype == Types.FILE_TYPE_DEBUG:
-                success, message, path = FilesService().export_debug()
+                success, message, path = await FilesService().export_debug()
             elif filetype == Types.FILE_TYPE_LOGS:
-                success, message, path = FilesService().export_logs(
+                success, message, path = await FilesService().export_logs(
                     params_dict["password"]
                 )
             else:
-                success, message, path = FilesService().export_connections(
+                success, message, path = await FilesService().export_connections(
                     params_dict["password"]
                 )
             if success:
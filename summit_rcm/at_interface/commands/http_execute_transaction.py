@@ -29,14 +29,13 @@ class HTTPExecuteTransaction(Command):
             syslog(LOG_ERR, "Invalid Parameters")
             return (True, "ERROR")
         try:
-            return_str, length = HTTPService().execute_http_transaction(
-                params_dict["length"]
-            )
+            length = await HTTPService().execute_http_transaction(params_dict["length"])
             if length == -1:
                 syslog(LOG_ERR, "Escaping Data Mode")
                 fsm.ATInterfaceFSM().at_output("\r\n", False, False)
                 return (True, "")
-            return (True, f"+HTTPEXE: {return_str}\r\nOK")
+            # The response was already streamed to the serial port
+            return (True, "OK")
         except InProgressException:
             return (False, "")
         except Exception as exception:
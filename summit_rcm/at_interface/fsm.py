@@ -7,7 +7,6 @@ AT interface's finite state machine module
 """
 import importlib
 import pkgutil
-from syslog import syslog, LOG_ERR
 from typing import Callable, List, Optional, Tuple
 from asyncio import Transport, Protocol
 from threading import Lock
@@ -23,6 +22,7 @@ from summit_rcm.at_interface.commands.cip_start_command import CIPStartCommand
 from summit_rcm.at_interface.commands.cip_send_command import CIPSendCommand
 from summit_rcm.at_interface.commands.cip_close_command import CIPCloseCommand
 from summit_rcm.at_interface.commands.cip_configure_ssl_command import CIPConfigureSSL
+from summit_rcm.at_interface.commands.cip_stats_command import CIPStatsCommand
 from summit_rcm.at_interface.commands.ping_command import PingCommand
 from summit_rcm.at_interface.commands.connection_list_command import (
     ConnectionListCommand,
@@ -102,6 +102,7 @@ AT_COMMANDS: List[Command] = [
     CIPCloseCommand,
     CIPSendCommand,
     CIPConfigureSSL,
+    CIPStatsCommand,
     CommunicationCheckCommand,
     EmptyCommand,
     VersionCommand,
@@ -224,30 +225,24 @@ class ATInterfaceFSM(metaclass=Singleton):
         if self._transport:
             self._transport.close()
 
-    async def on_input_received(self, message: bytes | str):
-        if isinstance(message, str):
-            message = bytes(message)
-        if self.state == "idle" or self.state == "analyze_input":
-            try:
-                message = message.decode("utf-8")
-                length = len(self.command_buffer)
-                self.command_buffer += message
-                while "\x7f" in self.command_buffer:
-                    if length > 1:
-                        backspace_index = self.command_buffer.find("\x7f")
-                        temp_buf = self.command_buffer[: backspace_index - 1]
-                        if backspace_index != (length - 1):
-                            temp_buf += self.command_buffer[backspace_index + 1 :]
-                        self.command_buffer = temp_buf
-                    else:
-                        self.command_buffer = ""
-                self.echo(message)
-            except UnicodeDecodeError as exception:
-                syslog(LOG_ERR, f"Invalid Character Received: {str(exception)}")
-        elif self.state == "process_command":
-            self.log_debug("Rx: " + str(message) + " ")
-            for listener in self._listeners:
-                listener(message)
+    @property
+    def raw_input_mode(self) -> bool:
+        """
+        Whether a command is being processed, in which case input is passed to the registered
+        listeners as-is rather than being treated as a command line
+        """
+        return self.state == "process_command"
+
+    async def on_line_received(self, line: str):
+        """Handle a complete command line (without its trailing carriage return)"""
+        self.command_buffer = line + "\r"
+        await self.input_received()
+
+    async def on_raw_input_received(self, message: bytes):
+        """Handle input received while a command is being processed"""
+        self.log_debug("Rx: " + str(message) + " ")
+        for listener in self._listeners:
+            listener(message)
         await self.input_received()
 
     async def on_enter_idle(self):
@@ -0,0 +1,129 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+AT interface's line discipline module
+"""
+
+import asyncio
+import codecs
+from syslog import LOG_ERR, syslog
+from typing import Optional
+
+BACKSPACE = 0x7F
+CARRIAGE_RETURN = 0x0D
+
+INPUT_QUEUE_HIGH_WATER = 64
+"""Number of queued serial chunks at which reading from the serial port is paused"""
+
+INPUT_QUEUE_LOW_WATER = 16
+"""Number of queued serial chunks at which reading from the serial port is resumed"""
+
+
+class ATLineDiscipline:
+    """
+    Line discipline that sits between the serial port and the AT interface state machine.
+
+    Serial data is queued as it arrives and handled in order by a single consumer task. While the
+    state machine is waiting for a command line, incoming bytes are edited into a line buffer
+    (with backspace support) and only complete, carriage-return-terminated lines are handed to the
+    state machine. While a command is being processed (e.g., while receiving the payload of
+    AT+CIPSEND), the bytes are passed through untouched. If the serial transport supports it,
+    reading is paused while too much input is queued so that RTS/CTS flow control pushes back on
+    the host.
+    """
+
+    def __init__(self, state_machine, transport: Optional[asyncio.Transport] = None):
+        self._state_machine = state_machine
+        self._transport = transport
+        self._line = bytearray()
+        self._echo_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._queue: "asyncio.Queue[bytes]" = asyncio.Queue()
+        self._reading_paused = False
+        self._consumer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the consumer task"""
+        if self._consumer is None:
+            self._consumer = asyncio.ensure_future(self._consume())
+
+    def stop(self) -> None:
+        """Stop the consumer task, dropping any queued input"""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+
+    def feed(self, data: bytes) -> None:
+        """Queue data received from the serial port"""
+        self._queue.put_nowait(bytes(data))
+        if (
+            not self._reading_paused
+            and self._transport is not None
+            and self._queue.qsize() >= INPUT_QUEUE_HIGH_WATER
+        ):
+            try:
+                self._transport.pause_reading()
+                self._reading_paused = True
+            except (AttributeError, NotImplementedError):
+                pass
+
+    async def _consume(self) -> None:
+        while True:
+            data = await self._queue.get()
+            if self._reading_paused and self._queue.qsize() <= INPUT_QUEUE_LOW_WATER:
+                self._reading_paused = False
+                self._transport.resume_reading()
+
+            try:
+                await self.process(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                syslog(LOG_ERR, f"Error processing AT input: {str(exception)}")
+
+    def _backspace(self) -> None:
+        """Remove the last character, including every byte of a multi-byte UTF-8 character"""
+        while self._line and (self._line[-1] & 0xC0) == 0x80:
+            del self._line[-1]
+        if self._line:
+            del self._line[-1]
+
+    def _edit(self, data: bytes) -> None:
+        """Add the given bytes (which contain no carriage return) to the line being edited"""
+        if BACKSPACE not in data:
+            self._line += data
+            return
+
+        parts = data.split(bytes([BACKSPACE]))
+        self._line += parts[0]
+        for part in parts[1:]:
+            self._backspace()
+            self._line += part
+
+    async def process(self, data: bytes) -> None:
+        """Edit the given data into lines or pass it through, based on the state machine's state"""
+        position = 0
+        while position < len(data):
+            if self._state_machine.raw_input_mode:
+                await self._state_machine.on_raw_input_received(data[position:])
+                return
+
+            end = data.find(bytes([CARRIAGE_RETURN]), position)
+            segment = data[position:] if end < 0 else data[position : end + 1]
+            position += len(segment)
+            self._state_machine.echo(self._echo_decoder.decode(segment))
+
+            if end < 0:
+                self._edit(segment)
+                return
+
+            self._edit(segment[:-1])
+            line = bytes(self._line)
+            self._line.clear()
+            try:
+                decoded_line = line.decode("utf-8")
+            except UnicodeDecodeError as exception:
+                syslog(LOG_ERR, f"Invalid Character Received: {str(exception)}")
+                continue
+            await self._state_machine.on_line_received(decoded_line)
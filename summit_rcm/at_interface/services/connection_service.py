@@ -7,10 +7,13 @@ Module to handle IP Connections
 """
 import asyncio
 from syslog import syslog, LOG_ERR
-import time
 from typing import List, Optional, Tuple
 import ssl as SSL
-from summit_rcm.at_interface.services.dialer_service import Dialer
+from summit_rcm.at_interface.services.data_mode import (
+    DataModeStats,
+    DataModeTransmitter,
+)
+from summit_rcm.at_interface.services.dialer_service import Dialer, DialerStats
 
 from summit_rcm.utils import Singleton
 import summit_rcm.at_interface.fsm as fsm
@@ -29,7 +32,6 @@ class Connection:
     keepalive: int
     connected: bool
     dialer: Dialer
-    data_buffer: bytes
     listener_id: int
     busy: bool
 
@@ -42,7 +44,6 @@ class Connection:
         keepalive: int,
         connected: bool,
         dialer: Dialer,
-        data_buffer: bytes,
         listener_id: int,
         busy: bool,
         ssl_context: SSL.SSLContext = None,
@@ -54,10 +55,13 @@ class Connection:
         self.keepalive = keepalive
         self.connected = connected
         self.dialer = dialer
-        self.data_buffer = data_buffer
         self.listener_id = listener_id
         self.busy = busy
         self.ssl_context = ssl_context
+        self.stats = DataModeStats()
+        self.transmitter = DataModeTransmitter(
+            ConnectionService.escape_delay, self.stats
+        )
 
     def on_connection_made(self):
         fsm.ATInterfaceFSM().at_output(
@@ -65,12 +69,14 @@ class Connection:
         )
 
     def on_data_received(self, data: bytes):
+        self.stats.rx_bytes += len(data)
         fsm.ATInterfaceFSM().at_output(
             f"+IPD: {self.id},{len(data)},".encode("utf-8") + data,
             print_leading_line_break=False,
         )
 
     def on_datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self.stats.rx_bytes += len(data)
         fsm.ATInterfaceFSM().at_output(
             f"+IPD: {self.id},{len(data)},'{addr[0]}',{addr[1]},".encode("utf-8")
             + data,
@@ -92,9 +98,6 @@ class ConnectionService(object, metaclass=Singleton):
 
     MAX_CONNECTIONS: int = 6
     escape_delay: float = 0.02
-    escape_count: int = 0
-    escape: bool = False
-    rx_timestamp: float = 0.0
 
     def __init__(self) -> None:
         # Pre-populate connection list
@@ -108,7 +111,6 @@ class ConnectionService(object, metaclass=Singleton):
                 connected=False,
                 keepalive=0,
                 dialer=Dialer(asyncio.get_event_loop()),
-                data_buffer=bytes("", "utf-8"),
                 listener_id=-1,
                 busy=False,
                 ssl_context=None,
@@ -186,7 +188,6 @@ class ConnectionService(object, metaclass=Singleton):
         self.connections[id].port = 0
         self.connections[id].type = ""
         self.connections[id].keepalive = 0
-        self.connections[id].data_buffer = b""
         self.connections[id].listener_id = -1
         self.connections[id].busy = False
         self.connections[id].ssl_context = None
@@ -194,7 +195,13 @@ class ConnectionService(object, metaclass=Singleton):
 
     def send_data(self, id: int, length: int) -> Tuple[bool, int]:
         """
-        Send data to an existing IP connection and return success/failure
+        Send data to an existing IP connection and return success/failure. Data mode input is
+        streamed to the socket as it arrives until length bytes have been sent or the '+++'
+        escape sequence is received. For UDP connections, the bytes are collected and sent as a
+        single datagram once all have arrived.
+
+        Return value is a tuple in the form (done, sent), where sent is -1 if the escape sequence
+        was received
         """
         if id < 0 or id > self.MAX_CONNECTIONS - 1:
             # Invalid index
@@ -207,52 +214,50 @@ class ConnectionService(object, metaclass=Singleton):
             # Not connected
             return (True, 0)
 
-        if self.escape:
-            self.escape = False
-            connection.busy = False
-            connection.data_buffer = b""
-            state_machine.deregister_listener(connection.listener_id)
-            return (True, -1)
-
-        if len(connection.data_buffer) >= length:
-            connection.data_buffer = connection.data_buffer[:length]
-            state_machine.deregister_listener(connection.listener_id)
-
-            try:
-                connection.dialer.write(connection.data_buffer)
-            except Exception:
-                connection.busy = False
-                return (True, 0)
-            connection.busy = False
-            connection.data_buffer = b""
-            return (True, length)
-
-        def data_received(data: bytes):
-            nonlocal connection
-            connection.data_buffer += data
-            decoded_buffer = connection.data_buffer.decode("utf-8")
-            dec_length = len(decoded_buffer)
-            less_than_delay = (
-                True
-                if (time.time() - self.rx_timestamp) <= self.escape_delay
-                else False
-            )
-            if not (dec_length > 0 and decoded_buffer[-1] == "+"):
-                self.escape_count = 0
-            elif less_than_delay and self.escape_count != 0:
-                self.escape_count += 1
-                if self.escape_count == 3:
-                    self.escape_count = 0
-                    self.escape = True
-            elif not less_than_delay:
-                self.escape_count = 1
-            self.rx_timestamp = time.time()
-
         if not connection.busy:
             connection.busy = True
-            connection.listener_id = state_machine.register_listener(data_received)
+            connection.transmitter.begin(
+                length, connection.dialer.write, datagram=connection.type == "udp"
+            )
+            connection.listener_id = state_machine.register_listener(
+                connection.transmitter.on_data
+            )
+
+        if connection.transmitter.escape:
+            sent = -1
+        elif connection.transmitter.error:
+            sent = 0
+        elif connection.transmitter.complete:
+            sent = length
+        else:
+            return (False, 0)
+
+        state_machine.deregister_listener(connection.listener_id)
+        connection.busy = False
+        connection.transmitter.end(sent)
+        return (True, sent)
+
+    def get_data_mode_stats(self, id: int) -> Optional[DataModeStats]:
+        """
+        Returns the data mode throughput statistics of the target connection or None if the
+        given id is invalid.
+        """
+        if id < 0 or id > self.MAX_CONNECTIONS - 1:
+            # Invalid index
+            return None
+
+        return self.connections[id].stats
+
+    def get_connect_stats(self, id: int) -> Optional[DialerStats]:
+        """
+        Returns the connection establishment statistics of the target connection or None if the
+        given id is invalid.
+        """
+        if id < 0 or id > self.MAX_CONNECTIONS - 1:
+            # Invalid index
+            return None
 
-        return (False, 0)
+        return self.connections[id].dialer.stats
 
     def is_connection_busy(self, id: int) -> Optional[bool]:
         """
@@ -0,0 +1,160 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to stream AT interface data mode input
+"""
+
+from syslog import LOG_ERR, syslog
+import time
+from typing import Callable, Optional
+
+ESCAPE_CHARACTER = b"+"
+ESCAPE_SEQUENCE_LENGTH = 3
+
+
+class DataModeStats:
+    """Data mode throughput statistics"""
+
+    def __init__(self):
+        self.tx_bytes: int = 0
+        self.rx_bytes: int = 0
+        self.tx_chunks: int = 0
+        self.sends: int = 0
+        self.escapes: int = 0
+        self.write_errors: int = 0
+        self.last_send_bytes: int = 0
+        self.last_send_ms: float = 0.0
+
+    @property
+    def last_send_bps(self) -> float:
+        """Throughput of the last completed send, from the data prompt to the last byte"""
+        if not self.last_send_ms:
+            return 0.0
+        return self.last_send_bytes * 1000 / self.last_send_ms
+
+
+class DataModeTransmitter:
+    """
+    Streams data mode input to a writer (e.g., a socket) as it arrives, until the expected number
+    of bytes has been written or the '+++' escape sequence is received. The data is never
+    decoded, so binary payloads are written untouched. Only '+' bytes that could still form the
+    escape sequence are buffered: a run of '+' bytes that starts after the guard time and
+    continues within it. Every other byte is written right away, unless the writer is
+    datagram-based, in which case the whole payload is collected and written as one datagram
+    once complete.
+    """
+
+    def __init__(self, guard_time: float, stats: Optional[DataModeStats] = None):
+        self.guard_time = guard_time
+        self.stats = stats if stats is not None else DataModeStats()
+        self.buffer = bytearray()
+        self.payload = bytearray()
+        self.datagram: bool = False
+        self.remaining: int = 0
+        self.error: bool = False
+        self.escape: bool = False
+        self.started: float = 0.0
+        self.rx_timestamp: float = 0.0
+        self._write: Optional[Callable] = None
+
+    @property
+    def complete(self) -> bool:
+        """Determine whether or not every expected byte has been written"""
+        return self.remaining <= 0 and not self.error and not self.escape
+
+    def begin(self, length: int, write: Callable, datagram: bool = False) -> None:
+        """
+        Start streaming the next length bytes of data mode input to the given writer. If the
+        writer is datagram-based, the bytes are written in a single call once all have arrived.
+        """
+        self.buffer.clear()
+        self.payload.clear()
+        self.datagram = datagram
+        self.remaining = length
+        self.error = False
+        self.escape = False
+        self._write = write
+        self.started = time.monotonic()
+        # The guard time before an escape sequence counts from the data prompt
+        self.rx_timestamp = self.started
+
+    def end(self, sent: int) -> None:
+        """Finish the current transfer, recording its throughput if it completed"""
+        self.buffer.clear()
+        self.payload.clear()
+        self.remaining = 0
+        self._write = None
+        if sent > 0:
+            self.stats.sends += 1
+            self.stats.last_send_bytes = sent
+            self.stats.last_send_ms = (time.monotonic() - self.started) * 1000
+        elif sent < 0:
+            self.stats.escapes += 1
+
+    def transmit(self, data) -> None:
+        """Write as much of the given data as the current transfer still expects"""
+        if self.error or self.remaining <= 0 or not data or self._write is None:
+            return
+
+        chunk = data[: self.remaining]
+        if self.datagram:
+            # Splitting the payload would split the datagram, so send it in one piece
+            self.payload += chunk
+            self.remaining -= len(chunk)
+            if self.remaining <= 0:
+                self._send(bytes(self.payload))
+                self.payload.clear()
+            return
+
+        if self._send(chunk):
+            self.remaining -= len(chunk)
+
+    def _send(self, chunk) -> bool:
+        """Write the given chunk, recording the outcome"""
+        try:
+            self._write(chunk)
+        except Exception as exception:
+            self.error = True
+            self.stats.write_errors += 1
+            syslog(LOG_ERR, f"Error sending data: {str(exception)}")
+            return False
+        self.stats.tx_bytes += len(chunk)
+        self.stats.tx_chunks += 1
+        return True
+
+    def flush_escape_candidate(self) -> None:
+        """Write the '+' bytes held back as a possible escape sequence as regular data"""
+        if self.buffer:
+            self.transmit(bytes(self.buffer))
+            self.buffer.clear()
+
+    def on_data(self, data: bytes) -> None:
+        """Handle data mode input received from the serial port"""
+        if self.escape or not data:
+            return
+
+        now = time.monotonic()
+        guard_elapsed = (now - self.rx_timestamp) > self.guard_time
+        self.rx_timestamp = now
+        all_escape = data.count(ESCAPE_CHARACTER) == len(data)
+
+        if self.buffer and (guard_elapsed or not all_escape):
+            # The held back '+' bytes weren't followed by the rest of an escape sequence in time
+            self.flush_escape_candidate()
+
+        if all_escape and (self.buffer or guard_elapsed):
+            self.buffer += data
+            if (
+                len(self.buffer) > ESCAPE_SEQUENCE_LENGTH
+                or len(self.buffer) >= self.remaining
+            ):
+                # Too many '+' bytes for an escape sequence, or they complete the payload
+                self.flush_escape_candidate()
+            elif len(self.buffer) == ESCAPE_SEQUENCE_LENGTH:
+                self.buffer.clear()
+                self.escape = True
+            return
+
+        self.transmit(memoryview(data))
@@ -9,11 +9,18 @@ import asyncio
 import asyncio.transports
 import socket
 import ssl
-from typing import Tuple
+import time
+from typing import List, Tuple
 from syslog import syslog, LOG_ERR
 
 from typing import Optional
 
+CONNECT_TIMEOUT_S = 10
+"""Maximum time to resolve a host and establish a TCP connection"""
+
+HAPPY_EYEBALLS_DELAY_S = 0.25
+"""Delay before racing the next address while an earlier connection attempt is still pending"""
+
 
 class StreamingProtocol(asyncio.Protocol):
     """Transport Protocol for a TCP or SSL socket"""
@@ -57,6 +64,24 @@ class UserDatagramProtocol(asyncio.DatagramProtocol):
             self.dialer.on_connection_lost()
 
 
+class DialerStats:
+    """Connection establishment statistics for a dialer"""
+    def __init__(self):
+        self.connects: int = 0
+        self.failures: int = 0
+        self.last_dns_ms: float = 0.0
+        self.last_connect_ms: float = 0.0
+        self.last_handshake_ms: float = 0.0
+        self.total_connect_ms: float = 0.0
+        self.last_address: str = ""
+        self.last_family: str = ""
+
+    @property
+    def avg_connect_ms(self) -> float:
+        """Average time to establish a TCP connection, excluding name resolution"""
+        return self.total_connect_ms / self.connects if self.connects else 0.0
+
+
 class Dialer:
     """Dialer class to handle creation of transports and protocols for AT Interface Sockets"""
     def __init__(self, loop):
@@ -66,26 +91,113 @@ class Dialer:
         self.on_data_received = None
         self.on_datagram_received = None
         self.on_connection_lost = None
+        self.stats = DialerStats()
 
     async def dial(self, number: str, keepalive: int, type: str, context: ssl.SSLContext):
         """Create Socket"""
-        (host, port) = number.split(":")
+        (host, port) = split_host_port(number)
         if type == "udp":
             c = self.loop.create_datagram_endpoint(
                 lambda: create_protocol(self, type), remote_addr=(host, port)
             )
             self.loop.create_task(c)
             return (None, "", "")
-        socks = setup_socket(host, port, keepalive)
-        c = self.loop.create_connection(
-            lambda: create_protocol(self, type),
-            server_hostname=host if type == "ssl" else None,
-            sock=socks,
-            ssl=context if type == "ssl" else None,
-        )
-        await self.loop.create_task(c)
+
+        try:
+            socks = await asyncio.wait_for(
+                self.connect_socket(host, port), CONNECT_TIMEOUT_S
+            )
+            if keepalive != 0:
+                setup_keepalive(socks, keepalive)
+
+            start = time.monotonic()
+            c = self.loop.create_connection(
+                lambda: create_protocol(self, type),
+                server_hostname=host if type == "ssl" else None,
+                sock=socks,
+                ssl=context if type == "ssl" else None,
+            )
+            await self.loop.create_task(c)
+            self.stats.last_handshake_ms = (
+                (time.monotonic() - start) * 1000 if type == "ssl" else 0.0
+            )
+        except BaseException:
+            self.stats.failures += 1
+            raise
         return (None, "", "")
 
+    async def connect_socket(self, host: str, port: int) -> socket.socket:
+        """
+        Resolve the given host without blocking the event loop and connect to it, racing its
+        IPv6 and IPv4 addresses (RFC 8305 'Happy Eyeballs')
+        """
+        start = time.monotonic()
+        addr_infos = interleave_addr_infos(
+            await self.loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        )
+        self.stats.last_dns_ms = (time.monotonic() - start) * 1000
+        if not addr_infos:
+            raise OSError(f"Could not resolve {host}")
+
+        start = time.monotonic()
+        errors: List[str] = []
+        pending = set()
+        winner = None
+        remaining = list(addr_infos)
+        try:
+            while winner is None and (remaining or pending):
+                if remaining:
+                    pending.add(
+                        self.loop.create_task(self.connect_addr_info(remaining.pop(0)))
+                    )
+
+                # Start the next attempt once the delay expires or an attempt fails, whichever
+                # comes first
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=HAPPY_EYEBALLS_DELAY_S if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(str(task.exception()))
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        task.result().close()
+        finally:
+            # Abandon the attempts that lost the race (or all of them, if cancelled)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in pending:
+                if not task.cancelled() and task.exception() is None:
+                    task.result().close()
+
+        if winner is None:
+            raise OSError(f"Could not connect to {host}: {'; '.join(errors)}")
+
+        self.stats.connects += 1
+        self.stats.last_connect_ms = (time.monotonic() - start) * 1000
+        self.stats.total_connect_ms += self.stats.last_connect_ms
+        peer = winner.getpeername()
+        self.stats.last_address = f"{peer[0]}:{peer[1]}"
+        self.stats.last_family = "ipv6" if winner.family == socket.AF_INET6 else "ipv4"
+        return winner
+
+    async def connect_addr_info(self, addr_info) -> socket.socket:
+        """Connect a non-blocking socket to the given getaddrinfo() result"""
+        (family, sock_type, proto, _, address) = addr_info
+        sock = socket.socket(family, sock_type, proto)
+        try:
+            sock.setblocking(False)
+            await self.loop.sock_connect(sock, address)
+            return sock
+        except BaseException:
+            sock.close()
+            raise
+
     def hangup(self):
         """Hangup socket"""
         if self.protocol and self.protocol.transport:
@@ -109,15 +221,26 @@ def create_protocol(dialer, type: str) -> asyncio.BaseProtocol | None:
         return None
 
 
-def setup_socket(host: str, port: str, keepalive: int) -> socket:
-    """Set up Socket"""
-    socks = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    socks.settimeout(10)
-    socks.connect((host, int(port)))
-    socks.settimeout(None)
-    if keepalive != 0:
-        setup_keepalive(socks, keepalive)
-    return socks
+def split_host_port(number: str) -> Tuple[str, int]:
+    """Split 'host:port' into its host and port, accepting bracketed IPv6 addresses"""
+    (host, port) = number.rsplit(":", 1)
+    return (host.strip("[]"), int(port))
+
+
+def interleave_addr_infos(addr_infos: list) -> list:
+    """
+    Order getaddrinfo() results so that address families alternate, starting with the family of
+    the first (preferred) result
+    """
+    families = {}
+    for addr_info in addr_infos:
+        families.setdefault(addr_info[0], []).append(addr_info)
+    ordered = []
+    while any(families.values()):
+        for family_addr_infos in families.values():
+            if family_addr_infos:
+                ordered.append(family_addr_infos.pop(0))
+    return ordered
 
 
 def setup_keepalive(sock: socket, keepalive: int):
@@ -0,0 +1,285 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to perform HTTP/1.1 transactions over pooled, keep-alive asyncio connections
+"""
+
+import asyncio
+import http.client
+import io
+import ssl as SSL
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+HTTP_POOL_MAX_IDLE_PER_HOST = 2
+"""Maximum number of idle connections kept open per (host, port, TLS context)"""
+
+HTTP_POOL_IDLE_TIMEOUT_S = 30
+"""Time after which an idle pooled connection is closed instead of being reused"""
+
+HTTP_READ_CHUNK_SIZE = 1024
+"""Maximum size of each response body chunk read from the socket"""
+
+HTTP_MAX_HEADER_SIZE = 64 * 1024
+"""Maximum size of the response status line and headers"""
+
+PoolKey = Tuple[str, int, Optional[SSL.SSLContext]]
+
+
+class HTTPResponseHead:
+    """Status line and headers of an HTTP response"""
+
+    def __init__(
+        self, version: str, status: int, reason: str, headers: http.client.HTTPMessage
+    ) -> None:
+        self.version = version
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+    @property
+    def chunked(self) -> bool:
+        """Determine whether or not the body uses the chunked transfer coding"""
+        return "chunked" in self.headers.get("Transfer-Encoding", "").lower()
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Retrieve the length of the body, if given"""
+        try:
+            return int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+
+    @property
+    def keep_alive(self) -> bool:
+        """Determine whether or not the server allows the connection to be reused"""
+        connection = [
+            token.strip().lower()
+            for token in self.headers.get("Connection", "").split(",")
+        ]
+        if "close" in connection:
+            return False
+        return self.version == "HTTP/1.1" or "keep-alive" in connection
+
+    def has_body(self, method: str) -> bool:
+        """Determine whether or not a body follows the headers"""
+        return not (
+            method == "HEAD" or 100 <= self.status < 200 or self.status in (204, 304)
+        )
+
+
+class HTTPClientConnection:
+    """An HTTP/1.1 connection to a server, which may be reused for further requests"""
+
+    def __init__(
+        self, key: PoolKey, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+        self.idle_since = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        """Determine whether or not the connection is still open in both directions"""
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        """Close the connection"""
+        if not self.writer.is_closing():
+            self.writer.close()
+
+    def send_head(
+        self, method: str, url: str, headers: Dict[str, str], content_length: int
+    ) -> None:
+        """Write the request line and headers"""
+        (host, port, ssl_context) = self.key
+        request_headers = {key.lower(): (key, value) for key, value in headers.items()}
+        default_port = 443 if ssl_context is not None else 80
+        request_headers.setdefault(
+            "host", ("Host", host if port == default_port else f"{host}:{port}")
+        )
+        request_headers.setdefault("accept-encoding", ("Accept-Encoding", "identity"))
+        request_headers["content-length"] = ("Content-Length", str(content_length))
+
+        head = f"{method} {url or '/'} HTTP/1.1\r\n"
+        for key, value in request_headers.values():
+            head += f"{key}: {value}\r\n"
+        self.writer.write((head + "\r\n").encode("latin-1"))
+
+    def write(self, data) -> None:
+        """Write part of the request body"""
+        self.writer.write(data)
+
+    async def drain(self) -> None:
+        """Wait until the request written so far has been handed to the socket"""
+        await self.writer.drain()
+
+    async def read_response_head(self) -> HTTPResponseHead:
+        """Read the status line and headers of the response, skipping interim responses"""
+        while True:
+            try:
+                raw = await self.reader.readuntil(b"\r\n\r\n")
+            except asyncio.LimitOverrunError as exception:
+                raise http.client.LineTooLong("response headers") from exception
+            except asyncio.IncompleteReadError as exception:
+                raise http.client.RemoteDisconnected(
+                    "Remote end closed connection without response"
+                ) from exception
+
+            (status_line, _, header_block) = raw.partition(b"\r\n")
+            try:
+                (version, status, reason) = (
+                    status_line.decode("latin-1").split(" ", 2) + [""]
+                )[:3]
+                status = int(status)
+            except ValueError as exception:
+                raise http.client.BadStatusLine(
+                    status_line.decode("latin-1")
+                ) from exception
+            if not version.startswith("HTTP/"):
+                raise http.client.BadStatusLine(status_line.decode("latin-1"))
+
+            head = HTTPResponseHead(
+                version,
+                status,
+                reason.strip(),
+                http.client.parse_headers(io.BytesIO(header_block)),
+            )
+            if head.status != 100 and not (101 < head.status < 200):
+                return head
+
+    async def iter_body(
+        self, head: HTTPResponseHead, method: str
+    ) -> AsyncIterator[bytes]:
+        """Read the response body in chunks as it arrives"""
+        if not head.has_body(method):
+            return
+
+        if head.chunked:
+            while True:
+                size_line = await self.reader.readuntil(b"\r\n")
+                try:
+                    size = int(size_line.split(b";", 1)[0].strip(), 16)
+                except ValueError as exception:
+                    raise http.client.IncompleteRead(b"") from exception
+                if size == 0:
+                    break
+                async for chunk in self._iter_exactly(size):
+                    yield chunk
+                await self.reader.readexactly(2)
+
+            # Discard any trailers
+            while (await self.reader.readuntil(b"\r\n")) != b"\r\n":
+                pass
+            return
+
+        length = head.content_length
+        if length is not None:
+            async for chunk in self._iter_exactly(length):
+                yield chunk
+            return
+
+        # The body ends when the server closes the connection
+        while True:
+            chunk = await self.reader.read(HTTP_READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def _iter_exactly(self, length: int) -> AsyncIterator[bytes]:
+        while length > 0:
+            chunk = await self.reader.read(min(length, HTTP_READ_CHUNK_SIZE))
+            if not chunk:
+                raise http.client.IncompleteRead(b"", length)
+            length -= len(chunk)
+            yield chunk
+
+
+class HTTPConnectionPool:
+    """
+    Pool of idle keep-alive HTTP connections, keyed by (host, port, TLS context). Connections are
+    handed out one transaction at a time and only returned to the pool when the response was read
+    completely and the server allows the connection to be reused.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_host: int = HTTP_POOL_MAX_IDLE_PER_HOST,
+        idle_timeout: float = HTTP_POOL_IDLE_TIMEOUT_S,
+    ) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[PoolKey, List[HTTPClientConnection]] = {}
+        self.connects: int = 0
+        self.reuses: int = 0
+
+    def _prune(self) -> None:
+        """Close the idle connections that timed out or were closed by the server"""
+        now = time.monotonic()
+        for key in list(self._idle):
+            connections = []
+            for connection in self._idle[key]:
+                if connection.alive and now - connection.idle_since < self.idle_timeout:
+                    connections.append(connection)
+                else:
+                    connection.close()
+            if connections:
+                self._idle[key] = connections
+            else:
+                del self._idle[key]
+
+    async def acquire(
+        self,
+        host: str,
+        port: int,
+        ssl_context: Optional[SSL.SSLContext],
+        timeout: float,
+        reuse: bool = True,
+    ) -> HTTPClientConnection:
+        """Retrieve an idle connection to the given server or open a new one"""
+        key: PoolKey = (host, port, ssl_context)
+        self._prune()
+        idle = self._idle.get(key, [])
+        if reuse and idle:
+            connection = idle.pop()
+            if not idle:
+                del self._idle[key]
+            connection.reused = True
+            self.reuses += 1
+            return connection
+
+        (reader, writer) = await asyncio.wait_for(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=ssl_context,
+                server_hostname=host if ssl_context is not None else None,
+                limit=HTTP_MAX_HEADER_SIZE,
+            ),
+            timeout,
+        )
+        self.connects += 1
+        return HTTPClientConnection(key, reader, writer)
+
+    def release(self, connection: HTTPClientConnection, reusable: bool) -> None:
+        """Return the given connection to the pool, or close it if it can't be reused"""
+        idle = self._idle.setdefault(connection.key, [])
+        if not reusable or not connection.alive or len(idle) >= self.max_idle_per_host:
+            connection.close()
+            if not idle:
+                del self._idle[connection.key]
+            return
+
+        connection.idle_since = time.monotonic()
+        idle.append(connection)
+
+    def close_all(self) -> None:
+        """Close every idle connection"""
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
@@ -6,25 +6,29 @@
 Service file to handle all HTTP configurations and executions
 """
 
-import http.client
-import time
-from typing import Dict, Tuple
+import asyncio
+from typing import Dict, Optional
 import ssl as SSL
 from summit_rcm.utils import Singleton
 from summit_rcm.utils import InProgressException
 import summit_rcm.at_interface.fsm as fsm
+from summit_rcm.at_interface.services.data_mode import DataModeTransmitter
+from summit_rcm.at_interface.services.http_client import (
+    HTTPClientConnection,
+    HTTPConnectionPool,
+    HTTPResponseHead,
+)
 from summit_rcm.definition import SSLModes
 
 
 class HTTPService(object, metaclass=Singleton):
     """
-    Service to handle HTTP configuration and executions
+    Service to handle HTTP configuration and executions. Transactions are performed over a pool
+    of keep-alive connections, with the request body streamed from the serial port to the server
+    and the response body streamed back as it arrives.
     """
 
     escape_delay: float = 0.02
-    escape_count: int = 0
-    escape: bool = False
-    rx_timestamp: float = 0.0
 
     def __init__(
         self,
@@ -32,7 +36,6 @@ class HTTPService(object, metaclass=Singleton):
         port: int = 0,
         method: str = "",
         url: str = "",
-        body: str = "",
         headers: Dict[str, str] = {},
         rspheader: bool = False,
         ssl: SSLModes = SSLModes.DISABLED,
@@ -46,7 +49,6 @@ class HTTPService(object, metaclass=Singleton):
         self.port = port
         self.method = method
         self.url = url
-        self.body = body
         self.headers = headers
         self.rspheader = rspheader
         self.ssl = ssl
@@ -55,6 +57,9 @@ class HTTPService(object, metaclass=Singleton):
         self.ssl_context = ssl_context
         self.listener = listener
         self.timeout = timeout
+        self.pool = HTTPConnectionPool()
+        self.transmitter = DataModeTransmitter(self.escape_delay)
+        self._connection: Optional[HTTPClientConnection] = None
 
     def clear_http_configuration(self):
         """
@@ -64,7 +69,6 @@ class HTTPService(object, metaclass=Singleton):
         self.port = 0
         self.method = ""
         self.url = ""
-        self.body = ""
         self.headers = {}
         self.rspheader = False
         self.ssl = SSLModes.DISABLED
@@ -131,68 +135,113 @@ class HTTPService(object, metaclass=Singleton):
             self.ssl_context = None
             raise exception
 
-    def execute_http_transaction(self, length: int) -> Tuple[str, int]:
+    async def _begin_request(self, length: int, reuse: bool = True) -> None:
+        """Retrieve a connection to the configured server and send the request headers"""
+        self._connection = await self.pool.acquire(
+            self.host,
+            self.port,
+            self.ssl_context if self.ssl != SSLModes.DISABLED else None,
+            self.timeout,
+            reuse,
+        )
+        self._connection.send_head(self.method, self.url, self.headers, length)
+
+    async def _read_response_head(self) -> HTTPResponseHead:
+        await asyncio.wait_for(self._connection.drain(), self.timeout)
+        return await asyncio.wait_for(
+            self._connection.read_response_head(), self.timeout
+        )
+
+    async def _stream_response(self, head: HTTPResponseHead) -> None:
         """
-        Establishes an HTTP connection and sends the configures request
-        to the HTTP server and returns the HTTP response. If a length is
-        given, the AT interface will enter serial data mode.
+        Stream the response to the serial port as it arrives and return the connection to the
+        pool if it can be reused
         """
         statemachine = fsm.ATInterfaceFSM()
-        if self.escape:
-            self.escape = False
-            self.body = ""
-            statemachine.deregister_listener(self.listener)
-            self.listener = -1
-            return ("", -1)
-        transaction = (
-            http.client.HTTPConnection(self.host, port=self.port, timeout=self.timeout)
-            if self.ssl == SSLModes.DISABLED
-            else (
-                http.client.HTTPSConnection(
-                    self.host,
-                    port=self.port,
-                    timeout=self.timeout,
-                    context=self.ssl_context,
-                )
+        statemachine.at_output("+HTTPEXE: ", print_trailing_line_break=False)
+        if self.rspheader:
+            statemachine.at_output(
+                ",".join(f"{key}:{value}" for key, value in head.headers.items())
+                + "\r\n",
+                False,
+                False,
             )
+
+        body = self._connection.iter_body(head, self.method)
+        while True:
+            try:
+                chunk = await asyncio.wait_for(body.__anext__(), self.timeout)
+            except StopAsyncIteration:
+                break
+            statemachine.at_output(chunk, False, False)
+
+        self.pool.release(
+            self._connection,
+            head.keep_alive
+            and (
+                head.chunked
+                or head.content_length is not None
+                or not head.has_body(self.method)
+            ),
         )
-        response_str = ""
-        if len(self.body) >= length:
-            self.body = self.body[:length]
-            if self.listener != -1:
-                statemachine.deregister_listener(self.listener)
-                self.listener = -1
-            transaction.request(self.method, self.url, self.body, self.headers)
-            response = transaction.getresponse()
-            self.body = ""
-            if self.rspheader:
-                for header in response.getheaders():
-                    response_str += f"{header[0]}:{header[1]},"
-                response_str += response_str[:-1] + "\r\n"
-            response_str += response.read().decode("utf-8")
-            return (response_str, length)
-
-        def write_http_body(data: bytes):
-            self.body += data.decode("utf-8")
-            body_check = self.body[-3:]
-            body_check_length = len(body_check)
-            less_than_delay = (
-                True
-                if (time.time() - self.rx_timestamp) <= self.escape_delay
-                else False
-            )
-            if not (body_check_length > 0 and body_check[-1] == "+"):
-                self.escape_count = 0
-            elif less_than_delay and self.escape_count != 0:
-                self.escape_count += 1
-                if self.escape_count == 3:
-                    self.escape_count = 0
-                    self.escape = True
-            elif not less_than_delay:
-                self.escape_count = 1
-            self.rx_timestamp = time.time()
-
-        if self.listener == -1:
-            fsm.ATInterfaceFSM().at_output("> ", print_trailing_line_break=False)
-            self.listener = statemachine.register_listener(write_http_body)
+        self._connection = None
+
+    def _end_transaction(self, sent: int) -> None:
+        """Stop receiving the request body and drop the connection, unless it was released"""
+        if self.listener != -1:
+            fsm.ATInterfaceFSM().deregister_listener(self.listener)
+            self.listener = -1
+        self.transmitter.end(sent)
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def execute_http_transaction(self, length: int) -> int:
+        """
+        Sends the configured request to the HTTP server and streams the HTTP response to the
+        serial port. If a length is given, the AT interface will enter serial data mode and the
+        request body is streamed to the server as it is received. Raises InProgressException
+        while the request body is being received.
+
+        Returns the length of the request body sent, or -1 if data mode was escaped
+        """
+        try:
+            if self.listener == -1:
+                await self._begin_request(length)
+                if length > 0:
+                    self.transmitter.begin(length, self._connection.write)
+                    fsm.ATInterfaceFSM().at_output(
+                        "> ", print_trailing_line_break=False
+                    )
+                    self.listener = fsm.ATInterfaceFSM().register_listener(
+                        self.transmitter.on_data
+                    )
+                else:
+                    try:
+                        head = await self._read_response_head()
+                    except ConnectionError:
+                        if not self._connection.reused:
+                            raise
+                        # The server closed the idle connection, so retry on a new one
+                        self._connection.close()
+                        await self._begin_request(length, reuse=False)
+                        head = await self._read_response_head()
+                    await self._stream_response(head)
+                    return length
+            elif self.transmitter.escape:
+                self._end_transaction(-1)
+                return -1
+            elif self.transmitter.error:
+                raise Exception("Error sending request body")
+            elif self.transmitter.complete:
+                head = await self._read_response_head()
+                await self._stream_response(head)
+                self._end_transaction(length)
+                return length
+            else:
+                # Apply backpressure to the serial port while the socket is backed up
+                await asyncio.wait_for(self._connection.drain(), self.timeout)
+        except Exception:
+            self._end_transaction(0)
+            raise
         raise InProgressException()
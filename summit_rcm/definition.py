@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: LicenseRef-Ezurio-Clause
 # Copyright (C) 2024 Ezurio LLC.
 #
+import asyncio
 import os
 from enum import Enum, IntEnum
+from syslog import LOG_INFO, syslog
+import time
 from summit_rcm.services.network_manager_service import (
     NM80211Mode,
     NMActiveConnectionState,
@@ -270,6 +273,29 @@ class JournalctlLogTypesEnum(str, Enum):
     ALL = "All"
 
 
+class JournalLogStreamFormatEnum(str, Enum):
+    """Enumeration of valid journal log streaming formats"""
+
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+class ExportTypeEnum(str, Enum):
+    """Enumeration of valid export job types"""
+
+    LOGS = "logs"
+    DEBUG = "debug"
+    CONNECTIONS = "connections"
+
+
+class ExportJobStateEnum(str, Enum):
+    """Enumeration of export job states"""
+
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
 class SupplicantLogLevelEnum(str, Enum):
     """Enumeration of valid supplicant log levels"""
 
@@ -289,6 +315,14 @@ class DriverLogLevelEnum(int, Enum):
     ENABLED = 1
 
 
+class WifiBandEnum(str, Enum):
+    """Enumeration of valid Wi-Fi bands"""
+
+    BAND_2_4_GHZ = "2.4GHz"
+    BAND_5_GHZ = "5GHz"
+    BAND_6_GHZ = "6GHz"
+
+
 class PowerStateEnum(str, Enum):
     """Enumeration of valid power states"""
 
@@ -298,9 +332,39 @@ class PowerStateEnum(str, Enum):
     REBOOT = "reboot"
 
 
+class RouteWarmupStrategyEnum(str, Enum):
+    """Enumeration of valid strategies for loading routes"""
+
+    LAZY = "lazy"
+    """Load each group of routes when it is first requested"""
+    BACKGROUND = "background"
+    """Load all groups of routes in the background once the server is listening"""
+    EAGER = "eager"
+    """Load all groups of routes before the server starts listening"""
+
+
 class RouteAdd():
     """Class to hold route add information"""
 
-    def __init__(self, route):
+    def __init__(self, route, name: str = ""):
         self.route = route
+        self.name = name or getattr(route, "__name__", "routes")
         self.awaited = False
+
+    async def _timed_load(self, route) -> None:
+        start = time.monotonic()
+        await route
+        syslog(
+            LOG_INFO,
+            f"Loaded routes for {self.name} in "
+            f"{(time.monotonic() - start) * 1000:.1f} ms",
+        )
+
+    async def load(self) -> None:
+        """Add the routes, if not already added, sharing a single attempt between callers"""
+        if self.awaited:
+            return
+        if not isinstance(self.route, asyncio.Future):
+            self.route = asyncio.ensure_future(self._timed_load(self.route))
+        await self.route
+        self.awaited = True
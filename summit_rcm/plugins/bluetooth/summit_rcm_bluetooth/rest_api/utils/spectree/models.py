@@ -29,6 +29,7 @@ class BluetoothCommandEnum(str, Enum):
     BLE_START_DISCOVERY = "bleStartDiscovery"
     BLE_STOP_DISCOVERY = "bleStopDiscovery"
     BLE_ENABLE_WEBSOCKETS = "bleEnableWebsockets"
+    BLE_WEBSOCKET_STATS = "bleWebsocketStats"
     HID_CONNECT = "hidConnect"
     HID_DISCONNECT = "hidDisconnect"
     HID_LIST = "hidList"
@@ -44,6 +45,16 @@ class BluetoothGATTOperationEnum(str, Enum):
     BLE_GATT_READ = "read"
     BLE_GATT_WRITE = "write"
     BLE_GATT_NOTIFY = "notify"
+    BLE_GATT_READ_MANY = "readMany"
+    BLE_GATT_WRITE_MANY = "writeMany"
+
+
+class BluetoothGATTCharacteristicModel(BaseModel):
+    """Model for a characteristic of a batched Bluetooth GATT operation"""
+
+    svcUuid: str = Field(description="Service UUID")
+    chrUuid: str = Field(description="Characteristic UUID")
+    value: Optional[Any] = Field(description="Value (for an operation of writeMany)")
 
 
 class BluetoothDeviceModel(BaseModel):
@@ -71,11 +82,35 @@ class BluetoothDeviceModel(BaseModel):
     ServicesResolved: Optional[int] = Field(description="Services resolved state")
 
 
+class VspConnectionStatsModel(BaseModel):
+    """Model for the throughput and backpressure statistics of a VSP connection"""
+
+    bytesReceived: int = Field(description="Bytes received from the TCP client")
+    bytesSent: int = Field(description="Bytes written to the GATT write characteristic")
+    bytesNotified: int = Field(
+        description="Bytes received from the GATT read characteristic"
+    )
+    writes: int = Field(description="Number of completed GATT writes")
+    writeFailures: int = Field(description="Number of failed GATT writes")
+    inFlight: int = Field(description="Number of GATT writes currently in flight")
+    maxInFlight: int = Field(description="Maximum number of GATT writes in flight")
+    backpressureWaits: int = Field(
+        description="Number of times a chunk waited for the GATT write window to open"
+    )
+    bufferHighWater: int = Field(description="Maximum number of bytes buffered")
+    txThroughput: float = Field(
+        description="Average TCP to GATT throughput since connecting (bytes/s)"
+    )
+
+
 class BluetoothConnectionModel(BaseModel):
     """Model for a Bluetooth connection (HID or GATT)"""
 
     device: str = Field(description="Device address")
     port: int = Field(description="Port")
+    stats: Optional[VspConnectionStatsModel] = Field(
+        description="VSP connection statistics (GATT connections only)"
+    )
 
 
 class BluetoothControllerModel(BaseModel):
@@ -136,6 +171,12 @@ class BluetoothControlRequestModel(BaseModel):
     enable: Optional[bool] = Field(
         description="Enable flag (for bleGatt command with an operation of notify)"
     )
+    characteristics: Optional[List[BluetoothGATTCharacteristicModel]] = Field(
+        description=(
+            "Characteristics (for bleGatt command with an operation of readMany or "
+            "writeMany)"
+        )
+    )
     tcpPort: Optional[int] = Field(description="TCP port (for VSP gattConnect command)")
     vspSvcUuid: Optional[str] = Field(
         description="VSP service UUID (for VSP gattConnect command)"
@@ -152,12 +193,28 @@ class BluetoothControlRequestModel(BaseModel):
     vspWriteChrType: Optional[BLEWriteCharacteristicType] = Field(
         description="VSP write characteristic type (for VSP gattConnect command)"
     )
+    vspWriteWindow: Optional[int] = Field(
+        description="Maximum GATT writes in flight (for VSP gattConnect command)",
+        default=1,
+    )
     socketRxType: Optional[VSPSocketRxTypeEnum] = Field(
         description="Socket Rx type (for VSP gattConnect command)",
         default=VSPSocketRxTypeEnum.BLE_VSP_SOCKET_RX_TYPE_JSON,
     )
 
 
+class BluetoothWebSocketClientModel(BaseModel):
+    """Model for the queue statistics of a BLE WebSocket client"""
+
+    id: str = Field(description="Client ID")
+    queueDepth: int = Field(description="Number of notifications waiting to be sent")
+    queueSize: int = Field(description="Maximum number of queued notifications")
+    sent: int = Field(description="Number of notifications sent")
+    dropped: int = Field(
+        description="Number of notifications dropped because the queue was full"
+    )
+
+
 class BluetoothControlResponseModel(BaseModel):
     """Model for the response to a request to control a Bluetooth controller"""
 
@@ -182,6 +239,10 @@ class BluetoothControlResponseModel(BaseModel):
     GattConnections: Optional[List[BluetoothConnectionModel]] = Field(
         description="List of GATT connections return value for the gattList command"
     )
+    websocketClients: Optional[List[BluetoothWebSocketClientModel]] = Field(
+        description="List of BLE WebSocket clients return value for the bleWebsocketStats "
+        "command"
+    )
 
 
 class BluetoothControlResponseModelLegacy(
@@ -105,13 +105,14 @@ class BluetoothV2Resource:
         <ul>
         <li><code>bleConnect</code>: Connect to a BLE peripheral device</li>
         <li><code>bleDisconnect</code>: Disconnect from a BLE peripheral device</li>
-        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify)</li>
+        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify, readMany, writeMany)</li>
         <li><code>bleStartServer</code>: Start the BLE GATT server</li>
         <li><code>bleStopServer</code>: Stop the BLE GATT server</li>
         <li><code>bleServerStatus</code>: Get the status of the BLE GATT server</li>
         <li><code>bleStartDiscovery</code>: Start BLE discovery</li>
         <li><code>bleStopDiscovery</code>: Stop BLE discovery</li>
         <li><code>bleEnableWebsockets</code>: Enable websockets for BLE information</li>
+        <li><code>bleWebsocketStats</code>: Get queue statistics for BLE websocket clients</li>
         <li><code>hidConnect</code>: Connect to a HID peripheral device</li>
         <li><code>hidDisconnect</code>: Disconnect from a HID peripheral device</li>
         <li><code>hidList</code>: List HID devices</li>
@@ -191,13 +192,14 @@ class BluetoothControllerV2Resource:
         <ul>
         <li><code>bleConnect</code>: Connect to a BLE peripheral device</li>
         <li><code>bleDisconnect</code>: Disconnect from a BLE peripheral device</li>
-        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify)</li>
+        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify, readMany, writeMany)</li>
         <li><code>bleStartServer</code>: Start the BLE GATT server</li>
         <li><code>bleStopServer</code>: Stop the BLE GATT server</li>
         <li><code>bleServerStatus</code>: Get the status of the BLE GATT server</li>
         <li><code>bleStartDiscovery</code>: Start BLE discovery</li>
         <li><code>bleStopDiscovery</code>: Stop BLE discovery</li>
         <li><code>bleEnableWebsockets</code>: Enable websockets for BLE information</li>
+        <li><code>bleWebsocketStats</code>: Get queue statistics for BLE websocket clients</li>
         <li><code>hidConnect</code>: Connect to a HID peripheral device</li>
         <li><code>hidDisconnect</code>: Disconnect from a HID peripheral device</li>
         <li><code>hidList</code>: List HID devices</li>
@@ -279,13 +281,14 @@ class BluetoothDeviceV2Resource:
         <ul>
         <li><code>bleConnect</code>: Connect to a BLE peripheral device</li>
         <li><code>bleDisconnect</code>: Disconnect from a BLE peripheral device</li>
-        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify)</li>
+        <li><code>bleGatt</code>: Issue a GATT command to a BLE peripheral device (read, write, notify, readMany, writeMany)</li>
         <li><code>bleStartServer</code>: Start the BLE GATT server</li>
         <li><code>bleStopServer</code>: Stop the BLE GATT server</li>
         <li><code>bleServerStatus</code>: Get the status of the BLE GATT server</li>
         <li><code>bleStartDiscovery</code>: Start BLE discovery</li>
         <li><code>bleStopDiscovery</code>: Stop BLE discovery</li>
         <li><code>bleEnableWebsockets</code>: Enable websockets for BLE information</li>
+        <li><code>bleWebsocketStats</code>: Get queue statistics for BLE websocket clients</li>
         <li><code>hidConnect</code>: Connect to a HID peripheral device</li>
         <li><code>hidDisconnect</code>: Disconnect from a HID peripheral device</li>
         <li><code>hidList</code>: List HID devices</li>
@@ -13,6 +13,7 @@ from dbus_fast import DBusError
 from dbus_fast.service import ServiceInterface, method
 from summit_rcm.dbus_manager import DBusManager
 from summit_rcm.utils import variant_to_python
+from summit_rcm_bluetooth.services.bluez_object_cache import BluezObjectCache
 
 DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
 DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
@@ -56,18 +57,7 @@ async def find_controllers(bus):
     """
     Returns objects that have the bluez service and a GattManager1 interface
     """
-    remote_om = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-    ).get_interface(DBUS_OM_IFACE)
-    objects = await remote_om.call_get_managed_objects()
-
-    controllers = []
-
-    for o, props in objects.items():
-        if GATT_MANAGER_IFACE in props.keys():
-            controllers.append(o)
-
-    return controllers
+    return await BluezObjectCache().get_controller_paths(bus)
 
 
 async def find_controller(bus, name: str = ""):
@@ -75,19 +65,13 @@ async def find_controller(bus, name: str = ""):
     Returns the first object that has the bluez service and a GattManager1 interface and the
     provided name, if provided.
     """
-    remote_om = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-    ).get_interface(DBUS_OM_IFACE)
-    objects = await remote_om.call_get_managed_objects()
-
-    for o, props in objects.items():
-        if GATT_MANAGER_IFACE in props.keys():
-            if not name:
-                return o
+    for o in await BluezObjectCache().get_controller_paths(bus):
+        if not name:
+            return o
 
-            controller_name = o.replace(BLUEZ_PATH_PREPEND, "")
-            if controller_name.lower() == name.lower():
-                return o
+        controller_name = o.replace(BLUEZ_PATH_PREPEND, "")
+        if controller_name.lower() == name.lower():
+            return o
 
     return None
 
@@ -115,18 +99,15 @@ async def find_devices(bus):
     """
     Returns the objects that have the bluez service and a DEVICE_IFACE interface
     """
-    remote_om = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-    ).get_interface(DBUS_OM_IFACE)
-    objects = await remote_om.call_get_managed_objects()
+    cache = BluezObjectCache()
+    objects = await cache.get_managed_objects(bus)
 
     devices = []
 
-    for _, props in objects.items():
-        if DEVICE_IFACE in props.keys():
-            devices.append(
-                normalize_device_data(variant_to_python(props[DEVICE_IFACE]))
-            )
+    for path in await cache.get_device_paths(bus):
+        devices.append(
+            normalize_device_data(variant_to_python(objects[path][DEVICE_IFACE]))
+        )
 
     return devices
 
@@ -135,42 +116,35 @@ async def find_device(bus, uuid) -> Tuple[str, dict]:
     """
     Returns the first object that has the bluez service and a DEVICE_IFACE interface.
     """
-    remote_om = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-    ).get_interface(DBUS_OM_IFACE)
-    objects = await remote_om.call_get_managed_objects()
-
-    for o, props in objects.items():
-        if DEVICE_IFACE in props.keys():
-            device = props[DEVICE_IFACE]
-            if str(variant_to_python(device["Address"])).lower() == uuid.lower():
-                return o, normalize_device_data(variant_to_python(props[DEVICE_IFACE]))
+    cache = BluezObjectCache()
+    o = await cache.get_device_path(uuid, bus)
+    if o is None:
+        return None, None
 
-    return None, None
+    props = await cache.get_object_interfaces(o, bus)
+    return o, normalize_device_data(variant_to_python(props[DEVICE_IFACE]))
 
 
 async def set_trusted(path):
     bus = await DBusManager().get_bus()
-    props = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, path, await bus.introspect(BLUEZ_SERVICE_NAME, path)
-    ).get_interface(DBUS_PROP_IFACE)
+    props = await BluezObjectCache().get_interface(bus, path, DBUS_PROP_IFACE)
     await props.call_set(DEVICE_IFACE, "Trusted", True)
 
 
 async def device_is_connected(bus, device):
-    device_obj = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, device, await bus.introspect(BLUEZ_SERVICE_NAME, device)
-    )
-    device_interface = device_obj.get_interface(DEVICE_IFACE)
+    # 'Connected' is kept up to date by the cache from PropertiesChanged signals
+    props = await BluezObjectCache().get_object_interfaces(device, bus)
+    if props is not None and "Connected" in props.get(DEVICE_IFACE, {}):
+        return variant_to_python(props[DEVICE_IFACE]["Connected"])
+
+    device_interface = await BluezObjectCache().get_interface(bus, device, DEVICE_IFACE)
     connected_state = variant_to_python(await device_interface.get_connected())
     return connected_state
 
 
 async def dev_connect(path):
     bus = await DBusManager().get_bus()
-    dev = bus.get_proxy_object(
-        BLUEZ_SERVICE_NAME, path, await bus.introspect(BLUEZ_SERVICE_NAME, path)
-    ).get_interface(DEVICE_IFACE)
+    dev = await BluezObjectCache().get_interface(bus, path, DEVICE_IFACE)
     await dev.call_connect()
 
 
@@ -0,0 +1,339 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to cache the BlueZ object model and the introspection data of its objects
+"""
+
+import asyncio
+import re
+from syslog import syslog, LOG_ERR
+from typing import Dict, List, Optional, Tuple
+from dbus_fast import Message, MessageType, Variant
+from dbus_fast.aio.proxy_object import ProxyInterface, ProxyObject
+from dbus_fast.introspection import Interface, Node
+from summit_rcm.dbus_manager import DBusManager
+from summit_rcm.utils import Singleton, variant_to_python
+
+# Defined here rather than imported from the ble module, which uses this cache
+BLUEZ_SERVICE_NAME = "org.bluez"
+BLUEZ_PATH_PREPEND = "/org/bluez/"
+ADAPTER_IFACE = "org.bluez.Adapter1"
+DEVICE_IFACE = "org.bluez.Device1"
+GATT_MANAGER_IFACE = "org.bluez.GattManager1"
+DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
+DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
+
+DBUS_BUS_NAME = "org.freedesktop.DBus"
+DBUS_OBJ_PATH = "/org/freedesktop/DBus"
+DBUS_IFACE = "org.freedesktop.DBus"
+
+BLUEZ_CACHE_MATCH_RULES = [
+    f"type='signal',sender='{BLUEZ_SERVICE_NAME}',interface='{DBUS_PROP_IFACE}',"
+    "member='PropertiesChanged',path_namespace='/org/bluez'",
+    f"type='signal',sender='{BLUEZ_SERVICE_NAME}',interface='{DBUS_OM_IFACE}',path='/'",
+    f"type='signal',sender='{DBUS_BUS_NAME}',interface='{DBUS_IFACE}',"
+    f"member='NameOwnerChanged',arg0='{BLUEZ_SERVICE_NAME}'",
+]
+"""D-Bus match rules used to keep the BlueZ object cache in sync"""
+
+PATH_ELEMENT_PATTERN = re.compile(
+    "^(hci|service|char|desc|fd|sep|player)[0-9a-fA-F]+$|^(dev)_[0-9A-Fa-f_]+$"
+)
+
+
+def introspection_path_pattern(path: str) -> str:
+    """
+    Return the pattern of the given BlueZ object path, with instance numbers and addresses
+    replaced by '*' (e.g., /org/bluez/hci0/dev_00_11_22_33_44_55 -> /org/bluez/hci*/dev_*).
+    Objects with the same pattern implement the same interface definitions.
+    """
+    elements = []
+    for element in path.split("/"):
+        match = PATH_ELEMENT_PATTERN.match(element)
+        if match:
+            element = f"{match[1] or match[2] + '_'}*"
+        elements.append(element)
+    return "/".join(elements)
+
+
+class BluezObjectCache(metaclass=Singleton):
+    """
+    Cache of the BlueZ object model, seeded once with 'GetManagedObjects' and then kept in sync
+    with the 'InterfacesAdded', 'InterfacesRemoved' and 'PropertiesChanged' signals. Controllers
+    and devices are indexed by address. Introspection data is cached per (path pattern,
+    interface), so proxies for BlueZ objects are built without introspecting them again.
+
+    Cached properties are kept as Variants, in the same form as returned by 'GetManagedObjects'.
+    """
+
+    def __init__(self) -> None:
+        # {obj_path: {interface: {property: Variant}}}
+        self._objects: Dict[str, Dict[str, Dict[str, Variant]]] = {}
+        self._controller_paths: Dict[str, None] = {}
+        """Paths of the objects with a GattManager1 interface, in discovery order"""
+        self._adapter_addresses: Dict[str, str] = {}
+        """Adapter object paths - indexed by upper case address"""
+        self._device_paths: Dict[str, None] = {}
+        """Paths of the objects with a Device1 interface, in discovery order"""
+        self._device_addresses: Dict[str, List[str]] = {}
+        """Device object paths - indexed by upper case address"""
+        self._interfaces: Dict[Tuple[str, str], Interface] = {}
+        """Introspected interface definitions - indexed by (path pattern, interface name)"""
+        self._lock = asyncio.Lock()
+        self._seeded = False
+        self._pending_signals: Optional[List[Message]] = None
+        """Signals received while seeding, replayed once the seed is applied"""
+        self._signals_subscribed = False
+
+    def invalidate(self) -> None:
+        """Drop everything cached. The cache is re-seeded on the next read."""
+        self._objects.clear()
+        self._controller_paths.clear()
+        self._adapter_addresses.clear()
+        self._device_paths.clear()
+        self._device_addresses.clear()
+        self._interfaces.clear()
+        self._seeded = False
+
+    @staticmethod
+    def _address(props: Dict[str, Variant]) -> Optional[str]:
+        address = props.get("Address", None)
+        return str(variant_to_python(address)).upper() if address is not None else None
+
+    def _index(self, obj_path: str) -> None:
+        """Add the given object to the controller and address indexes"""
+        interfaces = self._objects.get(obj_path, {})
+        if GATT_MANAGER_IFACE in interfaces:
+            self._controller_paths[obj_path] = None
+        if ADAPTER_IFACE in interfaces:
+            address = self._address(interfaces[ADAPTER_IFACE])
+            if address:
+                self._adapter_addresses[address] = obj_path
+        if DEVICE_IFACE in interfaces:
+            self._device_paths[obj_path] = None
+            address = self._address(interfaces[DEVICE_IFACE])
+            if address:
+                paths = self._device_addresses.setdefault(address, [])
+                if obj_path not in paths:
+                    paths.append(obj_path)
+
+    def _unindex(self, obj_path: str) -> None:
+        """
+        Remove the given object from the controller and address indexes, based on its currently
+        cached properties
+        """
+        interfaces = self._objects.get(obj_path, {})
+        self._controller_paths.pop(obj_path, None)
+        self._device_paths.pop(obj_path, None)
+        address = self._address(interfaces.get(ADAPTER_IFACE, {}))
+        if address and self._adapter_addresses.get(address, None) == obj_path:
+            del self._adapter_addresses[address]
+        address = self._address(interfaces.get(DEVICE_IFACE, {}))
+        paths = self._device_addresses.get(address, []) if address else []
+        if obj_path in paths:
+            paths.remove(obj_path)
+            if not paths:
+                del self._device_addresses[address]
+
+    async def _subscribe_signals(self, bus) -> None:
+        """Register the match rules and message handler used to keep the cache in sync"""
+        if self._signals_subscribed:
+            return
+
+        for rule in BLUEZ_CACHE_MATCH_RULES:
+            reply = await bus.call(
+                Message(
+                    destination=DBUS_BUS_NAME,
+                    path=DBUS_OBJ_PATH,
+                    interface=DBUS_IFACE,
+                    member="AddMatch",
+                    signature="s",
+                    body=[rule],
+                )
+            )
+            if reply.message_type == MessageType.ERROR:
+                raise Exception(reply.body[0])
+
+        bus.add_message_handler(self._signal_handler)
+        self._signals_subscribed = True
+
+    async def _ensure_seeded(self, bus) -> None:
+        """Seed the cache (if necessary) using 'GetManagedObjects'"""
+        if self._seeded:
+            return
+
+        async with self._lock:
+            if self._seeded:
+                return
+
+            # Subscribe first and queue the signals received until the reply is applied, so that
+            # no change is missed between the two calls
+            self._pending_signals = []
+            try:
+                await self._subscribe_signals(bus)
+                reply = await bus.call(
+                    Message(
+                        destination=BLUEZ_SERVICE_NAME,
+                        path="/",
+                        interface=DBUS_OM_IFACE,
+                        member="GetManagedObjects",
+                    )
+                )
+                if reply.message_type == MessageType.ERROR:
+                    raise Exception(reply.body[0])
+
+                self._objects.clear()
+                self._controller_paths.clear()
+                self._adapter_addresses.clear()
+                self._device_paths.clear()
+                self._device_addresses.clear()
+                for obj_path, interfaces in reply.body[0].items():
+                    self._objects[obj_path] = interfaces
+                    self._index(obj_path)
+                for msg in self._pending_signals:
+                    self._apply_signal(msg)
+                self._seeded = True
+            finally:
+                self._pending_signals = None
+
+    def _signal_handler(self, msg) -> None:
+        """Update the BlueZ object cache from the received D-Bus signal"""
+        if msg.message_type != MessageType.SIGNAL:
+            return
+
+        if msg.member == "NameOwnerChanged":
+            if msg.body and msg.body[0] == BLUEZ_SERVICE_NAME:
+                # bluetoothd restarted (or stopped), so everything we know is stale
+                self.invalidate()
+            return
+
+        if not self._seeded:
+            if self._pending_signals is not None:
+                self._pending_signals.append(msg)
+            return
+
+        self._apply_signal(msg)
+
+    def _apply_signal(self, msg) -> None:
+        """Apply the given 'PropertiesChanged', 'InterfacesAdded' or 'InterfacesRemoved' signal"""
+        try:
+            if (
+                msg.member == "PropertiesChanged"
+                and msg.interface == DBUS_PROP_IFACE
+                and msg.path
+                and msg.path.startswith(BLUEZ_PATH_PREPEND)
+            ):
+                interface, changed, invalidated = msg.body
+                cached_props = self._objects.get(msg.path, {}).get(interface, None)
+                if cached_props is None:
+                    return
+                reindex = "Address" in changed or "Address" in invalidated
+                if reindex:
+                    self._unindex(msg.path)
+                cached_props.update(changed)
+                for key in invalidated:
+                    cached_props.pop(key, None)
+                if reindex:
+                    self._index(msg.path)
+            elif msg.member == "InterfacesAdded" and msg.interface == DBUS_OM_IFACE:
+                obj_path, interfaces = msg.body
+                if not obj_path.startswith(BLUEZ_PATH_PREPEND):
+                    return
+                self._unindex(obj_path)
+                self._objects.setdefault(obj_path, {}).update(interfaces)
+                self._index(obj_path)
+            elif msg.member == "InterfacesRemoved" and msg.interface == DBUS_OM_IFACE:
+                obj_path, interfaces = msg.body
+                obj = self._objects.get(obj_path, None)
+                if obj is None:
+                    return
+                self._unindex(obj_path)
+                for interface in interfaces:
+                    obj.pop(interface, None)
+                if obj:
+                    self._index(obj_path)
+                else:
+                    del self._objects[obj_path]
+        except Exception as exception:
+            syslog(
+                LOG_ERR,
+                f"Unable to process BlueZ signal {msg.member}: {str(exception)}",
+            )
+
+    async def get_managed_objects(
+        self, bus=None
+    ) -> Dict[str, Dict[str, Dict[str, Variant]]]:
+        """
+        Retrieve the cached BlueZ objects, in the same form as returned by 'GetManagedObjects'.
+        The returned dictionary is owned by the cache and must not be modified.
+        """
+        await self._ensure_seeded(bus or await DBusManager().get_bus())
+        return self._objects
+
+    async def get_object_interfaces(
+        self, obj_path: str, bus=None
+    ) -> Optional[Dict[str, Dict[str, Variant]]]:
+        """Retrieve the cached interfaces and properties of the given object, if it exists"""
+        return (await self.get_managed_objects(bus)).get(obj_path, None)
+
+    async def get_controller_paths(self, bus=None) -> List[str]:
+        """Retrieve the paths of the objects that have a GattManager1 interface"""
+        await self._ensure_seeded(bus or await DBusManager().get_bus())
+        return list(self._controller_paths)
+
+    async def get_adapter_path(self, address: str, bus=None) -> Optional[str]:
+        """Retrieve the path of the adapter with the given address"""
+        await self._ensure_seeded(bus or await DBusManager().get_bus())
+        return self._adapter_addresses.get(address.upper(), None)
+
+    async def get_device_path(self, address: str, bus=None) -> Optional[str]:
+        """Retrieve the path of the first device object with the given address"""
+        await self._ensure_seeded(bus or await DBusManager().get_bus())
+        paths = self._device_addresses.get(address.upper(), None)
+        return paths[0] if paths else None
+
+    async def get_device_paths(self, bus=None) -> List[str]:
+        """Retrieve the paths of every device object"""
+        await self._ensure_seeded(bus or await DBusManager().get_bus())
+        return list(self._device_paths)
+
+    async def get_proxy_object(self, bus, obj_path: str) -> ProxyObject:
+        """
+        Retrieve a proxy for the given BlueZ object. The object is only introspected if the
+        definition of one of its interfaces isn't cached yet for its path pattern.
+        """
+        await self._ensure_seeded(bus)
+        pattern = introspection_path_pattern(obj_path)
+        obj = self._objects.get(obj_path, None)
+        interface_names = list(obj.keys()) if obj is not None else None
+        if interface_names is not None and DBUS_PROP_IFACE not in interface_names:
+            interface_names.append(DBUS_PROP_IFACE)
+
+        if interface_names is None or any(
+            (pattern, name) not in self._interfaces for name in interface_names
+        ):
+            node = await bus.introspect(BLUEZ_SERVICE_NAME, obj_path)
+            for interface in node.interfaces:
+                self._interfaces[(pattern, interface.name)] = interface
+            if interface_names is None:
+                # Not a managed object (e.g., '/'), so use whatever it implements right now
+                interface_names = [interface.name for interface in node.interfaces]
+
+        return bus.get_proxy_object(
+            BLUEZ_SERVICE_NAME,
+            obj_path,
+            Node(
+                obj_path,
+                interfaces=[
+                    self._interfaces[(pattern, name)]
+                    for name in interface_names
+                    if (pattern, name) in self._interfaces
+                ],
+            ),
+        )
+
+    async def get_interface(self, bus, obj_path: str, interface: str) -> ProxyInterface:
+        """Retrieve a proxy for the given interface of the given BlueZ object"""
+        return (await self.get_proxy_object(bus, obj_path)).get_interface(interface)
@@ -28,10 +28,10 @@ from summit_rcm_bluetooth.services.ble import (
     AgentSingleton,
     BLUEZ_SERVICE_NAME,
     uri_to_uuid,
-    GATT_MANAGER_IFACE,
     create_agent_singleton,
 )
 from summit_rcm_bluetooth.services.bt_controller_state import BluetoothControllerState
+from summit_rcm_bluetooth.services.bluez_object_cache import BluezObjectCache
 from summit_rcm.utils import Singleton, variant_to_python
 
 
@@ -104,11 +104,7 @@ async def get_controller_obj(controller: str = ""):
         result["SDCERR"] = definition.SUMMIT_RCM_ERRORS.get("SDCERR_FAIL", 1)
         controller_obj = None
     else:
-        controller_obj = bus.get_proxy_object(
-            BLUEZ_SERVICE_NAME,
-            controller,
-            await bus.introspect(BLUEZ_SERVICE_NAME, controller),
-        )
+        controller_obj = await BluezObjectCache().get_proxy_object(bus, controller)
 
     return bus, controller_obj, result
 
@@ -178,37 +174,20 @@ class Bluetooth(metaclass=Singleton):
         if controller_friendly_name not in self._controller_addresses.keys():
             return None
         address = self._controller_addresses[controller_friendly_name]
-        bus = await DBusManager().get_bus()
-        remote_om = bus.get_proxy_object(
-            BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-        ).get_interface(DBUS_OM_IFACE)
-        objects = await remote_om.call_get_managed_objects()
-
-        for controller, props in objects.items():
-            if GATT_MANAGER_IFACE in props.keys():
-                if (
-                    ADAPTER_IFACE in props.keys()
-                    and "Address" in props[ADAPTER_IFACE].keys()
-                ):
-                    if address == variant_to_python(props[ADAPTER_IFACE]["Address"]):
-                        return controller
+        cache = BluezObjectCache()
+        controller = await cache.get_adapter_path(address)
+        if controller is not None and controller in await cache.get_controller_paths():
+            return controller
         return None
 
     async def remapped_controller_to_friendly_name(self, controller: str) -> str:
         """Lookup the REST API name of the controller with the address matching the provided
         controller by dbus path.
         """
-        bus = await DBusManager().get_bus()
-        controller_obj = bus.get_proxy_object(
-            BLUEZ_SERVICE_NAME,
-            controller,
-            await bus.introspect(BLUEZ_SERVICE_NAME, controller),
-        )
-
-        if not controller_obj:
+        props = await BluezObjectCache().get_object_interfaces(controller)
+        if not props or "Address" not in props.get(ADAPTER_IFACE, {}):
             return ""
-        adapter_interface = controller_obj.get_interface(ADAPTER_IFACE)
-        requested_address = variant_to_python(await adapter_interface.get_address())
+        requested_address = variant_to_python(props[ADAPTER_IFACE]["Address"])
         for controller_friendly_name, address in self._controller_addresses.items():
             if requested_address == address:
                 return controller_friendly_name
@@ -225,32 +204,29 @@ class Bluetooth(metaclass=Singleton):
         If these assumptions are not true, renumber can be set to simply number
         discovered controllers as controller0 and up.
         """
-        bus = await DBusManager().get_bus()
-        remote_om = bus.get_proxy_object(
-            BLUEZ_SERVICE_NAME, "/", await bus.introspect(BLUEZ_SERVICE_NAME, "/")
-        ).get_interface(DBUS_OM_IFACE)
-        objects = await remote_om.call_get_managed_objects()
+        cache = BluezObjectCache()
+        objects = await cache.get_managed_objects()
         controller_number = len(self._controller_addresses.keys())
 
-        for controller, props in objects.items():
-            if GATT_MANAGER_IFACE in props.keys():
-                if renumber:
-                    controller_friendly_name: str = f"controller{controller_number}"
-                else:
-                    controller_friendly_name: str = controller_pretty_name(controller)
-                if (
-                    ADAPTER_IFACE in props.keys()
-                    and "Address" in props[ADAPTER_IFACE].keys()
-                ):
-                    address = variant_to_python(props[ADAPTER_IFACE]["Address"])
-                    if address not in self._controller_addresses.values():
-                        self._controller_addresses[controller_friendly_name] = address
-                        syslog(
-                            LOG_INFO,
-                            f"assigning controller {controller} at address {address} "
-                            f"to REST API name {controller_friendly_name}",
-                        )
-                        controller_number += 1
+        for controller in await cache.get_controller_paths():
+            props = objects[controller]
+            if renumber:
+                controller_friendly_name: str = f"controller{controller_number}"
+            else:
+                controller_friendly_name: str = controller_pretty_name(controller)
+            if (
+                ADAPTER_IFACE in props.keys()
+                and "Address" in props[ADAPTER_IFACE].keys()
+            ):
+                address = variant_to_python(props[ADAPTER_IFACE]["Address"])
+                if address not in self._controller_addresses.values():
+                    self._controller_addresses[controller_friendly_name] = address
+                    syslog(
+                        LOG_INFO,
+                        f"assigning controller {controller} at address {address} "
+                        f"to REST API name {controller_friendly_name}",
+                    )
+                    controller_number += 1
 
     async def register_controller_callbacks(self):
         if not self._controller_callbacks_registered:
@@ -258,11 +234,9 @@ class Bluetooth(metaclass=Singleton):
                 self._controller_callbacks_registered = True
 
                 bus = await DBusManager().get_bus()
-                interface = bus.get_proxy_object(
-                    BLUEZ_SERVICE_NAME,
-                    "/",
-                    await bus.introspect(BLUEZ_SERVICE_NAME, "/"),
-                ).get_interface(DBUS_OM_IFACE)
+                interface = await BluezObjectCache().get_interface(
+                    bus, "/", DBUS_OM_IFACE
+                )
                 interface.on_interfaces_removed(self.interface_removed_cb)
                 interface.on_interfaces_added(self.interface_added_cb)
             except Exception as exception:
@@ -393,11 +367,7 @@ class Bluetooth(metaclass=Singleton):
         )
         device, _ = await find_device(bus, device_uuid)
         if device is not None:
-            device_obj = bus.get_proxy_object(
-                BLUEZ_SERVICE_NAME,
-                device,
-                await bus.introspect(BLUEZ_SERVICE_NAME, device),
-            )
+            device_obj = await BluezObjectCache().get_proxy_object(bus, device)
             device_interface = device_obj.get_interface(DEVICE_IFACE)
             try:
                 await self.set_device_properties(
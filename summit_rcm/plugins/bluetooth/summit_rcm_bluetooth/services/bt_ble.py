@@ -23,7 +23,9 @@ from summit_rcm_bluetooth.services.bt_module import (
     bt_connect,
     bt_disconnect,
     bt_read_characteristic,
+    bt_read_characteristics,
     bt_write_characteristic,
+    bt_write_characteristics,
     bt_config_characteristic_notification,
 )
 from summit_rcm_bluetooth.services.bt_module_extended import bt_init_ex
@@ -43,7 +45,10 @@ DEVICE_IFACE = "org.bluez.Device1"
 ble_notification_objects: list = []
 
 try:
-    from summit_rcm_bluetooth.services.bt_ble_websocket import BluetoothWebSocketResource
+    from summit_rcm_bluetooth.services.bt_ble_websocket import (
+        BluetoothWebSocketResource,
+        get_websocket_listener_stats,
+    )
     import websockets
 
     syslog("bt_ble: Bluetooth BLE Websockets loaded")
@@ -77,7 +82,7 @@ class BluetoothBlePlugin(BluetoothPlugin):
             "bleStopDiscovery",
         ]
         if BluetoothWebSocketResource:
-            adapter_commands += ["bleEnableWebsockets"]
+            adapter_commands += ["bleEnableWebsockets", "bleWebsocketStats"]
         return adapter_commands
 
     async def initialize(self):
@@ -107,6 +112,11 @@ class BluetoothBlePlugin(BluetoothPlugin):
     async def broadcast_ble_notification(self, message):
         if self._server:
             self._server.tcp_connection_try_send(message)
+        if not ble_notification_objects:
+            return
+        # Encode the notification once for all WebSocket listeners
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
         for o in ble_notification_objects.copy():
             await o.ble_notify(message)
 
@@ -148,36 +158,65 @@ class BluetoothBlePlugin(BluetoothPlugin):
             await bt_disconnect(self.bt, device_uuid, purge)
         elif command == "bleGatt":
             processed = True
-            if "svcUuid" not in post_data:
-                return True, "svcUuid param not specified"
-            if "chrUuid" not in post_data:
-                return True, "charUuid param not specified"
             if "operation" not in post_data:
                 return True, "operation param not specified"
-            service_uuid = post_data["svcUuid"]
-            char_uuid = post_data["chrUuid"]
             operation = post_data["operation"]
-            if operation == "read":
-                await bt_read_characteristic(
-                    self.bt, device_uuid, service_uuid, char_uuid
-                )
-            elif operation == "write":
-                if "value" not in post_data:
-                    return True, "value param not specified"
-                value = post_data["value"]
-                value_bytes = bytearray.fromhex(value)
-                await bt_write_characteristic(
-                    self.bt, device_uuid, service_uuid, char_uuid, value_bytes
-                )
-            elif operation == "notify":
-                if "enable" not in post_data:
-                    return True, "enable param not specified"
-                enable = post_data["enable"]
-                await bt_config_characteristic_notification(
-                    self.bt, device_uuid, service_uuid, char_uuid, enable
-                )
+            if operation in ["readMany", "writeMany"]:
+                # Batched operation on a list of characteristics
+                if "characteristics" not in post_data:
+                    return True, "characteristics param not specified"
+                characteristics = []
+                for characteristic in post_data["characteristics"]:
+                    if "svcUuid" not in characteristic:
+                        return True, "svcUuid param not specified"
+                    if "chrUuid" not in characteristic:
+                        return True, "charUuid param not specified"
+                    if operation == "readMany":
+                        characteristics.append(
+                            (characteristic["svcUuid"], characteristic["chrUuid"])
+                        )
+                    else:
+                        if "value" not in characteristic:
+                            return True, "value param not specified"
+                        characteristics.append(
+                            (
+                                characteristic["svcUuid"],
+                                characteristic["chrUuid"],
+                                bytearray.fromhex(characteristic["value"]),
+                            )
+                        )
+                if operation == "readMany":
+                    await bt_read_characteristics(self.bt, device_uuid, characteristics)
+                else:
+                    await bt_write_characteristics(self.bt, device_uuid, characteristics)
             else:
-                return True, f"unknown GATT operation {operation} requested"
+                if "svcUuid" not in post_data:
+                    return True, "svcUuid param not specified"
+                if "chrUuid" not in post_data:
+                    return True, "charUuid param not specified"
+                service_uuid = post_data["svcUuid"]
+                char_uuid = post_data["chrUuid"]
+                if operation == "read":
+                    await bt_read_characteristic(
+                        self.bt, device_uuid, service_uuid, char_uuid
+                    )
+                elif operation == "write":
+                    if "value" not in post_data:
+                        return True, "value param not specified"
+                    value = post_data["value"]
+                    value_bytes = bytearray.fromhex(value)
+                    await bt_write_characteristic(
+                        self.bt, device_uuid, service_uuid, char_uuid, value_bytes
+                    )
+                elif operation == "notify":
+                    if "enable" not in post_data:
+                        return True, "enable param not specified"
+                    enable = post_data["enable"]
+                    await bt_config_characteristic_notification(
+                        self.bt, device_uuid, service_uuid, char_uuid, enable
+                    )
+                else:
+                    return True, f"unknown GATT operation {operation} requested"
 
         if self.ble_logger and self.ble_logger.error_occurred:
             error_message = self.ble_logger.last_message
@@ -201,6 +240,9 @@ class BluetoothBlePlugin(BluetoothPlugin):
             processed = True
             if not self._websockets_enabled:
                 await self.initialize()
+        elif BluetoothWebSocketResource and command == "bleWebsocketStats":
+            processed = True
+            result["websocketClients"] = get_websocket_listener_stats()
         elif command == "bleStartServer":
             processed = True
             if self._server:
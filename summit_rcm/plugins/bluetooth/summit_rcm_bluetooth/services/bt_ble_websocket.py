@@ -7,9 +7,9 @@ Module to support BLE data relay via WebSockets
 """
 
 import asyncio
-from collections import deque
+from enum import Enum
 from syslog import syslog
-from typing import Deque, Dict
+from typing import Dict, List, Optional
 from uuid import uuid4
 import falcon.asgi
 from summit_rcm.settings import ServerConfig
@@ -37,7 +37,97 @@ except (ImportError, DocsNotEnabledException):
 
 spec = SpectreeService()
 
-SLEEP_DELAY_S = 0.1
+DEFAULT_WEBSOCKET_QUEUE_SIZE = 64
+WEBSOCKET_OVERFLOW_CLOSE_CODE = 1008
+
+
+class WebSocketOverflowPolicy(str, Enum):
+    """Enumeration of actions to take when a WebSocket listener's queue is full"""
+
+    DROP_OLDEST = "dropOldest"
+    DISCONNECT = "disconnect"
+
+
+def get_websocket_queue_size() -> int:
+    """
+    Retrieve the maximum number of queued notifications per WebSocket listener (configurable via
+    'bluetooth_websocket_queue_size', default 64)
+    """
+    parser = ServerConfig().get_parser()
+    if parser is None:
+        return DEFAULT_WEBSOCKET_QUEUE_SIZE
+    return max(
+        1,
+        parser.getint(
+            "summit-rcm",
+            "bluetooth_websocket_queue_size",
+            fallback=DEFAULT_WEBSOCKET_QUEUE_SIZE,
+        ),
+    )
+
+
+def get_websocket_overflow_policy() -> WebSocketOverflowPolicy:
+    """
+    Retrieve the action to take when a WebSocket listener's queue is full (configurable via
+    'bluetooth_websocket_overflow_policy', default 'dropOldest')
+    """
+    parser = ServerConfig().get_parser()
+    if parser is None:
+        return WebSocketOverflowPolicy.DROP_OLDEST
+    try:
+        return WebSocketOverflowPolicy(
+            parser.get(
+                "summit-rcm",
+                "bluetooth_websocket_overflow_policy",
+                fallback=WebSocketOverflowPolicy.DROP_OLDEST.value,
+            )
+        )
+    except ValueError:
+        return WebSocketOverflowPolicy.DROP_OLDEST
+
+
+def get_websocket_listener_stats() -> List[dict]:
+    """Retrieve the queue statistics of every connected BLE WebSocket listener"""
+    return [
+        listener.get_stats()
+        for resource in ble_notification_objects
+        if isinstance(resource, BluetoothWebSocketResource)
+        for listener in resource.listeners.values()
+    ]
+
+
+class WebSocketListener:
+    """A single WebSocket client with a bounded queue of pending notifications"""
+
+    def __init__(
+        self, max_queue_size: int, overflow_policy: WebSocketOverflowPolicy
+    ) -> None:
+        self.id: str = str(uuid4())
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.overflow_policy = overflow_policy
+        self.overflowed: asyncio.Event = asyncio.Event()
+        self.sent: int = 0
+        self.dropped: int = 0
+
+    def push(self, message: str) -> None:
+        """Queue the given message without blocking, applying the overflow policy if full"""
+        if self.queue.full():
+            self.dropped += 1
+            if self.overflow_policy == WebSocketOverflowPolicy.DISCONNECT:
+                self.overflowed.set()
+                return
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    def get_stats(self) -> dict:
+        """Retrieve the listener's queue statistics"""
+        return {
+            "id": self.id,
+            "queueDepth": self.queue.qsize(),
+            "queueSize": self.queue.maxsize,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
 
 
 class BluetoothWebSocketResource:
@@ -45,7 +135,7 @@ class BluetoothWebSocketResource:
 
     def __init__(self, is_legacy: bool = False) -> None:
         ble_notification_objects.append(self)
-        self.listeners: Dict[str, Deque[str]] = {}
+        self.listeners: Dict[str, WebSocketListener] = {}
         self.is_legacy = is_legacy
 
     def __del__(self):
@@ -81,52 +171,75 @@ class BluetoothWebSocketResource:
             return
 
         # Create a message listener and add it to the dictionary
-        listener_id = uuid4()
-        message_listener = deque()
-        self.listeners[listener_id] = message_listener
+        listener = WebSocketListener(
+            get_websocket_queue_size(), get_websocket_overflow_policy()
+        )
+        self.listeners[listener.id] = listener
 
-        # Create and start the 'sink' task
+        # Create and start the 'sink' task and the task waiting for an overflow
         sink_task = falcon.create_task(self.websocket_sink(websocket))
+        overflow_task = falcon.create_task(listener.overflowed.wait())
 
-        # Loop while checking if we have any new messages to send
-        while not sink_task.done():
-            if len(message_listener) == 0:
-                await asyncio.sleep(SLEEP_DELAY_S)
-                continue
-
-            try:
-                await websocket.send_text(message_listener.popleft())
-            except falcon.WebSocketDisconnected:
-                break
-
-        # Clean up sink task
-        sink_task.cancel()
+        # Wait for new messages to send until the client disconnects or overflows
+        close_code: Optional[int] = None
         try:
-            await sink_task
-        except asyncio.CancelledError:
+            while True:
+                get_task = falcon.create_task(listener.queue.get())
+                await asyncio.wait(
+                    [get_task, sink_task, overflow_task],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                received = get_task.done()
+                if not received:
+                    get_task.cancel()
+
+                # Check before every send, as a backlog in the queue keeps 'get_task' completing
+                # right away and a slow client must still be dropped as soon as it overflows
+                if listener.overflowed.is_set():
+                    close_code = WEBSOCKET_OVERFLOW_CLOSE_CODE
+                    break
+                if sink_task.done() or not received:
+                    break
+
+                await websocket.send_text(get_task.result())
+                listener.sent += 1
+        except falcon.WebSocketDisconnected:
             pass
-
-        # Clean up message listener
-        del self.listeners[listener_id]
+        finally:
+            # Clean up tasks
+            for task in [sink_task, overflow_task]:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+            # Clean up message listener
+            del self.listeners[listener.id]
+
+        if close_code is not None:
+            syslog(
+                f"Closing BLE WebSocket {listener.id} after its queue overflowed "
+                f"({listener.dropped} dropped)"
+            )
+            await websocket.close(close_code)
 
     async def websocket_sink(self, websocket: falcon.asgi.WebSocket):
         """Handle incoming websocket messages"""
 
         while True:
-            await asyncio.sleep(SLEEP_DELAY_S)
-
             try:
                 # Receive any messages and just throw them away for now
                 _ = await websocket.receive_text()
             except falcon.WebSocketDisconnected:
                 break
 
-    async def ble_notify(self, message: str | bytes):
-        """Queue a message to be sent via a websocket connection if one is established"""
+    async def ble_notify(self, message: str):
+        """
+        Queue an already-encoded message to be sent via every established websocket connection
+        """
         try:
-            if isinstance(message, bytes):
-                message = message.decode("utf-8")
-            for _, listener in self.listeners.items():
-                listener.append(str(message))
+            for listener in self.listeners.values():
+                listener.push(message)
         except Exception as exception:
             syslog(f"ble_notify() - Could not send notification - {str(exception)}")
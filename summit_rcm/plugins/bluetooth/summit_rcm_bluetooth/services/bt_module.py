@@ -11,7 +11,7 @@ Bluetooth API for Sentrius IG devices
 import threading
 import logging
 import asyncio
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from dbus_fast import DBusError, Variant
 from dbus_fast.aio.proxy_object import ProxyInterface, ProxyObject
 from summit_rcm.dbus_manager import DBusManager
@@ -31,6 +31,137 @@ RESULT_SUCCESS = 0
 RESULT_ERR = -1
 
 
+class GattIndex:
+    """
+    Index of the GATT services and characteristics of the devices known to BlueZ, in the form
+    device path -> service UUID -> characteristic UUID -> characteristic path and flags.
+    The index is built from the object manager's objects and then updated as GATT objects are
+    added and removed, so lookups never scan the object list.
+
+    GATT allows several services or characteristics with the same UUID (e.g., HID Report
+    characteristics), so every object is kept, in discovery order, and lookups by UUID return the
+    first one.
+    """
+
+    def __init__(self):
+        # {device_path: {service_uuid: [service_path, ...]}}
+        self._services: Dict[str, Dict[str, List[str]]] = {}
+        # {service_path: {char_path: (char_uuid, flags)}}
+        self._characteristics: Dict[str, Dict[str, Tuple[str, List[str]]]] = {}
+        # {service_path: {char_uuid: [char_path, ...]}}
+        self._characteristic_uuids: Dict[str, Dict[str, List[str]]] = {}
+        # Reverse lookups used when objects are removed
+        self._service_paths: Dict[str, Tuple[str, str]] = {}
+        self._characteristic_paths: Dict[str, Tuple[str, str]] = {}
+
+    def rebuild(self, objects):
+        """Re-index everything from the given 'GetManagedObjects' result"""
+        self._services.clear()
+        self._characteristics.clear()
+        self._characteristic_uuids.clear()
+        self._service_paths.clear()
+        self._characteristic_paths.clear()
+        for path, interfaces in objects.items():
+            self.add_object(path, interfaces)
+
+    @staticmethod
+    def _remove_path(index: Dict[str, Dict[str, List[str]]], key, uuid, path):
+        paths = index.get(key, {}).get(uuid, [])
+        if path in paths:
+            paths.remove(path)
+            if not paths:
+                del index[key][uuid]
+                if not index[key]:
+                    del index[key]
+
+    def add_object(self, path, interfaces):
+        """Index the given object, if it is a GATT service or characteristic"""
+        service = interfaces.get(BT_SERVICE_IFACE)
+        if service and "UUID" in service and path not in self._service_paths:
+            device_path = (
+                str(variant_to_python(service["Device"]))
+                if "Device" in service
+                else path.rsplit("/", 1)[0]
+            )
+            uuid = str(variant_to_python(service["UUID"]))
+            self._services.setdefault(device_path, {}).setdefault(uuid, []).append(path)
+            self._service_paths[path] = (device_path, uuid)
+
+        char = interfaces.get(BT_CHARACTERISTIC_IFACE)
+        if char and "UUID" in char and path not in self._characteristic_paths:
+            service_path = (
+                str(variant_to_python(char["Service"]))
+                if "Service" in char
+                else path.rsplit("/", 1)[0]
+            )
+            uuid = str(variant_to_python(char["UUID"]))
+            flags = variant_to_python(char["Flags"]) if "Flags" in char else None
+            self._characteristics.setdefault(service_path, {})[path] = (uuid, flags)
+            self._characteristic_uuids.setdefault(service_path, {}).setdefault(
+                uuid, []
+            ).append(path)
+            self._characteristic_paths[path] = (service_path, uuid)
+
+    def remove_object(self, path, interfaces):
+        """Drop the given object's removed GATT interfaces from the index"""
+        if BT_SERVICE_IFACE in interfaces and path in self._service_paths:
+            device_path, uuid = self._service_paths.pop(path)
+            self._remove_path(self._services, device_path, uuid, path)
+
+        if BT_CHARACTERISTIC_IFACE in interfaces and path in self._characteristic_paths:
+            service_path, uuid = self._characteristic_paths.pop(path)
+            self._remove_path(self._characteristic_uuids, service_path, uuid, path)
+            chars = self._characteristics.get(service_path, {})
+            chars.pop(path, None)
+            if not chars:
+                self._characteristics.pop(service_path, None)
+
+    def has_device(self, device_path) -> bool:
+        """Returns True if any service of the given device is indexed"""
+        return device_path in self._services
+
+    def find_services(self, device_path, service_uuid) -> List[str]:
+        """Returns the paths of every service of the given device with the given UUID"""
+        return self._services.get(device_path, {}).get(service_uuid, [])
+
+    def find_service(self, device_path, service_uuid) -> Optional[str]:
+        """Returns the path of the first service of the given device with the given UUID"""
+        paths = self.find_services(device_path, service_uuid)
+        return paths[0] if paths else None
+
+    def find_service_uuid(self, service_path) -> Optional[str]:
+        """Returns the UUID of the service at the given path"""
+        return self._service_paths.get(service_path, (None, None))[1]
+
+    def find_characteristic_by_path(
+        self, char_path
+    ) -> Optional[Tuple[str, str, List[str]]]:
+        """Returns the service path, UUID and flags of the characteristic at the given path"""
+        if char_path not in self._characteristic_paths:
+            return None
+        service_path, uuid = self._characteristic_paths[char_path]
+        return (service_path, uuid, self._characteristics[service_path][char_path][1])
+
+    def find_characteristics(self, service_path) -> Dict[str, Tuple[str, List[str]]]:
+        """Returns the UUID and flags of every characteristic of the given service by path"""
+        return self._characteristics.get(service_path, {})
+
+    def find_characteristic(
+        self, device_path, service_uuid, char_uuid
+    ) -> Optional[Tuple[str, List[str]]]:
+        """
+        Returns the path and flags of the first characteristic with the given UUID in the first
+        service with the given UUID of the given device
+        """
+        service_path = self.find_service(device_path, service_uuid)
+        if service_path is None:
+            return None
+        paths = self._characteristic_uuids.get(service_path, {}).get(char_uuid)
+        if not paths:
+            return None
+        return (paths[0], self._characteristics[service_path][paths[0]][1])
+
+
 class BtMgr(threading.Thread):
     """
     Class that manages all bluetooth API functionality
@@ -49,6 +180,7 @@ class BtMgr(threading.Thread):
 
         self.devices: Dict[str, Device] = {}
         self.objects = {}
+        self.gatt_index = GattIndex()
         self.manager: ProxyInterface = None
         self.adapter: ProxyInterface = None
 
@@ -76,33 +208,93 @@ class BtMgr(threading.Thread):
         self.logger.info("Stopping Discovery")
         await self.adapter.call_stop_discovery()
 
+    def register_gatt_index_signals(self):
+        """
+        Index the GATT objects known so far and keep the index up to date from the object
+        manager's signals
+        """
+        self.gatt_index.rebuild(self.objects)
+        self.manager.on_interfaces_added(self.interfaces_added)
+        self.manager.on_interfaces_removed(self.interfaces_removed)
+
+    def find_managed_device(self, path) -> Optional["Device"]:
+        """
+        Returns the managed (connected) device that owns the object at the given path
+        """
+        for device in self.devices.values():
+            if path.startswith(device.get_path() + "/"):
+                return device
+        return None
+
+    async def interfaces_added(self, path, interfaces):
+        """
+        A callback when BlueZ adds interfaces to an object
+
+        Keeps the GATT index and the services of connected devices up to date
+        """
+        self.objects.setdefault(path, {}).update(interfaces)
+        self.gatt_index.add_object(path, interfaces)
+
+        device = self.find_managed_device(path)
+        if device is None or not device.services:
+            # Not built yet; 'build_device_services' will pick up the object
+            return
+
+        try:
+            if BT_SERVICE_IFACE in interfaces:
+                uuid = self.gatt_index.find_service_uuid(path)
+                if uuid and device.get_service_by_path(path) is None:
+                    await device.add_service(uuid, path)
+            if BT_CHARACTERISTIC_IFACE in interfaces:
+                entry = self.gatt_index.find_characteristic_by_path(path)
+                if entry is not None:
+                    service_path, uuid, flags = entry
+                    service = device.get_service_by_path(service_path)
+                    if service and service.get_characteristic_by_path(path) is None:
+                        await service.add_characteristic(uuid, path, flags)
+        except Exception as exception:
+            self.logger.error(
+                "Failed to add GATT object %s for device %s: %s",
+                path,
+                device.get_address(),
+                exception,
+            )
+
+    async def interfaces_removed(self, path, interfaces):
+        """
+        A callback when BlueZ removes interfaces from an object
+
+        Keeps the GATT index and the services of connected devices up to date
+        """
+        obj = self.objects.get(path)
+        if obj is not None:
+            for interface in interfaces:
+                obj.pop(interface, None)
+            if not obj:
+                del self.objects[path]
+        self.gatt_index.remove_object(path, interfaces)
+
+        device = self.find_managed_device(path)
+        if device is not None:
+            device.remove_gatt_object(path)
+
     async def find_service(self, device_path, service_uuid):
         """
         Returns a path to the service for the given device identified by the UUID
         """
-        for path, interfaces in self.objects.items():
-            if path.startswith(device_path):
-                service = interfaces.get(BT_SERVICE_IFACE)
-                if service and str(variant_to_python(service["UUID"])) == service_uuid:
-                    return path
-        return None
+        return self.gatt_index.find_service(device_path, service_uuid)
 
     async def find_characteristics(self, service_path):
         """
-        Returns an array of dictionaries containing the UUID and path for
+        Returns an array of dictionaries containing the UUID, path and flags for
         every characteristic associated with the given service
         """
-        chars_array = []
-        for path, interfaces in self.objects.items():
-            if path.startswith(service_path):
-                char = interfaces.get(BT_CHARACTERISTIC_IFACE)
-                if char:
-                    char_elements = {}
-                    char_elements["uuid"] = variant_to_python(char["UUID"])
-                    char_elements["path"] = path
-                    chars_array.append(char_elements)
-
-        return chars_array
+        return [
+            {"uuid": uuid, "path": path, "flags": flags}
+            for path, (uuid, flags) in self.gatt_index.find_characteristics(
+                service_path
+            ).items()
+        ]
 
     async def connect(self, address, device_path=""):
         """
@@ -110,6 +302,7 @@ class BtMgr(threading.Thread):
         """
         self.logger.info("Connecting to %s", address)
         self.objects = await self.manager.call_get_managed_objects()
+        self.gatt_index.rebuild(self.objects)
 
         success = False
         if device_path:
@@ -170,20 +363,28 @@ class BtMgr(threading.Thread):
         self.logger.info("Building services and characteristics for %s", address)
 
         try:
-            self.objects = await self.manager.call_get_managed_objects()
-
             device = self.devices.get(address)
+            if device is not None and not self.gatt_index.has_device(device.get_path()):
+                # Nothing indexed for the device yet, so resync with BlueZ
+                self.objects = await self.manager.call_get_managed_objects()
+                self.gatt_index.rebuild(self.objects)
+
             if device is not None:
                 uuids = await device.get_service_uuids()
                 for uuid in uuids:
-                    service_path = await self.find_service(device.get_path(), uuid)
-                    if service_path:
-                        await device.add_service(uuid, service_path)
-                        service = device.get_service(uuid)
+                    # Several services may share the UUID, so add every one of them
+                    for service_path in list(
+                        self.gatt_index.find_services(device.get_path(), uuid)
+                    ):
+                        if device.get_service_by_path(service_path) is not None:
+                            continue
+                        service = await device.add_service(uuid, service_path)
 
                         chars_array = await self.find_characteristics(service_path)
                         for char in chars_array:
-                            await service.add_characteristic(char["uuid"], char["path"])
+                            await service.add_characteristic(
+                                char["uuid"], char["path"], char["flags"]
+                            )
         except Exception as exception:
             self.logger.error(
                 "Failed to build services for device %s: %s", address, exception
@@ -248,6 +449,20 @@ class BtMgr(threading.Thread):
 
         return value
 
+    async def read_characteristics(
+        self, address, characteristics: List[Tuple[str, str]]
+    ) -> list:
+        """
+        Read the given (service UUID, characteristic UUID) pairs of the given device in one
+        batch. Returns the values in the same order, with None for every failed read.
+        """
+        return await asyncio.gather(
+            *(
+                self.read_characteristic(address, service_uuid, char_uuid)
+                for service_uuid, char_uuid in characteristics
+            )
+        )
+
     async def write_characteristic(
         self, address, service_uuid, char_uuid, value, offset=0
     ):
@@ -295,6 +510,17 @@ class BtMgr(threading.Thread):
                 exception,
             )
 
+    async def write_characteristics(
+        self, address, characteristics: List[Tuple[str, str, bytearray]]
+    ):
+        """
+        Write the given (service UUID, characteristic UUID, value) entries of the given device
+        in one batch. The writes are issued one at a time, in the given order, because BlueZ
+        rejects a WriteValue that overlaps another one with 'InProgress'.
+        """
+        for service_uuid, char_uuid, value in characteristics:
+            await self.write_characteristic(address, service_uuid, char_uuid, value)
+
     async def configure_characteristic_notification(
         self, address, service_uuid, char_uuid, enable
     ):
@@ -423,6 +649,7 @@ async def create_bt_mgr(
 
     # Register signal handlers
     bt_mgr.manager.on_interfaces_added(discovery_callback)
+    bt_mgr.register_gatt_index_signals()
 
     # Power on the bluetooth module
     await bt_mgr.adapter.set_powered(True)
@@ -452,6 +679,7 @@ class Device:
         self.connection_callback = connection_callback
         self.write_notification_callback = write_notification_callback
         self.services: list[Service] = []
+        self.services_by_uuid: Dict[str, Service] = {}
 
         self.path = path
         self.properties_signal = None
@@ -505,18 +733,48 @@ class Device:
             self.characteristic_property_change_callback,
         )
         self.services.append(service)
+        self.services_by_uuid.setdefault(uuid, service)
+        return service
 
     def get_service(self, uuid):
         """
-        Returns the device service matching the UUID
+        Returns the first device service matching the UUID
+        None if the service is not found
+        """
+        return self.services_by_uuid.get(uuid)
+
+    def get_service_by_path(self, path):
+        """
+        Returns the device service at the given path
         None if the service is not found
         """
         for service in self.services:
-            if service.get_uuid() == uuid:
+            if service.path == path:
                 return service
 
         return None
 
+    def remove_gatt_object(self, path):
+        """
+        Forget the service or characteristic at the given path, which BlueZ removed
+        """
+        for service in self.services:
+            if service.path == path:
+                service.disconnect_signal()
+                self.services.remove(service)
+                uuid = service.get_uuid()
+                if self.services_by_uuid.get(uuid) is service:
+                    # Fall back to the next service with the same UUID, if any
+                    del self.services_by_uuid[uuid]
+                    for other in self.services:
+                        if other.get_uuid() == uuid:
+                            self.services_by_uuid[uuid] = other
+                            break
+                return
+            if path.startswith(service.path + "/"):
+                service.remove_characteristic(path)
+                return
+
     async def get_services(self):
         """
         Returns a dictionary of dictionaries including each device's service
@@ -681,32 +939,60 @@ class Service:
         self.property_change_callback = property_change_callback
         self.write_notification_callback = write_notification_callback
         self.characteristics = []
+        self.characteristics_by_uuid: Dict[str, Characteristic] = {}
 
         self.object: ProxyObject = None
         self.interface: ProxyInterface = None
         self.properties: ProxyInterface = None
         self.properties_signal = None
 
-    async def add_characteristic(self, uuid, path):
+    async def add_characteristic(self, uuid, path, flags=None):
         char = await create_characteristic(
             uuid,
             path,
             self.write_characteristic_notification_callback,
             self.characteristic_property_change_callback,
+            flags,
         )
         self.characteristics.append(char)
+        self.characteristics_by_uuid.setdefault(uuid, char)
 
     def get_characteristic(self, uuid):
         """
-        Returns the service characteristic matching the UUID
+        Returns the first service characteristic matching the UUID
+        None if the characteristic is not found
+        """
+        return self.characteristics_by_uuid.get(uuid)
+
+    def get_characteristic_by_path(self, path):
+        """
+        Returns the service characteristic at the given path
         None if the characteristic is not found
         """
         for char in self.characteristics:
-            if char.get_uuid() == uuid:
+            if char.path == path:
                 return char
 
         return None
 
+    def remove_characteristic(self, path):
+        """
+        Forget the characteristic at the given path, which BlueZ removed
+        """
+        for char in self.characteristics:
+            if char.path == path:
+                char.disconnect_signal()
+                self.characteristics.remove(char)
+                uuid = char.get_uuid()
+                if self.characteristics_by_uuid.get(uuid) is char:
+                    # Fall back to the next characteristic with the same UUID, if any
+                    del self.characteristics_by_uuid[uuid]
+                    for other in self.characteristics:
+                        if other.get_uuid() == uuid:
+                            self.characteristics_by_uuid[uuid] = other
+                            break
+                return
+
     async def get_characteristics(self):
         """
         Returns an array of dictionaries including each service's characteristic
@@ -785,13 +1071,19 @@ class Characteristic:
     """
 
     def __init__(
-        self, uuid, path, property_change_callback, write_notification_callback=None
+        self,
+        uuid,
+        path,
+        property_change_callback,
+        write_notification_callback=None,
+        flags=None,
     ):
         self.logger = logging.getLogger(__name__)
         self.uuid = uuid
         self.path = path
         self.property_change_callback = property_change_callback
         self.write_notification_callback = write_notification_callback
+        self.flags = flags
 
         self.object: ProxyObject = None
         self.interface: ProxyInterface = None
@@ -808,7 +1100,9 @@ class Characteristic:
         """
         Returns all of the characteristic flags
         """
-        return variant_to_python(await self.interface.get_flags())
+        if self.flags is None:
+            self.flags = variant_to_python(await self.interface.get_flags())
+        return self.flags
 
     async def is_notifying(self):
         """
@@ -899,13 +1193,13 @@ class Characteristic:
 
 
 async def create_characteristic(
-    uuid, path, property_change_callback, write_notification_callback=None
+    uuid, path, property_change_callback, write_notification_callback=None, flags=None
 ) -> Characteristic:
     """
     Async wrapper to create a Characteristic object
     """
     characteristic = Characteristic(
-        uuid, path, property_change_callback, write_notification_callback
+        uuid, path, property_change_callback, write_notification_callback, flags
     )
 
     bus = await DBusManager().get_bus()
@@ -991,6 +1285,15 @@ async def bt_read_characteristic(bt, address, service_uuid, char_uuid):
         await bt.read_characteristic(address, service_uuid, char_uuid)
 
 
+async def bt_read_characteristics(bt, address, characteristics):
+    """
+    Read the given (service UUID, characteristic UUID) pairs of the given device in one batch
+    Values are returned in the 'characteristic_property_change_callback'
+    """
+    if bt:
+        await bt.read_characteristics(address, characteristics)
+
+
 async def bt_write_characteristic(bt, address, service_uuid, char_uuid, value):
     """
     Write a value to the given characteristic for the given device/service
@@ -1000,6 +1303,16 @@ async def bt_write_characteristic(bt, address, service_uuid, char_uuid, value):
         await bt.write_characteristic(address, service_uuid, char_uuid, value)
 
 
+async def bt_write_characteristics(bt, address, characteristics):
+    """
+    Write the given (service UUID, characteristic UUID, value) entries of the given device in
+    one batch
+    The values are arrays of bytes
+    """
+    if bt:
+        await bt.write_characteristics(address, characteristics)
+
+
 async def bt_config_characteristic_notification(
     bt, address, service_uuid, char_uuid, enable
 ):
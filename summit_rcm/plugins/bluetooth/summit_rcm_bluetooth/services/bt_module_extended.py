@@ -14,6 +14,7 @@ from dbus_fast import DBusError
 from summit_rcm.dbus_manager import DBusManager
 from summit_rcm_bluetooth.services.bt_module import (
     BtMgr,
+    GattIndex,
     DBUS_OBJ_MGR_IFACE,
     BT_OBJ,
     BT_ADAPTER_IFACE,
@@ -43,6 +44,8 @@ class BtMgrEx(BtMgr):
         self.throw_exceptions = throw_exceptions
 
         self.devices = {}
+        self.objects = {}
+        self.gatt_index = GattIndex()
 
         # Call base constructor
         super(BtMgr, self).__init__(**kwargs)
@@ -89,6 +92,7 @@ async def create_bt_mgr_ex(
 
     # Register signal handlers
     bt_mgr_ex.manager.on_interfaces_added(discovery_callback)
+    bt_mgr_ex.register_gatt_index_signals()
 
     # Power on the bluetooth module
     await bt_mgr_ex.adapter.set_powered(True)
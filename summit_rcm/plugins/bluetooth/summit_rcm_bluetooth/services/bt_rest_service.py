@@ -9,7 +9,6 @@ import falcon.asgi
 from summit_rcm import definition
 from summit_rcm_bluetooth.services.ble import (
     ADAPTER_IFACE,
-    BLUEZ_SERVICE_NAME,
     DEVICE_IFACE,
     find_device,
     find_devices,
@@ -24,6 +23,7 @@ from summit_rcm_bluetooth.services.bt import (
     get_controller_obj,
     lower_camel_case,
 )
+from summit_rcm_bluetooth.services.bluez_object_cache import BluezObjectCache
 from summit_rcm.dbus_manager import DBusManager
 
 
@@ -100,10 +100,8 @@ class BluetoothRESTService:
             for controller_friendly_name, controller in controllers:
                 controller_result = {}
                 try:
-                    controller_obj = bus.get_proxy_object(
-                        BLUEZ_SERVICE_NAME,
-                        controller,
-                        await bus.introspect(BLUEZ_SERVICE_NAME, controller),
+                    controller_obj = await BluezObjectCache().get_proxy_object(
+                        bus, controller
                     )
                 except Exception:
                     if is_legacy:
@@ -286,11 +284,7 @@ class BluetoothRESTService:
                     )
                     return
 
-                device_obj = bus.get_proxy_object(
-                    BLUEZ_SERVICE_NAME,
-                    device,
-                    await bus.introspect(BLUEZ_SERVICE_NAME, device),
-                )
+                device_obj = await BluezObjectCache().get_proxy_object(bus, device)
                 device_interface = device_obj.get_interface(DEVICE_IFACE)
 
                 if command:
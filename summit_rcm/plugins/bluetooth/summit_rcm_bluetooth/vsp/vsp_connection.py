@@ -10,7 +10,8 @@ a TCP socket connection.
 import asyncio
 import logging
 from syslog import LOG_WARNING, syslog, LOG_INFO, LOG_ERR
-from typing import Optional, Tuple, List, Dict
+import time
+from typing import Optional, Set, Tuple, List, Dict
 import dbus_fast
 from dbus_fast.aio.proxy_object import ProxyInterface, ProxyObject
 from summit_rcm_bluetooth.services.ble import (
@@ -36,6 +37,92 @@ MAX_RECV_LEN = 512
 """ Maximum bytes to read over TCP"""
 DEFAULT_WRITE_SIZE = 1
 """ Default GATT write size """
+DEFAULT_WRITE_WINDOW = 1
+""" Default maximum number of GATT writes in flight """
+
+
+class VspRingBuffer:
+    """
+    Fixed-capacity ring buffer holding data received over TCP until it can be written out via
+    GATT. Data is copied into a preallocated bytearray through a memoryview, so buffering never
+    reallocates or shifts the data that is still pending.
+    """
+
+    def __init__(self, capacity: int):
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        """Number of bytes that can be written before the buffer is full"""
+        return self._capacity - self._size
+
+    def write(self, data: bytes) -> int:
+        """
+        Copy as much of the given data as fits into the buffer and return the number of bytes
+        copied
+        """
+        count = min(len(data), self.free)
+        tail = (self._head + self._size) % self._capacity
+        first = min(count, self._capacity - tail)
+        self._view[tail : tail + first] = data[:first]
+        if count > first:
+            self._view[: count - first] = data[first:count]
+        self._size += count
+        return count
+
+    def read(self, size: int) -> bytes:
+        """Remove and return up to the given number of bytes from the buffer"""
+        count = min(size, self._size)
+        first = min(count, self._capacity - self._head)
+        if count > first:
+            data = bytes(self._view[self._head :]) + bytes(self._view[: count - first])
+        else:
+            data = bytes(self._view[self._head : self._head + count])
+        self._head = (self._head + count) % self._capacity
+        self._size -= count
+        return data
+
+
+class VspConnectionStats:
+    """Throughput and backpressure counters for a VSP connection"""
+
+    def __init__(self):
+        self.started: float = time.monotonic()
+        self.bytes_received: int = 0
+        """Bytes received from the TCP client"""
+        self.bytes_sent: int = 0
+        """Bytes written to the GATT write characteristic"""
+        self.bytes_notified: int = 0
+        """Bytes received from the GATT read characteristic"""
+        self.writes: int = 0
+        self.write_failures: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.backpressure_waits: int = 0
+        """Number of times a chunk had to wait for the GATT write window to open"""
+        self.buffer_high_water: int = 0
+
+    def to_dict(self) -> dict:
+        elapsed = time.monotonic() - self.started
+        return {
+            "bytesReceived": self.bytes_received,
+            "bytesSent": self.bytes_sent,
+            "bytesNotified": self.bytes_notified,
+            "writes": self.writes,
+            "writeFailures": self.write_failures,
+            "inFlight": self.in_flight,
+            "maxInFlight": self.max_in_flight,
+            "backpressureWaits": self.backpressure_waits,
+            "bufferHighWater": self.buffer_high_water,
+            "txThroughput": round(self.bytes_sent / elapsed, 1) if elapsed > 0 else 0.0,
+        }
 
 
 class VspConnection:
@@ -62,9 +149,11 @@ class VspConnection:
         self._logger = logging.getLogger(__name__)
         self.auth_failure_unpair = False
         self.write_size: int = DEFAULT_WRITE_SIZE
+        self.write_window: int = DEFAULT_WRITE_WINDOW
         self.device_uuid = device_uuid
         self.on_connection_closed = on_connection_closed
-        self.rx_buffer: list = []
+        self.rx_buffer: Optional[VspRingBuffer] = None
+        self.stats = VspConnectionStats()
         self.server: Optional[asyncio.Server] = None
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
@@ -167,6 +256,7 @@ class VspConnection:
     def gatt_vsp_read_val_cb(self, value):
         try:
             if self.connected and self.writer:
+                self.stats.bytes_notified += len(value)
                 self.writer.write(
                     f'{{"Received": "0x{value.hex()}"}}\n'.encode()
                     if self.socket_rx_type
@@ -249,7 +339,7 @@ class VspConnection:
             if self.vsp_write_chrc and len(self.vsp_write_chrc):
                 try:
                     await self.vsp_write_chrc[1].call_write_value(
-                        bytearray(data),
+                        data,
                         (
                             {"type": dbus_fast.Variant("s", self.vsp_write_chr_type)}
                             if self.vsp_write_chr_type
@@ -264,6 +354,33 @@ class VspConnection:
             syslog(LOG_ERR, f"VSP: gatt_send_data error: {str(exception)}")
             return False
 
+    async def gatt_send_chunk(self, data: bytes, write_window: asyncio.Semaphore):
+        """
+        Send the given chunk of TCP data out via GATT and release its slot in the write window
+        once the write completes
+        """
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        try:
+            success: bool = await self.gatt_send_data(data)
+        finally:
+            self.stats.in_flight -= 1
+            write_window.release()
+
+        if success:
+            self.stats.writes += 1
+            self.stats.bytes_sent += len(data)
+            return
+
+        # If the GATT Tx wasn't successful and the socket is configured for 'JSON', send a
+        # notification to the TCP client.
+        self.stats.write_failures += 1
+        if (
+            self.writer
+            and self.socket_rx_type == VSPSocketRxTypeEnum.BLE_VSP_SOCKET_RX_TYPE_JSON
+        ):
+            self.writer.write('{"Error": "Transmit failed"}\n'.encode())
+
     async def process_vsp_service(
         self,
         service_path,
@@ -343,6 +460,13 @@ class VspConnection:
                     raise ValueError
             except ValueError:
                 return "invalid value for vspWriteChrSize param"
+        if "vspWriteWindow" in params:
+            try:
+                self.write_window = int(params["vspWriteWindow"])
+                if self.write_window < 1:
+                    raise ValueError
+            except ValueError:
+                return "invalid value for vspWriteWindow param"
         if "vspWriteChrType" in params:
             try:
                 self.vsp_write_chr_type = BLEWriteCharacteristicType(
@@ -520,6 +644,12 @@ class VspConnection:
         self.reader = reader
         self.writer = writer
 
+        # Every full chunk is taken out of the Rx buffer before the next read, so it only ever
+        # has to hold a partial chunk plus one read's worth of data
+        self.rx_buffer = VspRingBuffer(self.write_size + MAX_RECV_LEN)
+        write_window = asyncio.Semaphore(self.write_window)
+        pending_writes: Set[asyncio.Task] = set()
+
         self.connected = True
         try:
             while self.connected:
@@ -527,35 +657,42 @@ class VspConnection:
                 await writer.drain()
 
                 # Read some data
-                data = await reader.read(self.write_size)
+                data = await reader.read(min(MAX_RECV_LEN, self.rx_buffer.free))
                 if not data:
                     # When read() returns 0 bytes this indicates that the TCP client socket was
                     # closed
                     syslog(f"VSP: closing TCP client socket {addr!r}")
                     self.connected = False
+                    break
 
                 # Add the incoming data to the Rx buffer
-                self.rx_buffer += data
-                if len(self.rx_buffer) < self.write_size:
-                    # Not enough data to transmit
-                    continue
-
-                # Send the data out via GATT
-                success: bool = await self.gatt_send_data(
-                    self.rx_buffer[: self.write_size]
+                self.rx_buffer.write(data)
+                self.stats.bytes_received += len(data)
+                self.stats.buffer_high_water = max(
+                    self.stats.buffer_high_water, len(self.rx_buffer)
                 )
 
-                # Update the Rx buffer to remove the now-sent chunk of data
-                self.rx_buffer = self.rx_buffer[self.write_size :]
-
-                # If the GATT Tx wasn't successful and the socket is configured for 'JSON', send a
-                # notification to the TCP client.
-                if not success and self.socket_rx_type == "JSON":
-                    writer.write('{"Error": "Transmit failed"}\n'.encode())
+                # Send every full chunk out via GATT, keeping at most 'write_window' writes in
+                # flight. Writes are issued in order, so BlueZ receives the chunks in order.
+                while len(self.rx_buffer) >= self.write_size:
+                    if write_window.locked():
+                        self.stats.backpressure_waits += 1
+                    await write_window.acquire()
+                    task = asyncio.create_task(
+                        self.gatt_send_chunk(
+                            self.rx_buffer.read(self.write_size), write_window
+                        )
+                    )
+                    pending_writes.add(task)
+                    task.add_done_callback(pending_writes.discard)
         except Exception as exception:
             syslog(f"VSP: server_socket_event_handler error - {str(exception)}")
             self.connected = False
 
+        # Let any writes still in flight finish
+        if pending_writes:
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+
         # Perform any cleanup
         try:
             writer.close()
@@ -645,7 +782,11 @@ class VspConnectionPlugin(BluetoothPlugin):
         if command == "gattList":
             processed = True
             result["GattConnections"] = [
-                {"device": k, "port": self.vsp_connections[k].port}
+                {
+                    "device": k,
+                    "port": self.vsp_connections[k].port,
+                    "stats": self.vsp_connections[k].stats.to_dict(),
+                }
                 for k in self.vsp_connections.keys()
             ]
         return processed, error_message, result
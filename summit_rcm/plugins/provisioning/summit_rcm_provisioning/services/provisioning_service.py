@@ -5,6 +5,7 @@
 """Service Module to handle provisioning"""
 
 import asyncio
+from collections import OrderedDict
 from datetime import datetime
 import os
 from enum import IntEnum
@@ -48,7 +49,8 @@ except ImportError as error:
 OPENSSL_CERT_DATETIME_FORMAT = "%b %d %H:%M:%S %Y %Z"
 TOUCH_TIMESTAMP_FORMAT = "%Y%m%d%H%M.%S"
 FALLBACK_TIMESTAMP_FILE_PATH = "/etc/fallback_timestamp"
-CLIENT_CERT_TEMP_PATH = "/tmp/client.crt"
+CLIENT_CERT_VALIDITY_CACHE_SIZE = 32
+""" Maximum number of client certificates whose validity periods are cached """
 
 
 class ProvisioningState(IntEnum):
@@ -69,6 +71,10 @@ class CertificateProvisioningService:
     Manage device server key/certificate provisioning
     """
 
+    # (certificate, (not before, not after)) of recently seen client certificates, keyed by
+    # certificate hash. The certificate itself is kept to guard against hash collisions.
+    _client_cert_validity_cache: OrderedDict = OrderedDict()
+
     @staticmethod
     def parse_datetime_from_openssl_str(datetime_str: str) -> datetime:
         """Parse the given OpenSSL format date/time string into a datetime object"""
@@ -82,7 +88,8 @@ class CertificateProvisioningService:
         req: falcon.asgi.Request,
     ) -> Tuple[datetime, datetime]:
         """
-        Retrieve the validity period from the client's certificate using the falcon.request.scope
+        Retrieve the validity period from the client's certificate using the falcon.request.scope.
+        The certificate is parsed in memory and the result is cached by certificate hash.
         """
         if (
             not req.scope.get("extensions", None)
@@ -92,17 +99,18 @@ class CertificateProvisioningService:
         ):
             raise Exception("Could not read client certificate validity period")
 
-        with open(CLIENT_CERT_TEMP_PATH, "wb") as client_cert:
-            client_cert.write(
-                str(req.scope["extensions"]["tls"]["client_cert_chain"][0]).encode(
-                    "utf-8"
-                )
-            )
-
-        cert_info = openssl_extension.get_cert_info(CLIENT_CERT_TEMP_PATH, "")
-        Path(CLIENT_CERT_TEMP_PATH).unlink(missing_ok=True)
+        client_cert = str(req.scope["extensions"]["tls"]["client_cert_chain"][0])
+        cert_hash = CertificateProvisioningService.get_client_cert_hash(req)
+        cache = CertificateProvisioningService._client_cert_validity_cache
+        cached = cache.get(cert_hash, None)
+        if cached is not None and cached[0] == client_cert:
+            cache.move_to_end(cert_hash)
+            return cached[1]
 
-        return (
+        cert_info = openssl_extension.get_cert_info_from_buffer(
+            client_cert.encode("utf-8"), ""
+        )
+        validity_period = (
             CertificateProvisioningService.parse_datetime_from_openssl_str(
                 cert_info.get("not_before", None)
             ),
@@ -111,6 +119,12 @@ class CertificateProvisioningService:
             ),
         )
 
+        cache[cert_hash] = (client_cert, validity_period)
+        cache.move_to_end(cert_hash)
+        while len(cache) > CLIENT_CERT_VALIDITY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return validity_period
+
     @staticmethod
     def get_client_cert_hash(req: falcon.asgi.Request) -> int:
         """
@@ -24,6 +24,7 @@ from summit_rcm.services.files_service import (
     CONFIG_TMP_ARCHIVE_FILE,
     NETWORKMANAGER_DIR_FULL,
 )
+from summit_rcm.utils import prime_async_iterator
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -264,38 +265,28 @@ class FileManage:
                 return
 
             try:
-                success, msg, archive = FilesService.export_logs(password)
-                if not success:
-                    raise Exception(msg)
-
-                resp.stream = await FilesService.handle_file_download(archive)
+                resp.stream = await prime_async_iterator(
+                    FilesService.stream_logs_archive(password)
+                )
                 resp.content_type = falcon.MEDIA_TEXT
                 resp.status = falcon.HTTP_200
                 syslog("System log zipped for user")
             except Exception as exception:
                 syslog(f"Could not export log data - {str(exception)}")
                 resp.status = falcon.HTTP_500
-            finally:
-                if os.path.isfile(archive):
-                    os.unlink(archive)
             return
 
         elif type == "debug":
             try:
-                success, msg, archive = FilesService.export_debug()
-                if not success:
-                    raise Exception(msg)
-
-                resp.stream = await FilesService.handle_file_download(archive)
+                resp.stream = await prime_async_iterator(
+                    FilesService.stream_debug_archive()
+                )
                 resp.content_type = falcon.MEDIA_TEXT
                 resp.status = falcon.HTTP_200
                 syslog("Configuration and system log zipped/encrypted for user")
             except Exception as exception:
                 syslog(f"Could not export debug info - {str(exception)}")
                 resp.status = falcon.HTTP_500
-            finally:
-                if os.path.isfile(archive):
-                    os.unlink(archive)
             return
         else:
             syslog(f"FileManage GET - unknown file type {type}")
@@ -398,16 +389,13 @@ class FilesManage:
                 return
 
             try:
-                success, msg, archive = FilesService.export_connections(password)
-                if not success:
-                    raise Exception(msg)
-
-                resp.stream = await FilesService.handle_file_download(archive)
+                resp.stream = await prime_async_iterator(
+                    FilesService.stream_connections_archive(password)
+                )
                 resp.content_type = falcon.MEDIA_TEXT
             except Exception as exception:
                 syslog(LOG_ERR, f"Could not export connections - {str(exception)}")
                 resp.status = falcon.HTTP_500
-            os.unlink(archive)
             return
         else:
             files = FilesService.get_files_by_type(type)
@@ -6,6 +6,7 @@
 Module to handle log configuration for legacy routes
 """
 
+import json
 import os
 from syslog import LOG_ERR, syslog
 import falcon.asgi
@@ -25,12 +26,15 @@ from summit_rcm.rest_api.services.spectree_service import (
 from summit_rcm.definition import (
     DriverLogLevelEnum,
     JournalctlLogTypesEnum,
+    JournalLogStreamFormatEnum,
     SupplicantLogLevelEnum,
 )
 from summit_rcm.services.logs_service import (
     JournalctlError,
 )
+from summit_rcm.utils import prime_async_iterator
 from summit_rcm.rest_api.services.rest_logs_service import (
+    MEDIA_NDJSON,
     RESTLogsService as LogsService,
 )
 
@@ -115,15 +119,59 @@ class LogData:
             )
             resp.media = {"SDCERR": 1, "InfoMsg": "days must be an int"}
             return
+        try:
+            limit = req.params.get("limit", None)
+            limit = int(limit) if limit is not None else None
+        except Exception as exception:
+            syslog(
+                LOG_ERR,
+                f"Error parsing 'limit' parameter as an integer: {str(exception)}",
+            )
+            resp.media = {"SDCERR": 1, "InfoMsg": "limit must be an int"}
+            return
+        try:
+            stream = req.params.get("stream", None)
+            stream = JournalLogStreamFormatEnum(stream) if stream is not None else None
+        except Exception as exception:
+            syslog(
+                LOG_ERR,
+                f"Error parsing 'stream' parameter: {str(exception)}",
+            )
+            resp.media = {"SDCERR": 1, "InfoMsg": "Invalid stream format"}
+            return
 
         try:
-            logs = await LogsService.get_journal_log_data(
-                log_type=typ, priority=priority, days=days
+            entries = LogsService.iter_journal_log_data(
+                log_type=typ,
+                priority=priority,
+                days=days,
+                limit=limit,
+                cursor=req.params.get("cursor", None),
+                after_cursor=req.params.get("afterCursor", None),
+                include_cursor=True,
             )
             result["InfoMsg"] = f"type: {typ}; days: {days}; Priority: {priority}"
-            result["count"] = len(logs)
-            result["log"] = logs
-            resp.media = result
+
+            if stream is None:
+                logs = [entry async for entry in entries]
+                result["count"] = len(logs)
+                result["log"] = logs
+                resp.media = result
+            elif stream == JournalLogStreamFormatEnum.NDJSON:
+                resp.stream = LogsService.encode_journal_log_stream(
+                    await prime_async_iterator(entries), stream
+                )
+                resp.content_type = MEDIA_NDJSON
+            else:
+                # Stream the legacy envelope with the log entries in place and the count last
+                resp.stream = LogsService.encode_journal_log_stream(
+                    await prime_async_iterator(entries),
+                    stream,
+                    prefix=json.dumps(result).encode("utf-8")[:-1] + b', "log": ',
+                    suffix=lambda count: f', "count": {count}}}'.encode("utf-8"),
+                )
+        except ValueError as error:
+            resp.media = {"SDCERR": 1, "InfoMsg": str(error)}
         except JournalctlError as error:
             syslog(
                 LOG_ERR,
@@ -19,6 +19,7 @@ from summit_rcm.rest_api.services.spectree_service import (
 from summit_rcm.definition import SUMMIT_RCM_ERRORS, USER_PERMISSION_TYPES
 from summit_rcm.services.user_service import UserService
 from summit_rcm.services.login_service import LoginService, Session
+from summit_rcm.services.password_service import PasswordServiceBusyError
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -64,6 +65,7 @@ class UserManage:
             HTTP_200=UpdateUserResponseModelLegacy,
             HTTP_401=UnauthorizedErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
+            HTTP_503=UpdateUserResponseModelLegacy,
         ),
         security=SpectreeService().security,
         tags=[login_tag],
@@ -93,8 +95,16 @@ class UserManage:
 
         if new_password:
             current_password = post_data.get("current_password", None)
-            if UserService.verify(username, current_password):
-                if UserService.update_password(username, new_password):
+            try:
+                verified = await UserService.verify(username, current_password)
+            except PasswordServiceBusyError:
+                result["InfoMsg"] = "too many password verifications in progress"
+                resp.status = falcon.HTTP_503
+                resp.media = result
+                return
+
+            if verified:
+                if await UserService.update_password(username, new_password):
                     result["SDCERR"] = SUMMIT_RCM_ERRORS.get("SDCERR_SUCCESS")
                     # Redirect is required when the default password is updated
                     default_username = (
@@ -170,7 +180,7 @@ class UserManage:
             UserService.get_number_of_users()
             < SystemSettingsManage.get_max_web_clients()
         ):
-            if UserService.add_user(username, password, permission):
+            if await UserService.add_user(username, password, permission):
                 result["SDCERR"] = SUMMIT_RCM_ERRORS.get("SDCERR_SUCCESS")
                 result["InfoMsg"] = "User added"
             else:
@@ -211,7 +221,7 @@ class UserManage:
             result["InfoMsg"] = f"unable to remove {default_username} user"
         elif not UserService.user_exists(username):
             result["InfoMsg"] = f"user {username} not found"
-        elif UserService.delete_user(username):
+        elif await UserService.delete_user(username):
             result["SDCERR"] = SUMMIT_RCM_ERRORS.get("SDCERR_SUCCESS")
             result["InfoMsg"] = "User deleted"
 
@@ -251,6 +261,7 @@ class LoginManage:
             HTTP_200=LoginResponseModelLegacy,
             HTTP_401=UnauthorizedErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
+            HTTP_503=LoginResponseModelLegacy,
         ),
         tags=[login_tag],
         deprecated=True,
@@ -291,9 +302,9 @@ class LoginManage:
                 if not session_id:
                     raise Exception("Malformed cookie")
 
-                if not UserService.verify(username=username, password=password):
+                if not await UserService.verify(username=username, password=password):
                     # Provided username and password are incorrect
-                    LoginService().login_failed(username)
+                    LoginService().login_failed(username, password)
                     result["InfoMsg"] = "unable to verify user/password"
 
                     LoginService().remove_invalid_session(session_id)
@@ -308,7 +319,7 @@ class LoginManage:
                 if (
                     username == LoginService().default_username
                     and password == LoginService().default_password
-                    and UserService.verify(
+                    and await UserService.verify(
                         LoginService().default_username,
                         LoginService().default_password,
                     )
@@ -339,7 +350,7 @@ class LoginManage:
                 # Default login
                 default_login = True
                 if not UserService.get_number_of_users():
-                    UserService.add_user(
+                    await UserService.add_user(
                         username,
                         password,
                         " ".join(USER_PERMISSION_TYPES["UserPermissionTypes"]),
@@ -357,10 +368,10 @@ class LoginManage:
 
             if not (
                 default_login
-                or UserService.verify(username=username, password=password)
+                or await UserService.verify(username=username, password=password)
             ):
                 # Provided username and password are incorrect
-                LoginService().login_failed(username)
+                LoginService().login_failed(username, password)
                 result["InfoMsg"] = "unable to verify user/password"
                 resp.context.valid_session = False
                 resp.media = result
@@ -392,7 +403,7 @@ class LoginManage:
             if (
                 username == LoginService().default_username
                 and password == LoginService().default_password
-                and UserService.verify(
+                and await UserService.verify(
                     LoginService().default_username,
                     LoginService().default_password,
                 )
@@ -403,6 +414,14 @@ class LoginManage:
             result["SDCERR"] = SUMMIT_RCM_ERRORS.get("SDCERR_SUCCESS")
             syslog(f"User {username} logged in")
 
+        except PasswordServiceBusyError:
+            result = {
+                "SDCERR": SUMMIT_RCM_ERRORS.get("SDCERR_FAIL", 1),
+                "REDIRECT": 0,
+                "PERMISSION": "",
+                "InfoMsg": "Too many login requests in progress",
+            }
+            resp.status = falcon.HTTP_503
         except Exception as exception:
             syslog(f"Error while processing login request - {str(exception)}")
             result = {
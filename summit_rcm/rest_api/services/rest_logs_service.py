@@ -6,7 +6,10 @@
 Module to handle interfacing with logs for the REST API
 """
 
+import json
 import os
+from syslog import LOG_ERR, syslog
+from typing import AsyncIterator, Callable, Optional
 
 try:
     from uvicorn.config import LOG_LEVELS
@@ -15,10 +18,13 @@ except ImportError as error:
     if os.environ.get("DOCS_GENERATION") != "True":
         raise error
     LOG_LEVELS = {}
+from summit_rcm.definition import JournalLogStreamFormatEnum
 from summit_rcm.services.logs_service import LogsService
 from summit_rcm.settings import ServerConfig, SystemSettingsManage
 from summit_rcm.utils import Singleton
 
+MEDIA_NDJSON = "application/x-ndjson"
+
 
 class RESTLogsService(LogsService, metaclass=Singleton):
     """Service to handle interfacing with logs for the REST API"""
@@ -54,3 +60,33 @@ class RESTLogsService(LogsService, metaclass=Singleton):
 
         ServerConfig().uvicorn_server.config.log_level = log_level
         ServerConfig().uvicorn_server.config.configure_logging()
+
+    @staticmethod
+    async def encode_journal_log_stream(
+        entries: AsyncIterator[dict],
+        stream_format: JournalLogStreamFormatEnum,
+        prefix: bytes = b"",
+        suffix: Optional[Callable[[int], bytes]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Encode the given journal log entries as they arrive, either as newline-delimited JSON or
+        as a single JSON array wrapped with the optional 'prefix' and 'suffix'. The 'suffix' is
+        built from the number of entries sent. Errors after the response has started can no
+        longer change the status, so they are logged and end the stream.
+        """
+        try:
+            if stream_format == JournalLogStreamFormatEnum.NDJSON:
+                async for entry in entries:
+                    yield json.dumps(entry).encode("utf-8") + b"\n"
+                return
+
+            yield prefix + b"["
+            count = 0
+            async for entry in entries:
+                yield (b"," if count else b"") + json.dumps(entry).encode("utf-8")
+                count += 1
+            yield b"]" + (suffix(count) if suffix else b"")
+        except Exception as exception:
+            syslog(LOG_ERR, f"Journal log stream ended early - {str(exception)}")
+        finally:
+            await entries.aclose()
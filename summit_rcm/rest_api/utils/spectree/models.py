@@ -13,9 +13,13 @@ from spectree import BaseFile
 
 from summit_rcm.definition import (
     DriverLogLevelEnum,
+    ExportJobStateEnum,
+    ExportTypeEnum,
     JournalctlLogTypesEnum,
+    JournalLogStreamFormatEnum,
     PowerStateEnum,
     SupplicantLogLevelEnum,
+    WifiBandEnum,
 )
 from summit_rcm.services.firmware_update_service import SummitRCMUpdateStatus
 from summit_rcm.services.network_manager_service import (
@@ -79,6 +83,12 @@ class InternalServerErrorResponseModel(BaseModel):
     __root__: None
 
 
+class ServiceUnavailableErrorResponseModel(BaseModel):
+    """Model for a 503 (Service Unavailable) error response"""
+
+    __root__: None
+
+
 class DefaultResponseModelLegacy(BaseModel):
     """Model for the default response (legacy)"""
 
@@ -252,6 +262,57 @@ class LogsExportRequestModel(BaseModel):
     password: str
 
 
+class ExportJobRequestModel(BaseModel):
+    """Model for an export job request"""
+
+    type: ExportTypeEnum
+    password: Optional[str] = Field(
+        description="Archive password (required for 'logs' and 'connections')"
+    )
+
+
+class ExportJobResponseModel(BaseModel):
+    """Model for an export job's status"""
+
+    id: str
+    type: ExportTypeEnum
+    state: ExportJobStateEnum
+    bytesWritten: int
+    elapsed: float
+    message: str
+
+
+class ExportJobsResponseModel(BaseModel):
+    """Model for a list of export jobs"""
+
+    __root__: List[ExportJobResponseModel]
+
+
+class StartupProfilePhaseModel(BaseModel):
+    """Model for the time taken by a startup phase"""
+
+    name: str
+    ms: float
+
+
+class StartupProfileImportModel(BaseModel):
+    """Model for the time taken to import a module during startup"""
+
+    name: str
+    cumulativeMs: float = Field(description="Time including the modules it imported")
+    selfMs: float = Field(description="Time excluding the modules it imported")
+
+
+class StartupProfileResponseModel(BaseModel):
+    """Model for the startup profile"""
+
+    enabled: bool
+    complete: bool = Field(description="Whether the server has started listening")
+    totalMs: float
+    phases: List[StartupProfilePhaseModel]
+    imports: List[StartupProfileImportModel]
+
+
 class LogsDataRequestQuery(BaseModel):
     """Model for log data request query"""
 
@@ -262,6 +323,18 @@ class LogsDataRequestQuery(BaseModel):
     )
     days: Optional[int] = Field(ge=0, default=1)
     type: Optional[JournalctlLogTypesEnum] = Field(default=JournalctlLogTypesEnum.ALL)
+    limit: Optional[int] = Field(ge=1, description="Maximum number of entries to return")
+    cursor: Optional[str] = Field(
+        description="Journal cursor of the first entry to return (overrides 'days')"
+    )
+    afterCursor: Optional[str] = Field(
+        description="Journal cursor of the entry just before the first entry to return "
+        "(overrides 'days')"
+    )
+    stream: Optional[JournalLogStreamFormatEnum] = Field(
+        description="Stream the entries as they are read, either as newline-delimited JSON "
+        "('ndjson') or as a chunked JSON array ('json')"
+    )
 
 
 class LogData(BaseModel):
@@ -271,6 +344,7 @@ class LogData(BaseModel):
     priority: str
     identifier: str
     message: str
+    cursor: Optional[str]
 
 
 class LogsDataResponseModel(BaseModel):
@@ -433,6 +507,19 @@ class ActiveAccessPointLegacy(BaseModel):
     Signal: Optional[float]
 
 
+class AccessPointsRequestQuery(BaseModel):
+    """Model for access points request query"""
+
+    minStrength: Optional[int] = Field(ge=0, le=100)
+    ssidPrefix: Optional[str]
+    band: Optional[WifiBandEnum]
+    sort: Optional[str] = Field(
+        description="Field to sort by (ssid, hwAddress, strength, maxBitrate, frequency, "
+        "lastSeen or security)"
+    )
+    order: Optional[str] = Field(default="asc", regex="^(asc|desc)$")
+
+
 class AccessPoints(BaseModel):
     """Model for an access points response"""
 
@@ -487,9 +574,50 @@ class CertificateInfoResponse(BaseModel):
     issuer: str
     not_before: str
     not_after: str
+    fingerprint: Optional[str] = Field(
+        description="SHA-256 fingerprint of the certificate"
+    )
     extensions: List[CertificateInfoExtension]
 
 
+class CertificateDetailsRequestQuery(BaseModel):
+    """Model for a certificate details request query"""
+
+    expiringWithinDays: Optional[int] = Field(
+        ge=0,
+        le=36500,
+        default=30,
+        description="Flag certificates that expire within this many days",
+    )
+
+
+class CertificateDetails(BaseModel):
+    """Model for the details of a certificate"""
+
+    name: str
+    subject: Optional[str]
+    issuer: Optional[str]
+    serialNumber: Optional[str]
+    notBefore: Optional[str]
+    notAfter: Optional[str]
+    fingerprint: Optional[str] = Field(
+        description="SHA-256 fingerprint of the certificate"
+    )
+    expired: bool
+    expiringSoon: bool = Field(
+        description="Whether the certificate expires within 'expiringWithinDays' days"
+    )
+    error: Optional[str] = Field(
+        description="Why the certificate could not be parsed (e.g., it requires a password)"
+    )
+
+
+class CertificateDetailsResponse(BaseModel):
+    """Model for a certificate details response"""
+
+    __root__: List[CertificateDetails]
+
+
 class CertificateInfoRequestQueryLegacy(BaseModel):
     """Model for a certificate info request query (legacy)"""
 
@@ -548,12 +676,23 @@ class FileInfoResponseModelLegacy(DefaultResponseModelLegacy):
 
 
 class ConnectionProfileInfo(BaseModel):
-    """Model for info about a connection profile"""
+    """
+    Model for info about a connection profile. Fields not requested via the 'fields' query
+    parameter are omitted.
+    """
 
-    id: str
-    uuid: str
-    type: str
-    activated: bool
+    id: Optional[str]
+    uuid: Optional[str]
+    type: Optional[str]
+    activated: Optional[bool]
+
+
+class ConnectionProfilesRequestQuery(BaseModel):
+    """Model for connection profiles request query"""
+
+    fields: Optional[str] = Field(
+        description="Comma-separated list of fields to return (id, uuid, type, activated)"
+    )
 
 
 class ConnectionProfileInfoLegacy(BaseModel):
@@ -1365,6 +1504,20 @@ class NetworkStatusResponseModel(BaseModel):
     devices: Optional[int]
 
 
+class NetworkCacheStatsResponseModel(BaseModel):
+    """Model for response to request for NetworkManager object cache statistics"""
+
+    enabled: bool
+    seeded: bool
+    objects: int
+    hits: int
+    misses: int
+    hitRate: float
+    signals: int
+    secondsSinceSeeded: float
+    secondsSinceUpdated: float
+
+
 class NetworkStatusResponseModelLegacy(BaseModel):
     """Model for response to request for network status (legacy)"""
 
@@ -16,6 +16,7 @@ from summit_rcm.rest_api.services.spectree_service import (
 )
 from summit_rcm.definition import USER_PERMISSION_TYPES
 from summit_rcm.services.login_service import LoginService, Session
+from summit_rcm.services.password_service import PasswordServiceBusyError
 from summit_rcm.services.user_service import UserService
 
 try:
@@ -28,6 +29,7 @@ try:
         ForbiddenErrorResponseModel,
         InternalServerErrorResponseModel,
         LoginRequestModel,
+        ServiceUnavailableErrorResponseModel,
     )
     from summit_rcm.rest_api.utils.spectree.tags import login_tag
 except (ImportError, DocsNotEnabledException):
@@ -37,6 +39,7 @@ except (ImportError, DocsNotEnabledException):
     ForbiddenErrorResponseModel = None
     InternalServerErrorResponseModel = None
     LoginRequestModel = None
+    ServiceUnavailableErrorResponseModel = None
     login_tag = None
 
 
@@ -52,6 +55,7 @@ class LoginResource:
             HTTP_200=None,
             HTTP_403=ForbiddenErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
+            HTTP_503=ServiceUnavailableErrorResponseModel,
         ),
         tags=[login_tag],
     )
@@ -82,9 +86,9 @@ class LoginResource:
                 if not session_id:
                     raise Exception("Malformed cookie")
 
-                if not UserService.verify(username=username, password=password):
+                if not await UserService.verify(username=username, password=password):
                     # Provided username and password are incorrect
-                    LoginService().login_failed(username)
+                    LoginService().login_failed(username, password)
                     LoginService().remove_invalid_session(session_id)
                     resp.context.valid_session = False
                     resp.status = falcon.HTTP_403
@@ -111,7 +115,7 @@ class LoginResource:
                 # Default login
                 default_login = True
                 if not UserService.get_number_of_users():
-                    UserService.add_user(
+                    await UserService.add_user(
                         username,
                         password,
                         " ".join(USER_PERMISSION_TYPES["UserPermissionTypes"]),
@@ -127,10 +131,10 @@ class LoginResource:
 
             if not (
                 default_login
-                or UserService.verify(username=username, password=password)
+                or await UserService.verify(username=username, password=password)
             ):
                 # Provided username and password are incorrect
-                LoginService().login_failed(username)
+                LoginService().login_failed(username, password)
                 resp.context.valid_session = False
                 resp.status = falcon.HTTP_403
                 return
@@ -153,6 +157,8 @@ class LoginResource:
             resp.context.valid_session = True
             resp.status = falcon.HTTP_200
             syslog(f"User {username} logged in")
+        except PasswordServiceBusyError:
+            resp.status = falcon.HTTP_503
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to login: {str(exception)}")
             resp.status = falcon.HTTP_500
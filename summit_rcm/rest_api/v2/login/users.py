@@ -11,6 +11,7 @@ from summit_rcm.rest_api.services.spectree_service import (
     DocsNotEnabledException,
     SpectreeService,
 )
+from summit_rcm.services.password_service import PasswordServiceBusyError
 from summit_rcm.services.user_service import UserService
 
 try:
@@ -25,6 +26,7 @@ try:
         InternalServerErrorResponseModel,
         NewUserRequestModel,
         NotFoundErrorResponseModel,
+        ServiceUnavailableErrorResponseModel,
         UnauthorizedErrorResponseModel,
         UpdateUserRequestModel,
         UserResponseModel,
@@ -40,6 +42,7 @@ except (ImportError, DocsNotEnabledException):
     InternalServerErrorResponseModel = None
     NewUserRequestModel = None
     NotFoundErrorResponseModel = None
+    ServiceUnavailableErrorResponseModel = None
     UnauthorizedErrorResponseModel = None
     UpdateUserRequestModel = None
     UserResponseModel = None
@@ -112,7 +115,7 @@ class UsersResource:
                 resp.status = falcon.HTTP_409
                 return
 
-            if not UserService.add_user(username, password, permissions):
+            if not await UserService.add_user(username, password, permissions):
                 resp.status = falcon.HTTP_500
                 return
 
@@ -170,6 +173,7 @@ class UserResource:
             HTTP_403=ForbiddenErrorResponseModel,
             HTTP_404=NotFoundErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
+            HTTP_503=ServiceUnavailableErrorResponseModel,
         ),
         security=SpectreeService().security,
         tags=[login_tag],
@@ -199,11 +203,11 @@ class UserResource:
                 return
 
             if new_password:
-                if not UserService.verify(username, current_password):
+                if not await UserService.verify(username, current_password):
                     resp.status = falcon.HTTP_403
                     return
 
-                if not UserService.update_password(username, new_password):
+                if not await UserService.update_password(username, new_password):
                     resp.status = falcon.HTTP_500
                     return
 
@@ -217,6 +221,8 @@ class UserResource:
             }
             resp.status = falcon.HTTP_200
             resp.content_type = falcon.MEDIA_JSON
+        except PasswordServiceBusyError:
+            resp.status = falcon.HTTP_503
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to update user: {str(exception)}")
             resp.status = falcon.HTTP_500
@@ -242,7 +248,7 @@ class UserResource:
                 resp.status = falcon.HTTP_404
                 return
 
-            if not UserService.delete_user(username):
+            if not await UserService.delete_user(username):
                 resp.status = falcon.HTTP_500
                 return
 
@@ -8,12 +8,16 @@ Module to interact with access points
 
 from syslog import LOG_ERR, syslog
 import falcon.asgi
+from summit_rcm.definition import WifiBandEnum
 from summit_rcm.settings import ServerConfig
 from summit_rcm.rest_api.services.spectree_service import (
     DocsNotEnabledException,
     SpectreeService,
 )
-from summit_rcm.services.network_service import NetworkService
+from summit_rcm.services.network_service import (
+    ACCESS_POINT_SORT_FIELDS,
+    NetworkService,
+)
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -24,6 +28,8 @@ try:
         AccessPointScanRequestReponseModel,
         AccessPointSecondsSinceLastScanResponseModel,
         AccessPoints,
+        AccessPointsRequestQuery,
+        BadRequestErrorResponseModel,
         InternalServerErrorResponseModel,
         UnauthorizedErrorResponseModel,
     )
@@ -34,6 +40,8 @@ except (ImportError, DocsNotEnabledException):
     AccessPointScanRequestReponseModel = None
     AccessPointSecondsSinceLastScanResponseModel = None
     AccessPoints = None
+    AccessPointsRequestQuery = None
+    BadRequestErrorResponseModel = None
     InternalServerErrorResponseModel = None
     UnauthorizedErrorResponseModel = None
     network_tag = None
@@ -48,20 +56,46 @@ class AccessPointsResource:
     """
 
     @spec.validate(
+        query=AccessPointsRequestQuery,
         resp=Response(
             HTTP_200=AccessPoints,
+            HTTP_400=BadRequestErrorResponseModel,
             HTTP_401=UnauthorizedErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
         ),
         security=SpectreeService().security,
         tags=[network_tag],
     )
-    async def on_get(self, _: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+    async def on_get(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> None:
         """
-        Retrieve a list of known access points
+        Retrieve a list of known access points, optionally filtered and sorted
         """
         try:
-            resp.media = await NetworkService.get_access_points(is_legacy=False)
+            min_strength = req.params.get("minStrength", None)
+            min_strength = int(min_strength) if min_strength is not None else None
+            band = req.params.get("band", None)
+            band = WifiBandEnum(band) if band is not None else None
+            sort = req.params.get("sort", None)
+            if sort is not None and sort not in ACCESS_POINT_SORT_FIELDS:
+                raise ValueError(f"Invalid sort field: {sort}")
+            order = req.params.get("order", "asc")
+            if order not in ["asc", "desc"]:
+                raise ValueError("Order must be 'asc' or 'desc'")
+        except ValueError:
+            resp.status = falcon.HTTP_400
+            return
+
+        try:
+            resp.media = await NetworkService.get_access_points(
+                is_legacy=False,
+                min_strength=min_strength,
+                ssid_prefix=req.params.get("ssidPrefix", None),
+                band=band,
+                sort=sort,
+                descending=order == "desc",
+            )
             resp.status = falcon.HTTP_200
             resp.content_type = falcon.MEDIA_JSON
         except Exception as exception:
@@ -6,6 +6,7 @@
 Module to interact with certificates
 """
 
+import asyncio
 from syslog import LOG_ERR, syslog
 import falcon.asgi.multipart
 from summit_rcm.settings import ServerConfig
@@ -16,7 +17,10 @@ from summit_rcm.rest_api.services.spectree_service import (
 from summit_rcm.rest_api.services.rest_files_service import (
     RESTFilesService as FilesService,
 )
-from summit_rcm.services.certificates_service import CertificatesService
+from summit_rcm.services.certificates_service import (
+    MAX_EXPIRING_WITHIN_DAYS,
+    CertificatesService,
+)
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -25,6 +29,8 @@ try:
     from spectree import Response
     from summit_rcm.rest_api.utils.spectree.models import (
         BadRequestErrorResponseModel,
+        CertificateDetailsRequestQuery,
+        CertificateDetailsResponse,
         CertificateFiles,
         CertificateInfoRequest,
         CertificateInfoResponse,
@@ -38,6 +44,8 @@ except (ImportError, DocsNotEnabledException):
     from summit_rcm.rest_api.services.spectree_service import DummyResponse as Response
 
     BadRequestErrorResponseModel = None
+    CertificateDetailsRequestQuery = None
+    CertificateDetailsResponse = None
     CertificateFiles = None
     CertificateInfoRequest = None
     CertificateInfoResponse = None
@@ -80,6 +88,51 @@ class CertificatesResource:
             resp.status = falcon.HTTP_500
 
 
+class CertificatesDetailsResource:
+    """
+    Resource to handle queries for the details of every certificate
+    """
+
+    @spec.validate(
+        query=CertificateDetailsRequestQuery,
+        resp=Response(
+            HTTP_200=CertificateDetailsResponse,
+            HTTP_400=BadRequestErrorResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[network_tag],
+    )
+    async def on_get(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> None:
+        """
+        Retrieve the subject, issuer, validity period and fingerprint of every certificate,
+        flagging those that have expired or expire within 'expiringWithinDays' days (30 by
+        default). Certificates are only parsed again when they change.
+        """
+        try:
+            expiring_within_days = int(req.params.get("expiringWithinDays", 30))
+            if not 0 <= expiring_within_days <= MAX_EXPIRING_WITHIN_DAYS:
+                raise ValueError(
+                    f"expiringWithinDays must be between 0 and {MAX_EXPIRING_WITHIN_DAYS}"
+                )
+        except ValueError:
+            resp.status = falcon.HTTP_400
+            return
+
+        try:
+            resp.media = await asyncio.get_running_loop().run_in_executor(
+                None, CertificatesService.get_cert_details, expiring_within_days
+            )
+            resp.status = falcon.HTTP_200
+            resp.content_type = falcon.MEDIA_JSON
+        except Exception as exception:
+            syslog(LOG_ERR, f"Unable to retrieve certificate details: {str(exception)}")
+            resp.status = falcon.HTTP_500
+
+
 class CertificateResource:
     """Resource to handle queries and requests for a specific certificate by name"""
 
@@ -6,7 +6,6 @@
 Module to interact with network connection profiles
 """
 
-import os
 from syslog import LOG_ERR, syslog
 import falcon.asgi.multipart
 from summit_rcm.settings import ServerConfig
@@ -18,12 +17,14 @@ from summit_rcm.rest_api.services.rest_files_service import (
     RESTFilesService as FilesService,
 )
 from summit_rcm.services.network_service import (
+    CONNECTION_PROFILE_FIELDS,
     ConnectionProfileAlreadyActiveError,
     ConnectionProfileAlreadyInactiveError,
     ConnectionProfileNotFoundError,
     ConnectionProfileReservedError,
     NetworkService,
 )
+from summit_rcm.utils import prime_async_iterator
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -36,6 +37,7 @@ try:
         ConnectionProfileExportRequestModel,
         ConnectionProfileImportRequestFormModel,
         ConnectionProfiles,
+        ConnectionProfilesRequestQuery,
         InternalServerErrorResponseModel,
         NotFoundErrorResponseModel,
         UnauthorizedErrorResponseModel,
@@ -49,6 +51,7 @@ except (ImportError, DocsNotEnabledException):
     ConnectionProfileExportRequestModel = None
     ConnectionProfileImportRequestFormModel = None
     ConnectionProfiles = None
+    ConnectionProfilesRequestQuery = None
     InternalServerErrorResponseModel = None
     NotFoundErrorResponseModel = None
     UnauthorizedErrorResponseModel = None
@@ -64,21 +67,34 @@ class NetworkConnectionsResource(object):
     """
 
     @spec.validate(
+        query=ConnectionProfilesRequestQuery,
         resp=Response(
             HTTP_200=ConnectionProfiles,
+            HTTP_400=BadRequestErrorResponseModel,
             HTTP_401=UnauthorizedErrorResponseModel,
             HTTP_500=InternalServerErrorResponseModel,
         ),
         security=SpectreeService().security,
         tags=[network_tag],
     )
-    async def on_get(self, _: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+    async def on_get(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> None:
         """
         Retrieve a list of connection profiles
         """
+        fields = req.params.get("fields", None)
+        if fields:
+            fields = [field.strip() for field in fields.split(",") if field.strip()]
+            if set(fields) - set(CONNECTION_PROFILE_FIELDS):
+                resp.status = falcon.HTTP_400
+                return
+        else:
+            fields = None
+
         try:
             resp.media = await NetworkService.get_all_connection_profiles(
-                is_legacy=False
+                is_legacy=False, fields=fields
             )
             resp.status = falcon.HTTP_200
             resp.content_type = falcon.MEDIA_JSON
@@ -163,7 +179,6 @@ class NetworkConnectionsExportResource:
         """
         Retrieve a password-protected archive export of the current connection profiles
         """
-        archive = ""
         try:
             get_data = await req.get_media()
             password = get_data.get("password", "")
@@ -171,19 +186,14 @@ class NetworkConnectionsExportResource:
                 resp.status = falcon.HTTP_400
                 return
 
-            success, msg, archive = FilesService.export_connections(password)
-            if not success:
-                raise Exception(msg)
-
-            resp.stream = await FilesService.handle_file_download(archive)
+            resp.stream = await prime_async_iterator(
+                FilesService.stream_connections_archive(password)
+            )
             resp.content_type = falcon.MEDIA_TEXT
             resp.status = falcon.HTTP_200
         except Exception as exception:
             syslog(f"Could not export connections - {str(exception)}")
             resp.status = falcon.HTTP_500
-        finally:
-            if os.path.isfile(archive):
-                os.unlink(archive)
 
 
 class NetworkConnectionsImportResource:
@@ -22,14 +22,18 @@ try:
     from spectree import Response
     from summit_rcm.rest_api.utils.spectree.models import (
         InternalServerErrorResponseModel,
+        NetworkCacheStatsResponseModel,
         NetworkStatusResponseModel,
+        UnauthorizedErrorResponseModel,
     )
     from summit_rcm.rest_api.utils.spectree.tags import network_tag
 except (ImportError, DocsNotEnabledException):
     from summit_rcm.rest_api.services.spectree_service import DummyResponse as Response
 
     NetworkStatusResponseModel = None
+    NetworkCacheStatsResponseModel = None
     InternalServerErrorResponseModel = None
+    UnauthorizedErrorResponseModel = None
     network_tag = None
 
 
@@ -73,3 +77,30 @@ class NetworkStatusResource(object):
         except Exception as e:
             syslog(LOG_ERR, f"Could not retrieve network status - {str(e)}")
             resp.status = falcon.HTTP_500
+
+
+class NetworkStatusCacheResource(object):
+    """
+    Resource to handle queries for the NetworkManager object cache statistics
+    """
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=NetworkCacheStatsResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[network_tag],
+    )
+    async def on_get(self, _: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """
+        Retrieve the hit rate and staleness of the NetworkManager object cache
+        """
+        try:
+            resp.status = falcon.HTTP_200
+            resp.content_type = falcon.MEDIA_JSON
+            resp.media = NetworkService.get_cache_stats()
+        except Exception as e:
+            syslog(LOG_ERR, f"Could not retrieve network cache statistics - {str(e)}")
+            resp.status = falcon.HTTP_500
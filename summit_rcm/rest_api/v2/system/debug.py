@@ -6,7 +6,6 @@
 Module to interact with system debug info
 """
 
-import os
 from syslog import syslog
 import falcon.asgi
 from summit_rcm.settings import ServerConfig
@@ -15,6 +14,8 @@ from summit_rcm.rest_api.services.spectree_service import (
     SpectreeService,
 )
 from summit_rcm.services.files_service import FilesService
+from summit_rcm.startup_profiler import startup_profiler
+from summit_rcm.utils import prime_async_iterator
 
 try:
     if not ServerConfig().rest_api_docs_enabled:
@@ -23,6 +24,7 @@ try:
     from spectree import Response
     from summit_rcm.rest_api.utils.spectree.models import (
         InternalServerErrorResponseModel,
+        StartupProfileResponseModel,
         UnauthorizedErrorResponseModel,
     )
     from summit_rcm.rest_api.utils.spectree.tags import system_tag
@@ -30,6 +32,7 @@ except (ImportError, DocsNotEnabledException):
     from summit_rcm.rest_api.services.spectree_service import DummyResponse as Response
 
     InternalServerErrorResponseModel = None
+    StartupProfileResponseModel = None
     UnauthorizedErrorResponseModel = None
     system_tag = None
 
@@ -55,18 +58,42 @@ class DebugExportResource:
         """
         Retrieve system debug info
         """
-        archive = ""
         try:
-            success, msg, archive = FilesService.export_debug()
-            if not success:
-                raise Exception(msg)
-
-            resp.stream = await FilesService.handle_file_download(archive)
+            resp.stream = await prime_async_iterator(
+                FilesService.stream_debug_archive()
+            )
             resp.content_type = falcon.MEDIA_TEXT
             resp.status = falcon.HTTP_200
         except Exception as exception:
             syslog(f"Could not export debug info - {str(exception)}")
             resp.status = falcon.HTTP_500
-        finally:
-            if os.path.isfile(archive):
-                os.unlink(archive)
+
+
+class DebugStartupProfileResource:
+    """
+    Resource to handle queries for the startup profile
+    """
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=StartupProfileResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_get(self, _: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """
+        Retrieve how long each module import and startup phase took before the server started
+        listening. The startup profiler is enabled with the 'startup_profile' option in the
+        [summit-rcm] section of the server config file; when it is disabled, 'enabled' is false
+        and nothing is reported.
+        """
+        try:
+            resp.media = startup_profiler.to_dict()
+            resp.content_type = falcon.MEDIA_JSON
+            resp.status = falcon.HTTP_200
+        except Exception as exception:
+            syslog(f"Could not retrieve startup profile - {str(exception)}")
+            resp.status = falcon.HTTP_500
@@ -0,0 +1,215 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to handle background archive export jobs
+"""
+
+from syslog import syslog
+import falcon.asgi
+from summit_rcm.definition import ExportJobStateEnum, ExportTypeEnum
+from summit_rcm.settings import ServerConfig
+from summit_rcm.rest_api.services.spectree_service import (
+    DocsNotEnabledException,
+    SpectreeService,
+)
+from summit_rcm.services.export_job_service import ExportJobService
+from summit_rcm.services.files_service import FilesService
+
+try:
+    if not ServerConfig().rest_api_docs_enabled:
+        raise DocsNotEnabledException()
+
+    from spectree import Response
+    from summit_rcm.rest_api.utils.spectree.models import (
+        BadRequestErrorResponseModel,
+        ConflictErrorResponseModel,
+        ExportJobRequestModel,
+        ExportJobResponseModel,
+        ExportJobsResponseModel,
+        InternalServerErrorResponseModel,
+        NotFoundErrorResponseModel,
+        UnauthorizedErrorResponseModel,
+    )
+    from summit_rcm.rest_api.utils.spectree.tags import system_tag
+except (ImportError, DocsNotEnabledException):
+    from summit_rcm.rest_api.services.spectree_service import DummyResponse as Response
+
+    BadRequestErrorResponseModel = None
+    ConflictErrorResponseModel = None
+    ExportJobRequestModel = None
+    ExportJobResponseModel = None
+    ExportJobsResponseModel = None
+    InternalServerErrorResponseModel = None
+    NotFoundErrorResponseModel = None
+    UnauthorizedErrorResponseModel = None
+    system_tag = None
+
+
+spec = SpectreeService()
+
+
+class ExportJobsResource:
+    """
+    Resource to handle queries and requests for starting background archive exports
+    """
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=ExportJobsResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_get(self, _: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """
+        Retrieve the status of all current export jobs
+        """
+        try:
+            resp.media = [job.to_dict() for job in ExportJobService().get_jobs()]
+            resp.content_type = falcon.MEDIA_JSON
+            resp.status = falcon.HTTP_200
+        except Exception as exception:
+            syslog(f"Could not retrieve export jobs - {str(exception)}")
+            resp.status = falcon.HTTP_500
+
+    @spec.validate(
+        json=ExportJobRequestModel,
+        resp=Response(
+            HTTP_202=ExportJobResponseModel,
+            HTTP_400=BadRequestErrorResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_post(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
+    ) -> None:
+        """
+        Start generating an archive ('logs', 'debug' or 'connections') in the background. Poll
+        the returned job for progress and download the archive from its 'file' endpoint once
+        the job is complete.
+        """
+        try:
+            post_data = await req.get_media()
+            job = ExportJobService().start_job(
+                ExportTypeEnum(post_data.get("type", None)),
+                post_data.get("password", ""),
+            )
+
+            resp.media = job.to_dict()
+            resp.location = f"/api/v2/system/exports/{job.id}"
+            resp.content_type = falcon.MEDIA_JSON
+            resp.status = falcon.HTTP_202
+        except ValueError:
+            resp.status = falcon.HTTP_400
+        except Exception as exception:
+            syslog(f"Could not start export job - {str(exception)}")
+            resp.status = falcon.HTTP_500
+
+
+class ExportJobResource:
+    """
+    Resource to handle queries and requests for a specific archive export job
+    """
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=ExportJobResponseModel,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_404=NotFoundErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_get(
+        self, _: falcon.asgi.Request, resp: falcon.asgi.Response, job_id: str
+    ) -> None:
+        """
+        Retrieve the status of the given export job
+        """
+        try:
+            job = ExportJobService().get_job(job_id)
+            if job is None:
+                resp.status = falcon.HTTP_404
+                return
+
+            resp.media = job.to_dict()
+            resp.content_type = falcon.MEDIA_JSON
+            resp.status = falcon.HTTP_200
+        except Exception as exception:
+            syslog(f"Could not retrieve export job - {str(exception)}")
+            resp.status = falcon.HTTP_500
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=None,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_404=NotFoundErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_delete(
+        self, _: falcon.asgi.Request, resp: falcon.asgi.Response, job_id: str
+    ) -> None:
+        """
+        Cancel the given export job if it is still running and remove its archive
+        """
+        try:
+            resp.status = (
+                falcon.HTTP_200
+                if ExportJobService().delete_job(job_id)
+                else falcon.HTTP_404
+            )
+        except Exception as exception:
+            syslog(f"Could not delete export job - {str(exception)}")
+            resp.status = falcon.HTTP_500
+
+
+class ExportJobFileResource:
+    """
+    Resource to handle downloading the archive generated by an export job
+    """
+
+    @spec.validate(
+        resp=Response(
+            HTTP_200=None,
+            HTTP_401=UnauthorizedErrorResponseModel,
+            HTTP_404=NotFoundErrorResponseModel,
+            HTTP_409=ConflictErrorResponseModel,
+            HTTP_500=InternalServerErrorResponseModel,
+        ),
+        security=SpectreeService().security,
+        tags=[system_tag],
+    )
+    async def on_get(
+        self, _: falcon.asgi.Request, resp: falcon.asgi.Response, job_id: str
+    ) -> None:
+        """
+        Retrieve the archive generated by the given export job. A 409 (Conflict) error is
+        returned if the job has not completed successfully.
+        """
+        try:
+            job = ExportJobService().get_job(job_id)
+            if job is None:
+                resp.status = falcon.HTTP_404
+                return
+
+            if job.state != ExportJobStateEnum.COMPLETE:
+                resp.status = falcon.HTTP_409
+                return
+
+            resp.stream = await FilesService.handle_file_download(job.path)
+            resp.content_type = falcon.MEDIA_TEXT
+            resp.status = falcon.HTTP_200
+        except Exception as exception:
+            syslog(f"Could not download export job archive - {str(exception)}")
+            resp.status = falcon.HTTP_500
@@ -6,6 +6,8 @@
 Module to interact with system logs
 """
 
+import asyncio
+import json
 import os
 from syslog import syslog
 import falcon.asgi
@@ -25,13 +27,17 @@ from summit_rcm.rest_api.services.spectree_service import (
 from summit_rcm.definition import (
     DriverLogLevelEnum,
     JournalctlLogTypesEnum,
+    JournalLogStreamFormatEnum,
     SupplicantLogLevelEnum,
 )
 from summit_rcm.services.files_service import FilesService
+from summit_rcm.services.log_tail_service import LogTailService
 from summit_rcm.services.logs_service import (
     JournalctlError,
 )
+from summit_rcm.utils import prime_async_iterator
 from summit_rcm.rest_api.services.rest_logs_service import (
+    MEDIA_NDJSON,
     RESTLogsService as LogsService,
 )
 
@@ -90,7 +96,6 @@ class LogsExportResource:
         """
         Retrieve a password-protected zip archive of the journal logs
         """
-        archive = ""
         try:
             get_data = await req.get_media()
             password = get_data.get("password", "")
@@ -98,19 +103,14 @@ class LogsExportResource:
                 resp.status = falcon.HTTP_400
                 return
 
-            success, msg, archive = FilesService.export_logs(password)
-            if not success:
-                raise Exception(msg)
-
-            resp.stream = await FilesService.handle_file_download(archive)
+            resp.stream = await prime_async_iterator(
+                FilesService.stream_logs_archive(password)
+            )
             resp.content_type = falcon.MEDIA_TEXT
             resp.status = falcon.HTTP_200
         except Exception as exception:
             syslog(f"Could not export logs - {str(exception)}")
             resp.status = falcon.HTTP_500
-        finally:
-            if os.path.isfile(archive):
-                os.unlink(archive)
 
 
 class LogsDataResource:
@@ -133,7 +133,7 @@ class LogsDataResource:
         self, req: falcon.asgi.Request, resp: falcon.asgi.Response
     ) -> None:
         """
-        Retrieve journal log data
+        Retrieve journal log data, optionally paged with a cursor and/or streamed as it is read
         """
         try:
             priority = int(req.params.get("priority", 7))
@@ -141,11 +141,33 @@ class LogsDataResource:
                 raise ValueError("Priority must be an int between 0-7")
             days = int(req.params.get("days", 1))
             log_type = JournalctlLogTypesEnum(req.params.get("type", "All"))
-
-            resp.media = await LogsService.get_journal_log_data(
-                log_type=log_type, priority=priority, days=days
+            limit = req.params.get("limit", None)
+            limit = int(limit) if limit is not None else None
+            stream = req.params.get("stream", None)
+            stream = JournalLogStreamFormatEnum(stream) if stream is not None else None
+
+            entries = LogsService.iter_journal_log_data(
+                log_type=log_type,
+                priority=priority,
+                days=days,
+                limit=limit,
+                cursor=req.params.get("cursor", None),
+                after_cursor=req.params.get("afterCursor", None),
+                include_cursor=True,
             )
-            resp.content_type = falcon.MEDIA_JSON
+
+            if stream is None:
+                resp.media = [entry async for entry in entries]
+                resp.content_type = falcon.MEDIA_JSON
+            else:
+                resp.stream = LogsService.encode_journal_log_stream(
+                    await prime_async_iterator(entries), stream
+                )
+                resp.content_type = (
+                    MEDIA_NDJSON
+                    if stream == JournalLogStreamFormatEnum.NDJSON
+                    else falcon.MEDIA_JSON
+                )
             resp.status = falcon.HTTP_200
         except ValueError:
             resp.status = falcon.HTTP_400
@@ -160,6 +182,78 @@ class LogsDataResource:
             resp.status = falcon.HTTP_500
 
 
+class LogsTailResource:
+    """
+    Resource to handle streaming new journal log entries to a client over a WebSocket
+    """
+
+    async def on_websocket(
+        self, req: falcon.asgi.Request, websocket: falcon.asgi.WebSocket
+    ) -> None:
+        """
+        Stream new journal log entries as JSON text messages as they are logged. When the client
+        falls behind, the oldest queued entries are dropped and a '{"dropped": <count>}' message
+        with the running total is sent before the next entry.
+        """
+        try:
+            priority = int(req.params.get("priority", 7))
+            if priority not in range(0, 8, 1):
+                raise ValueError("Priority must be an int between 0-7")
+            log_type = JournalctlLogTypesEnum(req.params.get("type", "All"))
+        except ValueError:
+            await websocket.close(code=3400)
+            return
+
+        try:
+            if websocket.unaccepted:
+                await websocket.accept()
+        except falcon.WebSocketDisconnected:
+            return
+
+        subscription = await LogTailService().subscribe(log_type, priority)
+        sink_task = falcon.create_task(self.websocket_sink(websocket))
+        try:
+            reported_dropped = 0
+            while not sink_task.done():
+                get_task = asyncio.ensure_future(subscription.queue.get())
+                await asyncio.wait(
+                    [get_task, sink_task], return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get_task.done():
+                    get_task.cancel()
+                    break
+
+                message = get_task.result()
+                if message is None:
+                    # The journal follower stopped
+                    break
+
+                if subscription.dropped != reported_dropped:
+                    reported_dropped = subscription.dropped
+                    await websocket.send_text(json.dumps({"dropped": reported_dropped}))
+                await websocket.send_text(message)
+        except falcon.WebSocketDisconnected:
+            pass
+        except Exception as exception:
+            syslog(f"Log tail stopped - {str(exception)}")
+        finally:
+            sink_task.cancel()
+            try:
+                await sink_task
+            except asyncio.CancelledError:
+                pass
+            await LogTailService().unsubscribe(subscription)
+            await websocket.close()
+
+    async def websocket_sink(self, websocket: falcon.asgi.WebSocket) -> None:
+        """Receive and discard incoming messages until the client disconnects"""
+        while True:
+            try:
+                _ = await websocket.receive_text()
+            except falcon.WebSocketDisconnected:
+                break
+
+
 class LogsConfigResource:
     """
     Resource to handle queries and requests for configuring the debug level for the supplicant and
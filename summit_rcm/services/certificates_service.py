@@ -6,9 +6,11 @@
 Module to interact with the certificates.
 """
 
+from datetime import datetime, timedelta, timezone
 import os
 from syslog import syslog, LOG_ERR
-from typing import Optional, Tuple
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 try:
     import openssl_extension
@@ -17,6 +19,154 @@ except ImportError as error:
     if os.environ.get("DOCS_GENERATION") != "True":
         raise error
 from summit_rcm import definition
+from summit_rcm.utils import Singleton
+
+OPENSSL_CERT_DATETIME_FORMAT = "%b %d %H:%M:%S %Y %Z"
+MAX_EXPIRING_WITHIN_DAYS = 36500
+
+
+class CertificateMetadata:
+    """Parsed info about a certificate file, valid for as long as its mtime and size match"""
+
+    def __init__(
+        self,
+        name: str,
+        mtime_ns: int,
+        size: int,
+        cert_info: Optional[dict] = None,
+        error: str = "",
+    ) -> None:
+        self.name = name
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.cert_info = cert_info
+        self.error = error
+        self.not_before: Optional[datetime] = None
+        self.not_after: Optional[datetime] = None
+        if cert_info:
+            self.not_before = CertificateMetadata.parse_datetime(
+                cert_info.get("not_before", None)
+            )
+            self.not_after = CertificateMetadata.parse_datetime(
+                cert_info.get("not_after", None)
+            )
+
+    @staticmethod
+    def parse_datetime(datetime_str: Optional[str]) -> Optional[datetime]:
+        """Parse the given OpenSSL format date/time string into a UTC datetime object"""
+        try:
+            return datetime.strptime(
+                datetime_str, OPENSSL_CERT_DATETIME_FORMAT
+            ).replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            return None
+
+    def to_dict(self, now: datetime, expiring_within: timedelta) -> dict:
+        """
+        Retrieve the certificate's details, flagging whether it has expired or will expire within
+        the given time
+        """
+        cert_info = self.cert_info or {}
+        expired = self.not_after is not None and self.not_after <= now
+        return {
+            "name": self.name,
+            "subject": cert_info.get("subject", None),
+            "issuer": cert_info.get("issuer", None),
+            "serialNumber": cert_info.get("serial_number", None),
+            "notBefore": cert_info.get("not_before", None),
+            "notAfter": cert_info.get("not_after", None),
+            "fingerprint": cert_info.get("fingerprint", None),
+            "expired": expired,
+            "expiringSoon": (
+                self.not_after is not None
+                and not expired
+                and self.not_after <= now + expiring_within
+            ),
+            "error": self.error or None,
+        }
+
+
+class CertificateIndex(metaclass=Singleton):
+    """
+    Index of the metadata of the certificates managed by Summit RCM/NetworkManager. Each
+    certificate file is only parsed again when its mtime or size changes, which is checked with a
+    stat scan of the certificates directory whenever the index is read. Certificates that can't
+    be parsed without a password (e.g., protected PKCS#12 files) are indexed with their error.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: Dict[str, CertificateMetadata] = {}
+
+    @staticmethod
+    def _parse(name: str, path: str, mtime_ns: int, size: int) -> CertificateMetadata:
+        try:
+            return CertificateMetadata(
+                name, mtime_ns, size, openssl_extension.get_cert_info(path, None)
+            )
+        except Exception as exception:
+            return CertificateMetadata(name, mtime_ns, size, error=str(exception))
+
+    def _is_stale(self, entry: Optional[CertificateMetadata], stat) -> bool:
+        return (
+            entry is None
+            or entry.mtime_ns != stat.st_mtime_ns
+            or entry.size != stat.st_size
+        )
+
+    def refresh(self) -> None:
+        """Re-parse any certificates that changed and drop any that were removed"""
+        cert_dir = str(definition.FILEDIR_DICT.get("cert"))
+        # Parse without holding the lock, so that readers on the event loop are never blocked
+        # behind a scan; only the finished index is swapped in under the lock
+        current = self._entries
+        entries: Dict[str, CertificateMetadata] = {}
+        with os.scandir(cert_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith(definition.FILEFMT_DICT.get("cert")):
+                    continue
+
+                try:
+                    if not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                entry = current.get(dir_entry.name, None)
+                if self._is_stale(entry, stat):
+                    entry = self._parse(
+                        dir_entry.name,
+                        dir_entry.path,
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    )
+                entries[dir_entry.name] = entry
+        with self._lock:
+            self._entries = entries
+
+    def get(self, name: str) -> Optional[CertificateMetadata]:
+        """Retrieve the up-to-date metadata for the given certificate, if it exists"""
+        path = os.path.join(str(definition.FILEDIR_DICT.get("cert")), name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(name, None)
+            return None
+
+        entry = self._entries.get(name, None)
+        if self._is_stale(entry, stat):
+            entry = self._parse(name, path, stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                self._entries[name] = entry
+        return entry
+
+    def get_all(self) -> List[CertificateMetadata]:
+        """Retrieve the up-to-date metadata for every certificate, sorted by name"""
+        self.refresh()
+        entries = self._entries
+        return [entries[name] for name in sorted(entries)]
 
 
 class CertificatesService:
@@ -28,7 +178,8 @@ class CertificatesService:
     ) -> Tuple[dict, str]:
         """
         Retrieve the basic meta data info about the given certificate name from the certificates
-        managed by Summit RCM/NetworkManager.
+        managed by Summit RCM/NetworkManager. Without a password, the info comes from the
+        certificate index.
 
         Return value is a tuple in the form (cert_info, info_msg)
         """
@@ -39,9 +190,29 @@ class CertificatesService:
             return ({}, f"Cannot find certificate with name {cert_name}")
 
         try:
+            if not password and os.path.basename(cert_name) == cert_name:
+                entry = CertificateIndex().get(cert_name)
+                if entry is not None and entry.cert_info:
+                    return (dict(entry.cert_info), "")
+                if entry is not None:
+                    raise Exception(entry.error)
+
             cert_info = openssl_extension.get_cert_info(cert_file_path, password)
             return (cert_info, "")
         except Exception as exception:
             error_msg = f"{str(exception)}"
             syslog(LOG_ERR, error_msg)
             return ({}, error_msg)
+
+    @staticmethod
+    def get_cert_details(expiring_within_days: int) -> List[dict]:
+        """
+        Retrieve the details of every certificate, flagging those that have expired or will
+        expire within the given number of days
+        """
+        now = datetime.now(timezone.utc)
+        expiring_within = timedelta(days=expiring_within_days)
+        return [
+            entry.to_dict(now, expiring_within)
+            for entry in CertificateIndex().get_all()
+        ]
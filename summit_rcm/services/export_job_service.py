@@ -0,0 +1,150 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to run archive exports as background jobs
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from syslog import LOG_ERR, syslog
+import time
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+try:
+    import aiofiles
+except ImportError as error:
+    # Ignore the error if the aiofiles module is not available if generating documentation
+    if os.environ.get("DOCS_GENERATION") != "True":
+        raise error
+from summit_rcm.definition import ExportJobStateEnum, ExportTypeEnum
+from summit_rcm.services.files_service import FilesService
+from summit_rcm.utils import Singleton
+
+EXPORT_JOB_DIRECTORY = "/tmp"
+EXPORT_JOB_TTL_S = 600
+
+
+class ExportJob:
+    """A single background archive export"""
+
+    def __init__(self, export_type: ExportTypeEnum) -> None:
+        self.id: str = str(uuid4())
+        self.type: ExportTypeEnum = export_type
+        self.state: ExportJobStateEnum = ExportJobStateEnum.RUNNING
+        self.bytes_written: int = 0
+        self.message: str = ""
+        self.path: str = str(Path(EXPORT_JOB_DIRECTORY, f"export-{self.id}"))
+        self.started: float = time.monotonic()
+        self.finished: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.expiry_handle: Optional[asyncio.TimerHandle] = None
+
+    def to_dict(self) -> dict:
+        """Retrieve the job's current status as a dictionary"""
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "state": self.state.value,
+            "bytesWritten": self.bytes_written,
+            "elapsed": round((self.finished or time.monotonic()) - self.started, 3),
+            "message": self.message,
+        }
+
+
+class ExportJobService(metaclass=Singleton):
+    """
+    Service to run archive exports in the background so clients can poll for progress and
+    download the result once it is ready. Finished jobs (and their archives) are discarded
+    EXPORT_JOB_TTL_S seconds after they finish.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, ExportJob] = {}
+
+    def _prune(self) -> None:
+        """Discard finished jobs that have expired"""
+        now = time.monotonic()
+        for job in list(self._jobs.values()):
+            if job.finished is not None and now - job.finished > EXPORT_JOB_TTL_S:
+                self._discard(job)
+
+    def _discard(self, job: ExportJob) -> None:
+        """Cancel the given job if it is still running and remove its archive"""
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+        if job.expiry_handle is not None:
+            job.expiry_handle.cancel()
+            job.expiry_handle = None
+        Path(job.path).unlink(missing_ok=True)
+        self._jobs.pop(job.id, None)
+
+    def _expire(self, job: ExportJob) -> None:
+        """Discard the given finished job once it has expired, if it is still current"""
+        job.expiry_handle = None
+        if self._jobs.get(job.id, None) is job:
+            self._discard(job)
+
+    async def _run(self, job: ExportJob, password: str) -> None:
+        """Generate the archive for the given job, tracking the number of bytes written"""
+        if job.type == ExportTypeEnum.LOGS:
+            stream = FilesService.stream_logs_archive(password)
+        elif job.type == ExportTypeEnum.CONNECTIONS:
+            stream = FilesService.stream_connections_archive(password)
+        else:
+            stream = FilesService.stream_debug_archive()
+
+        try:
+            async with aiofiles.open(job.path, "wb") as archive_file:
+                async for chunk in stream:
+                    await archive_file.write(chunk)
+                    job.bytes_written += len(chunk)
+            job.state = ExportJobStateEnum.COMPLETE
+        except asyncio.CancelledError:
+            Path(job.path).unlink(missing_ok=True)
+            raise
+        except Exception as exception:
+            job.message = f"Unable to export {job.type.value} - {str(exception)}"
+            job.state = ExportJobStateEnum.FAILED
+            syslog(LOG_ERR, job.message)
+            Path(job.path).unlink(missing_ok=True)
+        finally:
+            job.finished = time.monotonic()
+            # Remove the archive once it expires, even if no client polls again
+            job.expiry_handle = asyncio.get_running_loop().call_later(
+                EXPORT_JOB_TTL_S, self._expire, job
+            )
+            await stream.aclose()
+
+    def start_job(self, export_type: ExportTypeEnum, password: str = "") -> ExportJob:
+        """Start a new export job of the given type"""
+        if export_type != ExportTypeEnum.DEBUG and not password:
+            raise ValueError(f"A password is required to export {export_type.value}")
+
+        self._prune()
+        job = ExportJob(export_type)
+        job.task = asyncio.create_task(self._run(job, password))
+        self._jobs[job.id] = job
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ExportJob]:
+        """Retrieve the job with the given ID, if it exists"""
+        self._prune()
+        return self._jobs.get(job_id, None)
+
+    def get_jobs(self) -> List[ExportJob]:
+        """Retrieve all current jobs"""
+        self._prune()
+        return list(self._jobs.values())
+
+    def delete_job(self, job_id: str) -> bool:
+        """Cancel and/or remove the job with the given ID and return whether it existed"""
+        job = self._jobs.get(job_id, None)
+        if job is None:
+            return False
+
+        self._discard(job)
+        return True
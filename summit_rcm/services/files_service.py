@@ -12,7 +12,7 @@ import os
 from shutil import copy2, rmtree
 from subprocess import run
 from syslog import LOG_ERR, syslog
-from typing import Any, List, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -35,7 +35,6 @@ CONNECTION_TMP_ARCHIVE_FILE = "/tmp/archive.zip"
 CONFIG_TMP_ARCHIVE_FILE = "/tmp/config.zip"
 LOG_TMP_ARCHIVE_FILE = "/tmp/log.zip"
 DEBUG_TMP_ARCHIVE_FILE = "/tmp/debug.zip"
-TMP_TMP_ARCHIVE_FILE = "/tmp/tmp.zip"
 TMP_ARCHIVE_DIRECTORY = "/tmp/import"
 FILE_READ_SIZE = 8192
 UNZIP = "/usr/bin/unzip"
@@ -55,6 +54,9 @@ class FilesService(metaclass=Singleton):
     Service to interact with files.
     """
 
+    # (directory mtime, file names) of the last listing for each file type
+    _files_by_type_cache: Dict[str, Tuple[int, List[str]]] = {}
+
     @staticmethod
     def get_log_path() -> str:
         """Retrieve the path to where system logs are stored"""
@@ -240,34 +242,123 @@ class FilesService(metaclass=Singleton):
         return result
 
     @staticmethod
-    def export_connections(password: str) -> Tuple[bool, str, Any]:
+    async def stream_pipeline(
+        commands: List[List[str]], cwd: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
         """
-        Handle exporting NetworkManager connections and certificates as a properly structured and
-        encrypted zip archive
-
-        Return value is a tuple in the form of: (success, message, archive_path)
+        Run the given commands as a pipeline (the stdout of each command is connected to the stdin
+        of the next) and yield the stdout of the last command in chunks of FILE_READ_SIZE as it is
+        produced. An exception is raised at the end of the stream if any command failed. All of
+        the processes are killed if the consumer stops iterating early.
         """
-        result = (False, "Unknown error", None)
+        procs: List[asyncio.subprocess.Process] = []
+        # stderr is drained as it is produced so that a chatty command can't fill the pipe and
+        # block the pipeline
+        stderr_tasks: List[asyncio.Task] = []
+        open_fds: List[int] = []
+        stdin = asyncio.subprocess.DEVNULL
         try:
-            # Generate the archive using 'zip' (the built-in Python zipfile implementation is
-            # handled in pure Python, is "extremely slow", and does not support generating
-            # encrypted archives).
-            # https://docs.python.org/3/library/zipfile.html
-            proc = run(
+            for index, command in enumerate(commands):
+                if index == len(commands) - 1:
+                    read_fd = None
+                    stdout = asyncio.subprocess.PIPE
+                else:
+                    read_fd, stdout = os.pipe()
+                    open_fds.extend([read_fd, stdout])
+
+                procs.append(
+                    await asyncio.create_subprocess_exec(
+                        *command,
+                        stdin=stdin,
+                        stdout=stdout,
+                        stderr=asyncio.subprocess.PIPE,
+                        cwd=cwd,
+                    )
+                )
+                stderr_tasks.append(asyncio.create_task(procs[-1].stderr.read()))
+
+                # The child processes now hold their own copies of the pipe ends
+                for fd in [stdin, stdout]:
+                    if fd in open_fds:
+                        os.close(fd)
+                        open_fds.remove(fd)
+                stdin = read_fd
+
+            while True:
+                chunk = await procs[-1].stdout.read(FILE_READ_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+            for proc, stderr_task, command in zip(procs, stderr_tasks, commands):
+                await proc.wait()
+                stderr = await stderr_task
+                if proc.returncode != 0:
+                    raise Exception(
+                        f"{command[0]} failed ({proc.returncode}): "
+                        f"{stderr.decode('utf-8')}"
+                    )
+        finally:
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+            for stderr_task in stderr_tasks:
+                stderr_task.cancel()
+            for fd in open_fds:
+                os.close(fd)
+
+    @staticmethod
+    async def write_stream_to_file(stream: AsyncIterator[bytes], path: str) -> None:
+        """Write the given stream of bytes to the file at the given path"""
+        try:
+            async with aiofiles.open(path, "wb") as archive_file:
+                async for chunk in stream:
+                    await archive_file.write(chunk)
+        except Exception:
+            Path(path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def stream_connections_archive(password: str) -> AsyncIterator[bytes]:
+        """
+        Stream an encrypted zip archive of the NetworkManager connections and certificates as it
+        is generated
+        """
+        # Generate the archive using 'zip' (the built-in Python zipfile implementation is handled
+        # in pure Python, is "extremely slow", and does not support generating encrypted
+        # archives).
+        # https://docs.python.org/3/library/zipfile.html
+        return FilesService.stream_pipeline(
+            [
                 [
                     ZIP,
+                    "-q",
                     "-P",
                     password,
                     "-9",
                     "-r",
-                    CONNECTION_TMP_ARCHIVE_FILE,
+                    "-",
                     str(Path("/", NETWORKMANAGER_DIR, "system-connections")),
                     str(Path("/", NETWORKMANAGER_DIR, "certs")),
-                ],
-                capture_output=True,
+                ]
+            ]
+        )
+
+    @staticmethod
+    async def export_connections(password: str) -> Tuple[bool, str, Any]:
+        """
+        Handle exporting NetworkManager connections and certificates as a properly structured and
+        encrypted zip archive
+
+        Return value is a tuple in the form of: (success, message, archive_path)
+        """
+        result = (False, "Unknown error", None)
+        try:
+            await FilesService.write_stream_to_file(
+                FilesService.stream_connections_archive(password),
+                CONNECTION_TMP_ARCHIVE_FILE,
             )
-            if proc.returncode != 0:
-                raise Exception(proc.stderr.decode("utf-8"))
 
             if not Path(CONNECTION_TMP_ARCHIVE_FILE).exists():
                 raise Exception("archive generation failed")
@@ -285,14 +376,23 @@ class FilesService(metaclass=Singleton):
         if file_type not in ["cert", "pac"]:
             return []
 
+        # The directory's mtime changes whenever a file is added, removed or renamed, so the
+        # previous listing can be reused until it does
+        file_dir = Path(definition.FILEDIR_DICT.get(file_type))
+        dir_mtime_ns = file_dir.stat().st_mtime_ns
+        cached = FilesService._files_by_type_cache.get(file_type, None)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return list(cached[1])
+
         files = []
-        for entry in Path(definition.FILEDIR_DICT.get(file_type)).iterdir():
+        for entry in file_dir.iterdir():
             if entry.exists() and entry.suffix in definition.FILEFMT_DICT.get(
                 file_type
             ):
                 files.append(entry.name)
         files.sort()
-        return files
+        FilesService._files_by_type_cache[file_type] = (dir_mtime_ns, files)
+        return list(files)
 
     @staticmethod
     def get_cert_files() -> List[str]:
@@ -452,7 +552,19 @@ class FilesService(metaclass=Singleton):
         return result
 
     @staticmethod
-    def export_logs(password: str) -> Tuple[bool, str, Any]:
+    def stream_logs_archive(password: str) -> AsyncIterator[bytes]:
+        """Stream an encrypted zip archive of the system logs as it is generated"""
+        # Generate the archive using 'zip' (the built-in Python zipfile implementation is handled
+        # in pure Python, is "extremely slow", and does not support generating encrypted
+        # archives).
+        # https://docs.python.org/3/library/zipfile.html
+        return FilesService.stream_pipeline(
+            [[ZIP, "-q", "--symlinks", "-P", password, "-9", "-r", "-", "."]],
+            cwd=FilesService.get_log_path(),
+        )
+
+    @staticmethod
+    async def export_logs(password: str) -> Tuple[bool, str, Any]:
         """
         Handle exporting logs as a properly structured and encrypted zip archive.
 
@@ -461,26 +573,9 @@ class FilesService(metaclass=Singleton):
         result = (False, "Unknown error", None)
 
         try:
-            # Generate the archive using 'zip' (the built-in Python zipfile implementation is
-            # handled in pure Python, is "extremely slow", and does not support generating
-            # encrypted archives).
-            # https://docs.python.org/3/library/zipfile.html
-            proc = run(
-                [
-                    ZIP,
-                    "--symlinks",
-                    "-P",
-                    password,
-                    "-9",
-                    "-r",
-                    LOG_TMP_ARCHIVE_FILE,
-                    ".",
-                ],
-                cwd=FilesService.get_log_path(),
-                capture_output=True,
+            await FilesService.write_stream_to_file(
+                FilesService.stream_logs_archive(password), LOG_TMP_ARCHIVE_FILE
             )
-            if proc.returncode != 0:
-                raise Exception(proc.stdout.decode("utf-8"))
 
             if not Path(LOG_TMP_ARCHIVE_FILE).exists():
                 raise Exception("archive generation failed")
@@ -492,62 +587,52 @@ class FilesService(metaclass=Singleton):
         return result
 
     @staticmethod
-    def export_debug() -> Tuple[bool, str, Any]:
+    def stream_debug_archive() -> AsyncIterator[bytes]:
         """
-        Handle exporting logs and system configuration as a properly structured and encrypted zip
-        archive using OpenSSL encryption.
-
-        Return value is a tuple in the form of: (success, message, archive_path)
+        Stream a zip archive of the logs and system configuration, encrypted with OpenSSL, as it
+        is generated. The output of 'zip' is piped straight into 'openssl smime' so no
+        unencrypted intermediate archive is written.
         """
-        result = (False, "Unknown error", None)
-
-        try:
-            debug_paths: list[str] = [FilesService.get_log_path()]
-            if FilesService.is_encrypted_storage_toolkit_enabled():
-                debug_paths.append(definition.FILEDIR_DICT.get("config"))
-            else:
-                debug_paths.extend([NETWORKMANAGER_DIR_FULL, SUMMIT_RCM_DIR])
-
-            # Generate the archive using 'zip' (the built-in Python zipfile implementation is
-            # handled in pure Python, is "extremely slow", and does not support generating
-            # encrypted archives).
-            # https://docs.python.org/3/library/zipfile.html
-            proc = run(
-                [
-                    ZIP,
-                    "-9",
-                    "-r",
-                    TMP_TMP_ARCHIVE_FILE,
-                ]
-                + debug_paths,
-                capture_output=True,
-            )
-            if proc.returncode != 0:
-                raise Exception(proc.stderr.decode("utf-8"))
-
-            if not Path(TMP_TMP_ARCHIVE_FILE).exists():
-                raise Exception("tmp archive generation failed")
-
-            proc = run(
+        debug_paths: list[str] = [FilesService.get_log_path()]
+        if FilesService.is_encrypted_storage_toolkit_enabled():
+            debug_paths.append(definition.FILEDIR_DICT.get("config"))
+        else:
+            debug_paths.extend([NETWORKMANAGER_DIR_FULL, SUMMIT_RCM_DIR])
+
+        # Generate the archive using 'zip' (the built-in Python zipfile implementation is handled
+        # in pure Python, is "extremely slow", and does not support generating encrypted
+        # archives).
+        # https://docs.python.org/3/library/zipfile.html
+        return FilesService.stream_pipeline(
+            [
+                [ZIP, "-q", "-9", "-r", "-"] + debug_paths,
                 [
                     "openssl",
                     "smime",
                     "-encrypt",
                     "-aes256",
-                    "-in",
-                    TMP_TMP_ARCHIVE_FILE,
                     "-binary",
                     "-outform",
                     "DER",
-                    "-out",
-                    DEBUG_TMP_ARCHIVE_FILE,
                     SystemSettingsManage.get_cert_for_file_encryption(),
                 ],
-                capture_output=True,
+            ]
+        )
+
+    @staticmethod
+    async def export_debug() -> Tuple[bool, str, Any]:
+        """
+        Handle exporting logs and system configuration as a properly structured and encrypted zip
+        archive using OpenSSL encryption.
+
+        Return value is a tuple in the form of: (success, message, archive_path)
+        """
+        result = (False, "Unknown error", None)
+
+        try:
+            await FilesService.write_stream_to_file(
+                FilesService.stream_debug_archive(), DEBUG_TMP_ARCHIVE_FILE
             )
-            Path(TMP_TMP_ARCHIVE_FILE).unlink()
-            if proc.returncode != 0:
-                raise Exception(proc.stderr.decode("utf-8"))
 
             if not Path(DEBUG_TMP_ARCHIVE_FILE).exists():
                 raise Exception("encrypted archive generation failed")
@@ -0,0 +1,168 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to follow the journal and fan out new log entries to subscribers
+"""
+
+import asyncio
+import json
+from syslog import LOG_ERR, syslog
+from typing import Dict, Optional, Set, Tuple
+from summit_rcm.definition import JournalctlLogTypesEnum
+from summit_rcm.services.logs_service import (
+    JOURNALCTL_MAX_LINE_LENGTH,
+    LogsService,
+)
+from summit_rcm.settings import SystemSettingsManage
+from summit_rcm.utils import Singleton
+
+
+class LogTailSubscription:
+    """
+    A single subscriber to a journal follower. Entries are queued pre-encoded as JSON text in a
+    bounded queue; when the subscriber falls behind, the oldest entries are dropped and counted.
+    """
+
+    def __init__(self, key: Tuple[str, ...], max_queue_size: int) -> None:
+        self.key = key
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped: int = 0
+
+    def push(self, message: Optional[str]) -> None:
+        """
+        Queue the given message without blocking, dropping the oldest queued message if the
+        queue is full. A message of None signals that the follower has stopped.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class JournalFollower:
+    """
+    A single 'journalctl --follow' process shared by every subscriber using the same filters
+    """
+
+    def __init__(self, journalctl_args: Tuple[str, ...]) -> None:
+        self.journalctl_args = journalctl_args
+        self.subscriptions: Set[LogTailSubscription] = set()
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the journalctl process is still being read from"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the journalctl process and the task reading from it"""
+        self._proc = await asyncio.create_subprocess_exec(
+            *self.journalctl_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=JOURNALCTL_MAX_LINE_LENGTH,
+        )
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the journalctl process and the task reading from it"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.kill()
+            await self._proc.wait()
+        self._proc = None
+
+    async def _run(self) -> None:
+        """Read new entries from journalctl and queue them for every subscriber"""
+        try:
+            while True:
+                line = await self._proc.stdout.readline()
+                if not line:
+                    break
+                if line.strip() == b"":
+                    continue
+
+                # Encode each entry once and share it between all subscribers
+                message = json.dumps(
+                    LogsService.format_journal_entry(
+                        json.loads(line), include_cursor=True
+                    )
+                )
+                for subscription in self.subscriptions:
+                    subscription.push(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            syslog(LOG_ERR, f"Journal follower stopped - {str(exception)}")
+
+        # journalctl exited on its own, so let the subscribers know
+        for subscription in self.subscriptions:
+            subscription.push(None)
+
+
+class LogTailService(metaclass=Singleton):
+    """Service to share journal followers between live log tail subscribers"""
+
+    def __init__(self) -> None:
+        self._followers: Dict[Tuple[str, ...], JournalFollower] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(
+        self, log_type: JournalctlLogTypesEnum, priority: int
+    ) -> LogTailSubscription:
+        """
+        Subscribe to new journal entries matching the given filters, starting a journal follower
+        for them if one isn't already running
+        """
+        key = tuple(
+            LogsService.build_journalctl_args(
+                log_type=log_type, priority=priority, days=0
+            )
+            + ["--follow", "--lines=0"]
+        )
+        subscription = LogTailSubscription(
+            key, SystemSettingsManage.get_log_tail_queue_size()
+        )
+
+        async with self._lock:
+            follower = self._followers.get(key, None)
+            if follower is None or not follower.running:
+                if follower is not None:
+                    # Reap the exited journalctl process before replacing its follower
+                    await follower.stop()
+                follower = JournalFollower(key)
+                await follower.start()
+                self._followers[key] = follower
+            follower.subscriptions.add(subscription)
+
+        return subscription
+
+    async def unsubscribe(self, subscription: LogTailSubscription) -> None:
+        """
+        Remove the given subscription, stopping its journal follower if it was the last one
+        """
+        if subscription.dropped > 0:
+            syslog(
+                f"Log tail subscriber dropped {subscription.dropped} entries while "
+                "falling behind"
+            )
+
+        async with self._lock:
+            follower = self._followers.get(subscription.key, None)
+            if follower is None:
+                return
+
+            follower.subscriptions.discard(subscription)
+            if len(follower.subscriptions) == 0:
+                del self._followers[subscription.key]
+                await follower.stop()
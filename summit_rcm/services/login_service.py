@@ -6,27 +6,29 @@
 Module to handle session login management
 """
 
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
+import hmac
+import os
 from threading import Lock
-from typing import List
+from typing import List, Optional, Tuple
+from summit_rcm.services.session_store import (
+    DEFAULT_SESSION_STORE_PATH,
+    FileSessionStore,
+    MemorySessionStore,
+    Session,
+)
 from summit_rcm.settings import (
     ServerConfig,
     SystemSettingsManage,
 )
 from summit_rcm.utils import Singleton
 
-
-class Session:
-    """Data class to hold info about a session"""
-
-    id: str
-    expiry: int
-    username: str
-
-    def __init__(self, id: str, expiry: int, username: str) -> None:
-        self.id = id
-        self.expiry = expiry
-        self.username = username
+FAILED_PASSWORD_CACHE_SIZE = 8
+""" Maximum number of recently failed passwords remembered per user """
+FAILED_PASSWORD_CACHE_USERS = 256
+""" Maximum number of users for which recently failed passwords are remembered """
 
 
 class LoginService(metaclass=Singleton):
@@ -35,7 +37,10 @@ class LoginService(metaclass=Singleton):
     _lock = Lock()
     # Record logins with wrong credentials to protect against tamper
     _failed_logins = {}
-    _valid_sessions: list[Session] = []
+    # Keyed fingerprints of recently failed passwords by username, so repeated attempts with the
+    # same wrong password can be rejected without running the password hash again
+    _failed_passwords: "OrderedDict[str, List[Tuple[bytes, datetime]]]" = OrderedDict()
+    _failed_password_key: bytes = os.urandom(32)
 
     def __init__(self) -> None:
         # self._sessions_enabled = (
@@ -60,6 +65,27 @@ class LoginService(metaclass=Singleton):
             .get_parser()
             .getboolean("summit-rcm", "allow_multiple_user_sessions", fallback=False)
         )
+        self._session_store: MemorySessionStore = self._create_session_store()
+
+    @staticmethod
+    def _create_session_store() -> MemorySessionStore:
+        """
+        Create the session store selected by the 'session_store' option ('memory' or 'file')
+        """
+        parser = ServerConfig().get_parser()
+        if parser.get("summit-rcm", "session_store", fallback="memory") == "file":
+            return FileSessionStore(
+                parser.get(
+                    "summit-rcm",
+                    "session_store_path",
+                    fallback=DEFAULT_SESSION_STORE_PATH,
+                ).strip('"')
+            )
+        return MemorySessionStore()
+
+    @staticmethod
+    def _now() -> int:
+        return int(round(datetime.utcnow().timestamp()))
 
     # @property
     # def sessions_enabled(self) -> bool:
@@ -81,10 +107,20 @@ class LoginService(metaclass=Singleton):
         """Whether or not multiple sessions per user are enabled"""
         return self._allow_multiple_user_sessions
 
+    @property
+    def session_store(self) -> MemorySessionStore:
+        """Store holding the valid sessions"""
+        return self._session_store
+
+    @session_store.setter
+    def session_store(self, session_store: MemorySessionStore) -> None:
+        self._session_store = session_store
+
     @property
     def valid_sessions(self) -> List[Session]:
         """List of valid sessions"""
-        return self._valid_sessions
+        self.cleanup_expired_sessions()
+        return list(self._session_store)
 
     def is_user_blocked(self, username: str) -> bool:
         """Retrieve whether or not the user with the specified username is blocked"""
@@ -105,8 +141,52 @@ class LoginService(metaclass=Singleton):
                 self._failed_logins.pop(username, None)
         return False
 
-    def login_failed(self, username: str):
-        """Handle the event when a login attempt failed"""
+    def _get_password_fingerprint(self, password: str) -> bytes:
+        return hmac.new(
+            self._failed_password_key, password.encode(), hashlib.sha256
+        ).digest()
+
+    def is_failed_password(self, username: str, password: str) -> bool:
+        """
+        Retrieve whether or not the given password recently failed to log in the user with the
+        specified username. Every remembered fingerprint is compared in constant time.
+        """
+
+        fingerprint = self._get_password_fingerprint(password)
+        with self._lock:
+            now = datetime.now()
+            found = False
+            for failed_fingerprint, failed_time in self._failed_passwords.get(
+                username, []
+            ):
+                found |= hmac.compare_digest(fingerprint, failed_fingerprint) and (
+                    abs((now - failed_time).total_seconds())
+                    < SystemSettingsManage.get_login_retry_window()
+                )
+            return found
+
+    def forget_failed_passwords(self, username: str) -> None:
+        """Forget the recently failed passwords for the user with the specified username"""
+
+        with self._lock:
+            self._failed_passwords.pop(username, None)
+
+    def login_failed(self, username: str, password: Optional[str] = None):
+        """
+        Handle the event when a login attempt failed. If given, the failed password is remembered
+        (as a keyed fingerprint) so that retrying it can be rejected cheaply.
+        """
+
+        if password is not None:
+            fingerprint = self._get_password_fingerprint(password)
+            with self._lock:
+                failed_passwords = self._failed_passwords.pop(username, [])
+                failed_passwords.append((fingerprint, datetime.now()))
+                self._failed_passwords[username] = failed_passwords[
+                    -FAILED_PASSWORD_CACHE_SIZE:
+                ]
+                while len(self._failed_passwords) > FAILED_PASSWORD_CACHE_USERS:
+                    self._failed_passwords.popitem(last=False)
 
         with self._lock:
             now = datetime.now()
@@ -119,7 +199,7 @@ class LoginService(metaclass=Singleton):
                     < SystemSettingsManage.get_login_retry_window()
                 ]
                 if len(user["time"]) >= SystemSettingsManage.get_login_retry_times():
-                    user["time"].pop(0, None)
+                    user["time"].pop(0)
             else:
                 user["time"] = []
 
@@ -131,49 +211,45 @@ class LoginService(metaclass=Singleton):
 
         with self._lock:
             self._failed_logins.pop(username, None)
+            self._failed_passwords.pop(username, None)
 
     def is_user_logged_in(self, username: str) -> bool:
         """Retrieve whether or not the user with the specified username is currently logged in"""
-
-        for session in self.valid_sessions:
-            if session.username == username:
-                return True
-        return False
+        self.cleanup_expired_sessions()
+        return self._session_store.has_user(username)
 
     def add_new_valid_session(self, new_session: Session):
-        """Add a new valid session to the list"""
-        self._valid_sessions.append(new_session)
+        """Add a new valid session to the store"""
+        self._session_store.add(new_session)
 
-    def remove_invalid_session(self, invalid_session_id: int) -> None:
-        """Remove an invalid session from the list"""
-        self._valid_sessions[:] = [
-            x for x in self._valid_sessions if x.id != invalid_session_id
-        ]
+    def remove_invalid_session(self, invalid_session_id: str) -> None:
+        """Remove an invalid session from the store"""
+        self._session_store.remove(invalid_session_id)
 
     def cleanup_expired_sessions(self) -> None:
         """
-        Clean up and remove any expired sessions. If multiple sessions per user is not enabled, also
-        log out the corresponding user.
+        Clean up and remove any expired sessions. Only sessions that have reached the front of the
+        store's expiry queue are examined, so this is cheap when nothing has expired.
         """
-        now = int(round(datetime.utcnow().timestamp()))
-        self._valid_sessions[:] = [x for x in self._valid_sessions if now < x.expiry]
+        self._session_store.sweep(self._now())
 
     def keepalive_session(self, session_id: str) -> None:
         """Update the expiry for the session with the given ID"""
-        now = int(round(datetime.utcnow().timestamp()))
-        for session in self._valid_sessions:
-            if session.id == session_id:
-                session.expiry = now + (SystemSettingsManage.get_session_timeout() * 60)
-                return
+        self._session_store.touch(
+            session_id, self._now() + (SystemSettingsManage.get_session_timeout() * 60)
+        )
+
+    def get_session_expiry(self, session_id: str) -> Optional[int]:
+        """Retrieve the expiry of the session with the given ID, if it exists"""
+        session = self._session_store.get(session_id)
+        return session.expiry if session is not None else None
 
     def session_is_valid(self, session_id: str) -> bool:
         """
-        Determine whether or not the session with the given ID is valid.
+        Determine whether or not the session with the given ID is valid. Expired sessions are
+        swept lazily here rather than on every request.
         """
-        now = int(round(datetime.utcnow().timestamp()))
-        for session in self.valid_sessions:
-            if session_id == session.id and now < session.expiry:
-                # Target session is not expired
-                return True
-
-        return False
+        now = self._now()
+        self._session_store.sweep(now)
+        session = self._session_store.get(session_id)
+        return session is not None and now < session.expiry
@@ -11,6 +11,7 @@ from datetime import datetime
 import asyncio
 import json
 import os
+from typing import AsyncIterator, List, Optional
 
 try:
     from dbus_fast import Message, MessageType, Variant
@@ -32,6 +33,7 @@ from summit_rcm.definition import (
 
 JOURNALCTL_DAYS_SINCE_FORMAT_STRING = "%Y-%m-%d %H:%M:%S"
 JOURNALCTL_LOG_ENTRY_FORMAT_STRING = "%Y-%m-%d %H:%M:%S.%f"
+JOURNALCTL_MAX_LINE_LENGTH = 1024 * 1024
 
 
 class LogsService(metaclass=Singleton):
@@ -45,12 +47,21 @@ class LogsService(metaclass=Singleton):
         )
 
     @staticmethod
-    async def get_journal_log_data(
-        log_type: JournalctlLogTypesEnum, priority: int, days: int
-    ) -> list:
-        """Retrieve journal log data using the given parameters as a list"""
+    def build_journalctl_args(
+        log_type: JournalctlLogTypesEnum,
+        priority: int,
+        days: int,
+        cursor: Optional[str] = None,
+        after_cursor: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Build the journalctl command line for the given parameters. When a cursor is given, it
+        takes precedence over 'days' since journalctl does not accept both.
+        """
         if priority not in range(0, 8, 1):
             raise ValueError("Priority must be an int between 0-7")
+        if cursor and after_cursor:
+            raise ValueError("Only one of 'cursor' and 'after cursor' may be given")
 
         log_type = str(log_type.value).lower()
         if log_type == "networkmanager":
@@ -67,41 +78,119 @@ class LogsService(metaclass=Singleton):
         ]
         if log_type != "All":
             journalctl_args.append(f"--identifier={str(log_type)}")
-        if days > 0:
+        if cursor:
+            journalctl_args.append(f"--cursor={cursor}")
+        elif after_cursor:
+            journalctl_args.append(f"--after-cursor={after_cursor}")
+        elif days > 0:
             journalctl_args.append(
                 f"--since={LogsService.format_days_since_for_journalctl(days)}"
             )
+        return journalctl_args
+
+    @staticmethod
+    def format_journal_entry(entry: dict, include_cursor: bool = False) -> dict:
+        """Format a single journalctl JSON entry for output"""
+        timestamp = str(entry.get("__REALTIME_TIMESTAMP", "Undefined"))
+        log = {
+            "time": datetime.fromtimestamp(float(timestamp) / 1000000).strftime(
+                JOURNALCTL_LOG_ENTRY_FORMAT_STRING
+            )
+            if timestamp != "Undefined"
+            else "Undefined",
+            "priority": str(entry.get("PRIORITY", 7)),
+            "identifier": entry.get("SYSLOG_IDENTIFIER", "Undefined"),
+            "message": entry.get("MESSAGE", "Undefined"),
+        }
+        if include_cursor:
+            log["cursor"] = entry.get("__CURSOR", "")
+        return log
+
+    @staticmethod
+    async def iter_journal_log_data(
+        log_type: JournalctlLogTypesEnum,
+        priority: int,
+        days: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        after_cursor: Optional[str] = None,
+        include_cursor: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Retrieve journal log data using the given parameters, yielding each entry as it is read
+        from journalctl. At most 'limit' entries are returned, starting at 'cursor' or just after
+        'after_cursor' when given. journalctl is stopped early once the limit is reached or the
+        consumer stops iterating.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("Limit must be a positive int")
+
+        journalctl_args = LogsService.build_journalctl_args(
+            log_type=log_type,
+            priority=priority,
+            days=days,
+            cursor=cursor,
+            after_cursor=after_cursor,
+        )
 
         proc = await asyncio.create_subprocess_exec(
             *journalctl_args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=JOURNALCTL_MAX_LINE_LENGTH,
         )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            raise JournalctlError(proc.returncode, stderr.decode("utf-8"))
-
-        logs = []
-        for line in str(stdout.decode("utf-8")).split("\n"):
-            if line.strip() == "":
-                # The last line is empty, so break if we see it
-                break
-
-            entry = json.loads(line)
-            timestamp = str(entry.get("__REALTIME_TIMESTAMP", "Undefined"))
-            logs.append(
-                {
-                    "time": datetime.fromtimestamp(float(timestamp) / 1000000).strftime(
-                        JOURNALCTL_LOG_ENTRY_FORMAT_STRING
-                    )
-                    if timestamp != "Undefined"
-                    else "Undefined",
-                    "priority": str(entry.get("PRIORITY", 7)),
-                    "identifier": entry.get("SYSLOG_IDENTIFIER", "Undefined"),
-                    "message": entry.get("MESSAGE", "Undefined"),
-                }
+        # Drain stderr as it is produced so that journalctl can't block on a full stderr pipe
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        count = 0
+        try:
+            while limit is None or count < limit:
+                line = await proc.stdout.readline()
+                if not line:
+                    break
+                if line.strip() == b"":
+                    continue
+
+                yield LogsService.format_journal_entry(
+                    json.loads(line), include_cursor=include_cursor
+                )
+                count += 1
+            else:
+                # Limit reached, no need to let journalctl read the rest of the journal
+                return
+
+            await proc.wait()
+            stderr = await stderr_task
+            if proc.returncode != 0:
+                raise JournalctlError(proc.returncode, stderr.decode("utf-8"))
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_task.cancel()
+
+    @staticmethod
+    async def get_journal_log_data(
+        log_type: JournalctlLogTypesEnum,
+        priority: int,
+        days: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        after_cursor: Optional[str] = None,
+        include_cursor: bool = False,
+    ) -> list:
+        """Retrieve journal log data using the given parameters as a list"""
+        return [
+            entry
+            async for entry in LogsService.iter_journal_log_data(
+                log_type=log_type,
+                priority=priority,
+                days=days,
+                limit=limit,
+                cursor=cursor,
+                after_cursor=after_cursor,
+                include_cursor=include_cursor,
             )
-        return logs
+        ]
 
     @staticmethod
     async def get_supplicant_debug_level() -> SupplicantLogLevelEnum:
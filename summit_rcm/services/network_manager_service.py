@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: LicenseRef-Ezurio-Clause
 # Copyright (C) 2024 Ezurio LLC.
 #
+import asyncio
 from socket import inet_pton, AF_INET, AF_INET6
 from sys import byteorder
-from typing import Any, Dict, List
+from syslog import LOG_ERR, syslog
+import time
+from typing import Any, Dict, List, Optional
 from enum import IntFlag, IntEnum, unique
 import os
 
@@ -18,6 +21,8 @@ except ImportError as error:
 import summit_rcm.definition
 from summit_rcm.utils import Singleton
 
+DEFAULT_STATUS_QUERY_CONCURRENCY = 8
+
 
 @unique
 class NMDeviceInterfaceFlags(IntFlag):
@@ -1494,7 +1499,253 @@ class NetworkManagerService(object, metaclass=Singleton):
 
     NM_ACCESS_POINT_IFACE = "org.freedesktop.NetworkManager.AccessPoint"
 
+    NM_OBJECT_MANAGER_OBJ_PATH = "/org/freedesktop"
+    DBUS_OBJECT_MANAGER_IFACE = "org.freedesktop.DBus.ObjectManager"
+
+    DBUS_BUS_NAME = "org.freedesktop.DBus"
+    DBUS_OBJ_PATH = "/org/freedesktop/DBus"
+    DBUS_IFACE = "org.freedesktop.DBus"
+
+    NM_CACHE_MATCH_RULES = [
+        f"type='signal',sender='{NM_BUS_NAME}',interface='{DBUS_PROP_IFACE}',"
+        "member='PropertiesChanged'",
+        f"type='signal',sender='{NM_BUS_NAME}',interface='{DBUS_OBJECT_MANAGER_IFACE}'",
+        f"type='signal',sender='{NM_BUS_NAME}',interface='{NM_CONNECTION_MANAGER_IFACE}'",
+        f"type='signal',sender='{NM_BUS_NAME}',interface='{NM_DEVICE_WIRELESS_IFACE}'",
+        f"type='signal',sender='{NM_BUS_NAME}',interface='{NM_SETTINGS_IFACE}'",
+        f"type='signal',sender='{DBUS_BUS_NAME}',interface='{DBUS_IFACE}',"
+        f"member='NameOwnerChanged',arg0='{NM_BUS_NAME}'",
+    ]
+    """
+    D-Bus match rules used to keep the NetworkManager object cache in sync
+    """
+
+    def __init__(self) -> None:
+        # Local import to avoid a circular import (settings -> definition -> this module)
+        from summit_rcm.settings import ServerConfig
+
+        parser = ServerConfig().get_parser()
+        self._cache_enabled: bool = (
+            parser.getboolean(
+                section="summit-rcm", option="nm_object_cache", fallback=True
+            )
+            if parser
+            else True
+        )
+
+        # Bounds the number of property/settings queries in flight on the bus at once, however
+        # deeply the callers nest their concurrent fan-outs
+        self._query_slots = asyncio.Semaphore(
+            max(
+                1,
+                parser.getint(
+                    "summit-rcm",
+                    "status_query_concurrency",
+                    fallback=DEFAULT_STATUS_QUERY_CONCURRENCY,
+                ),
+            )
+            if parser
+            else DEFAULT_STATUS_QUERY_CONCURRENCY
+        )
+
+        # Cache of NetworkManager object properties in the form of:
+        # {obj_path: {interface: {property: value}}}
+        self._cache: Dict[str, Dict[str, dict]] = {}
+        self._cache_lock = asyncio.Lock()
+        self._cache_seeded = False
+        self._cache_seeded_at: Optional[float] = None
+        self._cache_updated_at: Optional[float] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_signals = 0
+        self._signals_subscribed = False
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether or not the NetworkManager object cache is enabled"""
+        return self._cache_enabled
+
+    def get_cache_stats(self) -> dict:
+        """
+        Retrieve statistics for the NetworkManager object cache including the hit rate and
+        staleness (seconds since the cache was seeded and since it was last updated by a signal)
+        """
+        now = time.monotonic()
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "enabled": self._cache_enabled,
+            "seeded": self._cache_seeded,
+            "objects": len(self._cache),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hitRate": self._cache_hits / lookups if lookups else 0.0,
+            "signals": self._cache_signals,
+            "secondsSinceSeeded": (
+                now - self._cache_seeded_at if self._cache_seeded_at else -1
+            ),
+            "secondsSinceUpdated": (
+                now - self._cache_updated_at if self._cache_updated_at else -1
+            ),
+        }
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop all cached NetworkManager objects. The cache is re-seeded on the next read.
+        """
+        self._cache.clear()
+        self._cache_seeded = False
+        self._cache_seeded_at = None
+
+    async def _subscribe_cache_signals(self, bus) -> None:
+        """Register the match rules and message handler used to keep the cache in sync"""
+        if self._signals_subscribed:
+            return
+
+        for rule in self.NM_CACHE_MATCH_RULES:
+            reply = await bus.call(
+                Message(
+                    destination=self.DBUS_BUS_NAME,
+                    path=self.DBUS_OBJ_PATH,
+                    interface=self.DBUS_IFACE,
+                    member="AddMatch",
+                    signature="s",
+                    body=[rule],
+                )
+            )
+            if reply.message_type == MessageType.ERROR:
+                raise Exception(reply.body[0])
+
+        bus.add_message_handler(self._cache_signal_handler)
+        self._signals_subscribed = True
+
+    async def _ensure_cache(self) -> bool:
+        """
+        Seed the cache (if necessary) using 'GetManagedObjects' and return whether or not the cache
+        can be used to service reads
+        """
+        if not self._cache_enabled:
+            return False
+
+        if self._cache_seeded:
+            return True
+
+        async with self._cache_lock:
+            if self._cache_seeded:
+                return True
+
+            try:
+                bus = await DBusManager().get_bus()
+                await self._subscribe_cache_signals(bus)
+
+                reply = await bus.call(
+                    Message(
+                        destination=self.NM_BUS_NAME,
+                        path=self.NM_OBJECT_MANAGER_OBJ_PATH,
+                        interface=self.DBUS_OBJECT_MANAGER_IFACE,
+                        member="GetManagedObjects",
+                    )
+                )
+
+                if reply.message_type == MessageType.ERROR:
+                    raise Exception(reply.body[0])
+
+                self._cache.clear()
+                for obj_path, interfaces in reply.body[0].items():
+                    self._cache[obj_path] = {
+                        interface: {key: value.value for key, value in props.items()}
+                        for interface, props in interfaces.items()
+                    }
+                self._cache_seeded = True
+                self._cache_seeded_at = time.monotonic()
+                self._cache_updated_at = self._cache_seeded_at
+            except Exception as exception:
+                # NetworkManager versions without ObjectManager support still benefit from the
+                # cache, as objects are then populated on demand with 'GetAll'
+                syslog(
+                    LOG_ERR,
+                    f"Unable to seed NetworkManager object cache: {str(exception)}",
+                )
+                self._cache_seeded = self._signals_subscribed
+                if self._cache_seeded:
+                    self._cache_seeded_at = time.monotonic()
+
+        return self._cache_seeded
+
+    def _cache_signal_handler(self, msg) -> None:
+        """Update the NetworkManager object cache from the received D-Bus signal"""
+        if msg.message_type != MessageType.SIGNAL:
+            return
+
+        if msg.member == "NameOwnerChanged":
+            if msg.body and msg.body[0] == self.NM_BUS_NAME:
+                # NetworkManager restarted (or stopped), so everything we know is stale
+                self.invalidate_cache()
+            return
+
+        # 'InterfacesAdded'/'InterfacesRemoved' come from the ObjectManager object, which sits
+        # above the NetworkManager object tree
+        if msg.path != self.NM_OBJECT_MANAGER_OBJ_PATH and (
+            not msg.path or not msg.path.startswith(self.NM_CONNECTION_MANAGER_OBJ_PATH)
+        ):
+            return
+
+        try:
+            self._cache_signals += 1
+            if (
+                msg.member == "PropertiesChanged"
+                and msg.interface == self.DBUS_PROP_IFACE
+            ):
+                interface, changed, invalidated = msg.body
+                cached_props = self._cache.get(msg.path, {}).get(interface, None)
+                if cached_props is None:
+                    return
+                for key, value in changed.items():
+                    cached_props[key] = value.value
+                if invalidated:
+                    # Force a re-read of the interface on the next request
+                    del self._cache[msg.path][interface]
+            elif msg.member == "InterfacesAdded":
+                obj_path, interfaces = msg.body
+                obj = self._cache.setdefault(obj_path, {})
+                for interface, props in interfaces.items():
+                    obj[interface] = {key: value.value for key, value in props.items()}
+            elif msg.member == "InterfacesRemoved":
+                obj_path, interfaces = msg.body
+                obj = self._cache.get(obj_path, None)
+                if obj is None:
+                    return
+                for interface in interfaces:
+                    obj.pop(interface, None)
+                if not obj:
+                    del self._cache[obj_path]
+            elif msg.member in [
+                "DeviceRemoved",
+                "AccessPointRemoved",
+                "ConnectionRemoved",
+            ]:
+                self._cache.pop(msg.body[0], None)
+            elif msg.member in ["DeviceAdded", "AccessPointAdded", "NewConnection"]:
+                # Drop any leftover entry from a previous object at the same path. The new object
+                # is then populated on the first read.
+                self._cache.pop(msg.body[0], None)
+            else:
+                return
+            self._cache_updated_at = time.monotonic()
+        except Exception as exception:
+            syslog(
+                LOG_ERR,
+                f"Unable to process NetworkManager signal {msg.member}: {str(exception)}",
+            )
+
     async def get_all_devices(self) -> List[str]:
+        if await self._ensure_cache():
+            manager_props = self._cache.get(
+                self.NM_CONNECTION_MANAGER_OBJ_PATH, {}
+            ).get(self.NM_CONNECTION_MANAGER_IFACE, None)
+            if manager_props is not None and "AllDevices" in manager_props:
+                self._cache_hits += 1
+                return list(manager_props["AllDevices"])
+
         bus = await DBusManager().get_bus()
 
         reply = await bus.call(
@@ -1572,14 +1823,15 @@ class NetworkManagerService(object, metaclass=Singleton):
     async def get_connection_settings(self, connection_obj_path: str) -> dict:
         bus = await DBusManager().get_bus()
 
-        reply = await bus.call(
-            Message(
-                destination=self.NM_BUS_NAME,
-                path=connection_obj_path,
-                interface=self.NM_SETTINGS_CONNECTION_IFACE,
-                member="GetSettings",
+        async with self._query_slots:
+            reply = await bus.call(
+                Message(
+                    destination=self.NM_BUS_NAME,
+                    path=connection_obj_path,
+                    interface=self.NM_SETTINGS_CONNECTION_IFACE,
+                    member="GetSettings",
+                )
             )
-        )
 
         if reply.message_type == MessageType.ERROR:
             raise Exception(reply.body[0])
@@ -1671,18 +1923,38 @@ class NetworkManagerService(object, metaclass=Singleton):
             raise Exception(reply.body[0])
 
     async def get_obj_properties(self, obj_path: str, interface: str) -> dict:
+        """
+        Retrieve the properties of the given interface on the given object path. When the object
+        cache is enabled, the properties are served from memory and only fetched over D-Bus on a
+        cache miss.
+        """
+        if await self._ensure_cache():
+            cached_props = self._cache.get(obj_path, {}).get(interface, None)
+            if cached_props is not None:
+                self._cache_hits += 1
+                return dict(cached_props)
+
+            self._cache_misses += 1
+            result = await self._get_obj_properties_uncached(obj_path, interface)
+            self._cache.setdefault(obj_path, {})[interface] = dict(result)
+            return result
+
+        return await self._get_obj_properties_uncached(obj_path, interface)
+
+    async def _get_obj_properties_uncached(self, obj_path: str, interface: str) -> dict:
         bus = await DBusManager().get_bus()
 
-        reply = await bus.call(
-            Message(
-                destination=self.NM_BUS_NAME,
-                path=obj_path,
-                interface=self.DBUS_PROP_IFACE,
-                member="GetAll",
-                signature="s",
-                body=[interface],
+        async with self._query_slots:
+            reply = await bus.call(
+                Message(
+                    destination=self.NM_BUS_NAME,
+                    path=obj_path,
+                    interface=self.DBUS_PROP_IFACE,
+                    member="GetAll",
+                    signature="s",
+                    body=[interface],
+                )
             )
-        )
 
         if reply.message_type == MessageType.ERROR:
             raise Exception(reply.body[0])
@@ -1717,6 +1989,11 @@ class NetworkManagerService(object, metaclass=Singleton):
         if reply.message_type == MessageType.ERROR:
             raise Exception(reply.body[0])
 
+        # Reflect the new value right away rather than waiting on the 'PropertiesChanged' signal
+        cached_props = self._cache.get(obj_path, {}).get(interface, None)
+        if cached_props is not None:
+            cached_props[property_name] = value
+
     async def prepare_setting(
         self, setting_name: str, connection: dict, new_connection: dict
     ) -> None:
@@ -1818,10 +2095,10 @@ class NetworkManagerService(object, metaclass=Singleton):
                 "phase2-private-key",
             ]:
                 if connection["802-1x"].get(cert):
-                    connection["802-1x"][cert] = (
-                        await self.convert_cert_to_nm_path_scheme(
-                            connection["802-1x"][cert]
-                        )
+                    connection["802-1x"][
+                        cert
+                    ] = await self.convert_cert_to_nm_path_scheme(
+                        connection["802-1x"][cert]
                     )
 
             if connection["802-1x"].get("pac-file"):
@@ -8,6 +8,7 @@ Module to provide an interface to perform networking tasks (interfaces, connecti
 
 import asyncio
 import configparser
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
@@ -15,18 +16,11 @@ from struct import pack
 from syslog import LOG_ERR, syslog
 from socket import AF_INET, inet_ntop, AF_INET6
 import time
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-try:
-    from pyroute2.iwutil import IW
-    from pyroute2.netlink import NLM_F_REQUEST, NLM_F_DUMP
-    from pyroute2.netlink.nl80211 import nl80211cmd, NL80211_NAMES
-except ImportError as error:
-    # Ignore the error if the pyroute2 module is not available if generating documentation
-    if os.environ.get("DOCS_GENERATION") != "True":
-        raise error
 from summit_rcm import definition
+from summit_rcm.definition import WifiBandEnum
 from summit_rcm.services.network_manager_service import (
     NM80211ApFlags,
     NM80211ApSecurityFlags,
@@ -48,11 +42,36 @@ from summit_rcm.services.network_manager_service import (
     NM_SETTING_WIRELESS_SECURITY_DEFAULTS,
     NMActiveConnectionState,
 )
+from summit_rcm.services.nl80211_service import Nl80211Service
 from summit_rcm.settings import ServerConfig
 from summit_rcm.utils import Singleton, to_camel_case
 
 RESERVED_NM_CONNECTIONS_DIR = "/usr/lib/NetworkManager/system-connections"
 
+CONNECTION_PROFILE_FIELDS = ["id", "uuid", "type", "activated"]
+
+WIFI_BAND_FREQUENCY_RANGES = {
+    WifiBandEnum.BAND_2_4_GHZ: (2400, 2500),
+    WifiBandEnum.BAND_5_GHZ: (4900, 5925),
+    WifiBandEnum.BAND_6_GHZ: (5925, 7125),
+}
+"""
+Frequency ranges (in MHz, lower bound inclusive, upper bound exclusive) for each Wi-Fi band
+"""
+
+ACCESS_POINT_SORT_FIELDS = {
+    "ssid": ("SSID", "ssid"),
+    "hwAddress": ("HwAddress", "hwAddress"),
+    "strength": ("Strength", "strength"),
+    "maxBitrate": ("MaxBitrate", "maxBitrate"),
+    "frequency": ("Frequency", "frequency"),
+    "lastSeen": ("LastSeen", "lastSeen"),
+    "security": ("Security", "security"),
+}
+"""
+Fields by which the list of access points can be sorted, mapped to their (legacy, v2) keys
+"""
+
 
 class NetworkService(metaclass=Singleton):
     """
@@ -442,46 +461,24 @@ class NetworkService(metaclass=Singleton):
 
         The return value is a tuple in the form of: (success, rssi)
         """
-        iw = IW()
         try:
-            for interface in iw.get_interfaces_dump():
-                if str(interface.get_attr("NL80211_ATTR_IFNAME")) != ifname:
-                    continue
-
-                msg = nl80211cmd()
-                msg["cmd"] = NL80211_NAMES["NL80211_CMD_GET_STATION"]
-                msg["attrs"] = [
-                    ["NL80211_ATTR_IFINDEX", interface.get_attr("NL80211_ATTR_IFINDEX")]
-                ]
-
-                res = iw.nlm_request(
-                    msg, msg_type=iw.prid, msg_flags=NLM_F_REQUEST | NLM_F_DUMP
-                )
-                return (
-                    True,
-                    float(
-                        res[0]
-                        .get_attr("NL80211_ATTR_STA_INFO")
-                        .get_attr("NL80211_STA_INFO_SIGNAL")
-                    ),
-                )
-
-            # If not found, raise exception
-            raise Exception("interface not found")
+            signal = Nl80211Service().get_station_snapshot(
+                ifname, include_frequency=False
+            )["signal"]
+            if signal is None:
+                raise Exception("signal not reported")
+            return (True, signal)
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to read RSSI value: {str(exception)}")
             return (False, definition.INVALID_RSSI)
-        finally:
-            iw.close()
 
     @staticmethod
     def get_reg_domain_info() -> str:
         """
         Retrieve the radio's regulatory domain using 'netlink' (pyroute2)
         """
-        iw = IW()
         try:
-            res = iw.get_regulatory_domain()
+            res = Nl80211Service().get_regulatory_domain()
 
             for phy in res:
                 phy_name = phy.get_attr("NL80211_ATTR_WIPHY")
@@ -495,8 +492,6 @@ class NetworkService(metaclass=Singleton):
         except Exception as exception:
             print(f"Unable to read reg domain: {str(exception)}")
             return "WW"
-        finally:
-            iw.close()
 
     @staticmethod
     def get_frequency_info(interface: str, frequency: int) -> int:
@@ -504,34 +499,11 @@ class NetworkService(metaclass=Singleton):
         Retrieve the current frequency used by the given 'interface' as an int using 'frequency' as
         a default
         """
-        iw = IW()
         try:
-            for iface in iw.get_interfaces_dump():
-                if str(iface.get_attr("NL80211_ATTR_IFNAME")) != interface:
-                    continue
-
-                msg = nl80211cmd()
-                msg["cmd"] = NL80211_NAMES["NL80211_CMD_GET_SCAN"]
-                msg["attrs"] = [
-                    ["NL80211_ATTR_IFINDEX", iface.get_attr("NL80211_ATTR_IFINDEX")]
-                ]
-
-                res = iw.nlm_request(
-                    msg, msg_type=iw.prid, msg_flags=NLM_F_REQUEST | NLM_F_DUMP
-                )
-                return int(
-                    res[0]
-                    .get_attr("NL80211_ATTR_BSS")
-                    .get_attr("NL80211_BSS_FREQUENCY")
-                )
-
-            # If not found, raise exception
-            raise Exception("interface not found")
+            return Nl80211Service().get_scan_frequency(interface)
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to read frequency value: {str(exception)}")
             return frequency
-        finally:
-            iw.close()
 
     @staticmethod
     async def get_ap_properties(
@@ -607,156 +579,275 @@ class NetworkService(metaclass=Singleton):
         return ap_properties
 
     @staticmethod
-    async def get_status(is_legacy: bool = False) -> dict:
+    async def gather_queries(aws: list, default=None) -> list:
         """
-        Retrieve the network status information
+        Run the provided awaitables concurrently and return their results in order. The result of
+        any awaitable that raises an exception is replaced by 'default' so that one failed query
+        doesn't take down the whole response. The number of D-Bus queries in flight is bounded
+        by NetworkManagerService ('status_query_concurrency'), not per fan-out.
+        """
+        results = await asyncio.gather(*aws, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                syslog(LOG_ERR, f"Query failed - {str(result)}")
+                results[index] = default
+        return results
+
+    @staticmethod
+    async def get_all_device_properties() -> List[Tuple[str, dict]]:
+        """
+        Retrieve a list of (object path, properties) tuples for every NetworkManager device. The
+        device properties are queried concurrently and any device whose properties could not be
+        read is skipped.
         """
-        status = {}
         dev_obj_paths = await NetworkManagerService().get_all_devices()
-        for dev_obj_path in dev_obj_paths:
-            dev_properties = await NetworkManagerService().get_obj_properties(
-                dev_obj_path, NetworkManagerService().NM_DEVICE_IFACE
+        dev_props_list = await NetworkService.gather_queries(
+            [
+                NetworkManagerService().get_obj_properties(
+                    dev_obj_path, NetworkManagerService().NM_DEVICE_IFACE
+                )
+                for dev_obj_path in dev_obj_paths
+            ]
+        )
+        return [
+            (dev_obj_path, dev_props)
+            for dev_obj_path, dev_props in zip(dev_obj_paths, dev_props_list)
+            if dev_props is not None
+        ]
+
+    @staticmethod
+    async def get_active_connection_status(
+        dev_active_conn_obj_path: str, is_legacy: bool = False
+    ) -> Optional[dict]:
+        """
+        Retrieve the summary of the 'connection' settings for the provided active connection object
+        path as reported in the network status, or None if not available
+        """
+        active_connection_properties = await NetworkManagerService().get_obj_properties(
+            dev_active_conn_obj_path,
+            NetworkManagerService().NM_CONNECTION_ACTIVE_IFACE,
+        )
+        active_connection_connection_obj_path = active_connection_properties.get(
+            "Connection", None
+        )
+        if active_connection_connection_obj_path is None:
+            return None
+
+        active_connection_connection_settings = (
+            await NetworkManagerService().get_connection_settings(
+                active_connection_connection_obj_path
             )
-            dev_state = dev_properties.get("State", None)
-            if (
-                dev_state is None
-                or dev_state == NMDeviceState.NM_DEVICE_STATE_UNMANAGED
-            ):
-                continue
+        )
 
-            interface_name = dev_properties.get("Interface", None)
-            if interface_name is None:
-                continue
-            status[interface_name] = {}
+        setting_connection = active_connection_connection_settings.get(
+            "connection", None
+        )
+        if setting_connection is None:
+            return None
 
-            status[interface_name]["status"] = await NetworkService.get_dev_status(
-                dev_properties, is_legacy
+        connection_active = {}
+        connection_active["id"] = (
+            setting_connection["id"].value
+            if setting_connection.get("id", None) is not None
+            else ""
+        )
+        connection_active["interface-name" if is_legacy else "interfaceName"] = (
+            setting_connection["interface-name"].value
+            if setting_connection.get("interface-name", None) is not None
+            else ""
+        )
+        connection_active["permissions"] = (
+            setting_connection["permissions"].value
+            if setting_connection.get("permissions", None) is not None
+            else []
+        )
+        connection_active["type"] = (
+            setting_connection["type"].value
+            if setting_connection.get("type", None) is not None
+            else ""
+        )
+        connection_active["uuid"] = (
+            setting_connection["uuid"].value
+            if setting_connection.get("uuid", None) is not None
+            else ""
+        )
+        connection_active["zone"] = (
+            setting_connection["zone"].value
+            if setting_connection.get("zone", None) is not None
+            else ""
+        )
+        return connection_active
+
+    @staticmethod
+    async def get_wifi_status(
+        dev_obj_path: str, dev_properties: dict, is_legacy: bool = False
+    ) -> Tuple[dict, Optional[dict]]:
+        """
+        Retrieve the 'wireless' properties and, if the device is activated, the active access point
+        properties for the Wi-Fi device with the provided object path and properties
+        """
+        wireless_properties = await NetworkManagerService().get_obj_properties(
+            dev_obj_path, NetworkManagerService().NM_DEVICE_WIRELESS_IFACE
+        )
+        wireless = await NetworkService.get_wifi_properties(
+            wireless_properties, is_legacy
+        )
+        wireless["HwAddress" if is_legacy else "hwAddress"] = dev_properties.get(
+            "HwAddress", ""
+        )
+
+        active_access_point = None
+        if dev_properties.get("State", None) == NMDeviceState.NM_DEVICE_STATE_ACTIVATED:
+            active_access_point = await NetworkService.get_ap_properties(
+                wireless_properties, dev_properties.get("Interface", ""), is_legacy
             )
+        return (wireless, active_access_point)
 
-            if dev_state == NMDeviceState.NM_DEVICE_STATE_ACTIVATED:
-                dev_active_conn_obj_path = dev_properties.get("ActiveConnection", None)
-                if dev_active_conn_obj_path is not None:
-                    active_connection_properties = (
-                        await NetworkManagerService().get_obj_properties(
-                            dev_active_conn_obj_path,
-                            NetworkManagerService().NM_CONNECTION_ACTIVE_IFACE,
-                        )
-                    )
-                    active_connection_connection_obj_path = (
-                        active_connection_properties.get("Connection", None)
-                    )
-                    if active_connection_connection_obj_path is not None:
-                        active_connection_connection_settings = (
-                            await NetworkManagerService().get_connection_settings(
-                                active_connection_connection_obj_path
-                            )
-                        )
+    @staticmethod
+    async def get_device_status(
+        dev_obj_path: str, dev_properties: dict, is_legacy: bool = False
+    ) -> dict:
+        """
+        Retrieve the network status information for a single device with the provided object path
+        and properties. All independent queries for the device are issued concurrently.
+        """
+        dev_state = dev_properties.get("State", None)
+        device_status = {}
+        device_status["status"] = await NetworkService.get_dev_status(
+            dev_properties, is_legacy
+        )
+        device_type = device_status["status"].get(
+            "DeviceType" if is_legacy else "deviceType",
+            NMDeviceType.NM_DEVICE_TYPE_UNKNOWN,
+        )
 
-                        setting_connection = active_connection_connection_settings.get(
-                            "connection", None
-                        )
-                        if setting_connection is not None:
-                            connection_active = {}
-                            connection_active["id"] = (
-                                setting_connection["id"].value
-                                if setting_connection.get("id", None) is not None
-                                else ""
-                            )
-                            connection_active[
-                                "interface-name" if is_legacy else "interfaceName"
-                            ] = (
-                                setting_connection["interface-name"].value
-                                if setting_connection.get("interface-name", None)
-                                is not None
-                                else ""
-                            )
-                            connection_active["permissions"] = (
-                                setting_connection["permissions"].value
-                                if setting_connection.get("permissions", None)
-                                is not None
-                                else []
-                            )
-                            connection_active["type"] = (
-                                setting_connection["type"].value
-                                if setting_connection.get("type", None) is not None
-                                else ""
-                            )
-                            connection_active["uuid"] = (
-                                setting_connection["uuid"].value
-                                if setting_connection.get("uuid", None) is not None
-                                else ""
-                            )
-                            connection_active["zone"] = (
-                                setting_connection["zone"].value
-                                if setting_connection.get("zone", None) is not None
-                                else ""
-                            )
-                            status[interface_name][
-                                "connection_active" if is_legacy else "activeConnection"
-                            ] = connection_active
-
-                status[interface_name][
-                    "ip4config" if is_legacy else "ip4Config"
-                ] = await NetworkService.get_ip4config_properties(
-                    dev_properties.get("Ip4Config", ""), is_legacy
-                )
-                status[interface_name][
-                    "ip6config" if is_legacy else "ip6Config"
-                ] = await NetworkService.get_ip6config_properties(
-                    dev_properties.get("Ip6Config", ""), is_legacy
+        # Build the list of independent queries as (key, awaitable) tuples
+        queries = []
+        if dev_state == NMDeviceState.NM_DEVICE_STATE_ACTIVATED:
+            dev_active_conn_obj_path = dev_properties.get("ActiveConnection", None)
+            if dev_active_conn_obj_path is not None:
+                queries.append(
+                    (
+                        "connection_active" if is_legacy else "activeConnection",
+                        NetworkService.get_active_connection_status(
+                            dev_active_conn_obj_path, is_legacy
+                        ),
+                    )
                 )
-                status[interface_name][
-                    "dhcp4config" if is_legacy else "dhcp4Config"
-                ] = await NetworkService.get_dhcp4_config_properties(
-                    dev_properties.get("Dhcp4Config", ""), is_legacy
+            queries.extend(
+                [
+                    (
+                        "ip4config" if is_legacy else "ip4Config",
+                        NetworkService.get_ip4config_properties(
+                            dev_properties.get("Ip4Config", ""), is_legacy
+                        ),
+                    ),
+                    (
+                        "ip6config" if is_legacy else "ip6Config",
+                        NetworkService.get_ip6config_properties(
+                            dev_properties.get("Ip6Config", ""), is_legacy
+                        ),
+                    ),
+                    (
+                        "dhcp4config" if is_legacy else "dhcp4Config",
+                        NetworkService.get_dhcp4_config_properties(
+                            dev_properties.get("Dhcp4Config", ""), is_legacy
+                        ),
+                    ),
+                    (
+                        "dhcp6config" if is_legacy else "dhcp6Config",
+                        NetworkService.get_dhcp6_config_properties(
+                            dev_properties.get("Dhcp6Config", ""), is_legacy
+                        ),
+                    ),
+                ]
+            )
+
+        if device_type == NMDeviceType.NM_DEVICE_TYPE_ETHERNET:
+            queries.append(
+                (
+                    "wired",
+                    NetworkService.get_wired_properties(dev_obj_path, is_legacy),
                 )
-                status[interface_name][
-                    "dhcp6config" if is_legacy else "dhcp6Config"
-                ] = await NetworkService.get_dhcp6_config_properties(
-                    dev_properties.get("Dhcp6Config", ""), is_legacy
+            )
+
+        if device_type == NMDeviceType.NM_DEVICE_TYPE_WIFI:
+            queries.append(
+                (
+                    "wireless",
+                    NetworkService.get_wifi_status(
+                        dev_obj_path, dev_properties, is_legacy
+                    ),
                 )
+            )
 
-            if (
-                status[interface_name]["status"].get(
-                    "DeviceType" if is_legacy else "deviceType",
-                    NMDeviceType.NM_DEVICE_TYPE_UNKNOWN,
+        results = await NetworkService.gather_queries([aw for _, aw in queries])
+        for (key, _), result in zip(queries, results):
+            if result is None:
+                # The query failed (or returned nothing), so only this field is affected
+                if key in ["wired", "wireless"]:
+                    device_status[key] = {}
+                continue
+
+            if key == "wired":
+                result["HwAddress" if is_legacy else "hwAddress"] = dev_properties.get(
+                    "HwAddress", ""
                 )
-                == NMDeviceType.NM_DEVICE_TYPE_ETHERNET
-            ):
-                status[interface_name][
-                    "wired"
-                ] = await NetworkService.get_wired_properties(dev_obj_path, is_legacy)
-                status[interface_name]["wired"][
-                    "HwAddress" if is_legacy else "hwAddress"
-                ] = dev_properties.get("HwAddress", "")
+                device_status[key] = result
+            elif key == "wireless":
+                wireless, active_access_point = result
+                device_status[key] = wireless
+                if active_access_point is not None:
+                    device_status[
+                        "activeaccesspoint" if is_legacy else "activeAccessPoint"
+                    ] = active_access_point
+            else:
+                device_status[key] = result
+
+        return device_status
 
+    @staticmethod
+    async def get_status(is_legacy: bool = False) -> dict:
+        """
+        Retrieve the network status information. The per-device queries are issued concurrently.
+        """
+        devices = []
+        all_device_properties = await NetworkService.get_all_device_properties()
+        for dev_obj_path, dev_properties in all_device_properties:
+            dev_state = dev_properties.get("State", None)
             if (
-                status[interface_name]["status"].get(
-                    "DeviceType" if is_legacy else "deviceType",
-                    NMDeviceType.NM_DEVICE_TYPE_UNKNOWN,
-                )
-                == NMDeviceType.NM_DEVICE_TYPE_WIFI
+                dev_state is None
+                or dev_state == NMDeviceState.NM_DEVICE_STATE_UNMANAGED
             ):
-                wireless_properties = await NetworkManagerService().get_obj_properties(
-                    dev_obj_path, NetworkManagerService().NM_DEVICE_WIRELESS_IFACE
-                )
-                status[interface_name][
-                    "wireless"
-                ] = await NetworkService.get_wifi_properties(
-                    wireless_properties, is_legacy
+                continue
+
+            interface_name = dev_properties.get("Interface", None)
+            if interface_name is None:
+                continue
+            devices.append((interface_name, dev_obj_path, dev_properties))
+
+        device_statuses = await NetworkService.gather_queries(
+            [
+                NetworkService.get_device_status(
+                    dev_obj_path, dev_properties, is_legacy
                 )
-                status[interface_name]["wireless"][
-                    "HwAddress" if is_legacy else "hwAddress"
-                ] = dev_properties.get("HwAddress", "")
-                if dev_state == NMDeviceState.NM_DEVICE_STATE_ACTIVATED:
-                    status[interface_name][
-                        "activeaccesspoint" if is_legacy else "activeAccessPoint"
-                    ] = await NetworkService.get_ap_properties(
-                        wireless_properties, interface_name, is_legacy
-                    )
+                for _, dev_obj_path, dev_properties in devices
+            ]
+        )
 
+        status = {}
+        for (interface_name, _, _), device_status in zip(devices, device_statuses):
+            if device_status is not None:
+                status[interface_name] = device_status
         return status
 
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """
+        Retrieve the hit rate and staleness statistics of the NetworkManager object cache
+        """
+        return NetworkManagerService().get_cache_stats()
+
     @staticmethod
     async def get_available_connections(dev_props: dict) -> list:
         """
@@ -765,15 +856,17 @@ class NetworkService(metaclass=Singleton):
         # Retrive the list of object paths for the available connections
         available_connections = dev_props.get("AvailableConnections", [])
 
-        connections = []
-        for connection_obj_path in available_connections:
-            # Retrieve the connection's properties
-            connection_conn_props = (
-                await NetworkManagerService().get_connection_settings(
-                    connection_obj_path
-                )
-            )
+        # Retrieve the connections' properties concurrently
+        all_connection_conn_props = await NetworkService.gather_queries(
+            [
+                NetworkManagerService().get_connection_settings(connection_obj_path)
+                for connection_obj_path in available_connections
+            ],
+            default={},
+        )
 
+        connections = []
+        for connection_conn_props in all_connection_conn_props:
             # Retrieve the 'connection' settings property
             setting_connection = connection_conn_props.get("connection", None)
             if setting_connection is None:
@@ -794,18 +887,35 @@ class NetworkService(metaclass=Singleton):
         """
         Retrieve a list of status properties for the given target interface
         """
-        status = await NetworkService.get_status(is_legacy)
-        if target_interface_name not in status.keys():
-            return {}
-
-        dev_properties = status[target_interface_name]
-        dev_obj_paths = await NetworkManagerService().get_all_devices()
-        for dev_obj_path in dev_obj_paths:
-            dev_props = await NetworkManagerService().get_obj_properties(
-                dev_obj_path, NetworkManagerService().NM_DEVICE_IFACE
-            )
+        for dev_obj_path, dev_props in await NetworkService.get_all_device_properties():
             interface_name = dev_props.get("Interface", "")
             if target_interface_name == interface_name:
+                # Don't return interfaces in the 'unmanaged' state
+                dev_state = dev_props.get("State", None)
+                if (
+                    dev_state is None
+                    or dev_state == NMDeviceState.NM_DEVICE_STATE_UNMANAGED
+                ):
+                    return {}
+
+                # Retrieve the device status, active connection and available connections
+                # concurrently
+                (
+                    dev_properties,
+                    active_connection,
+                    available_connections,
+                ) = await NetworkService.gather_queries(
+                    [
+                        NetworkService.get_device_status(
+                            dev_obj_path, dev_props, is_legacy
+                        ),
+                        NetworkService.get_active_connection(dev_props),
+                        NetworkService.get_available_connections(dev_props),
+                    ]
+                )
+                if dev_properties is None:
+                    return {}
+
                 # Read all NM device properties
                 dev_properties["udi"] = dev_props.get("Udi", "")
                 dev_properties["path"] = dev_obj_path
@@ -835,7 +945,7 @@ class NetworkService(metaclass=Singleton):
                 ] = state_reason
                 dev_properties[
                     "connection_active" if is_legacy else "activeConnection"
-                ] = await NetworkService.get_active_connection(dev_props)
+                ] = (active_connection if active_connection is not None else {})
                 dev_properties["managed"] = bool(dev_props.get("Managed", False))
                 dev_properties["autoconnect"] = bool(
                     dev_props.get("Autoconnect", False)
@@ -848,7 +958,7 @@ class NetworkService(metaclass=Singleton):
                 ] = bool(dev_props.get("NmPluginMissing", False))
                 dev_properties[
                     "available_connections" if is_legacy else "availableConnections"
-                ] = await NetworkService.get_available_connections(dev_props)
+                ] = (available_connections if available_connections is not None else [])
                 dev_properties[
                     "physical_port_id" if is_legacy else "physicalPortId"
                 ] = dev_props.get("PhysicalPortId", "")
@@ -928,11 +1038,7 @@ class NetworkService(metaclass=Singleton):
             .split()
         )
 
-        dev_obj_paths = await NetworkManagerService().get_all_devices()
-        for dev_obj_path in dev_obj_paths:
-            dev_properties = await NetworkManagerService().get_obj_properties(
-                dev_obj_path, NetworkManagerService().NM_DEVICE_IFACE
-            )
+        for _, dev_properties in await NetworkService.get_all_device_properties():
             # Don't return interfaces in the 'unmanated' state
             dev_state = dev_properties.get("State", None)
             if (
@@ -959,15 +1065,12 @@ class NetworkService(metaclass=Singleton):
         This is used when the radio is intended to operate in AP + STA mode. Currently, only 'wlan1'
         as a 'managed' (or 'station') interface is supported.
         """
-        iw = IW()
         try:
-            iw.add_interface(ifname="wlan1", iftype="station", phy=0)
+            Nl80211Service().add_interface(ifname="wlan1", iftype="station", phy=0)
             return True
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to add interface: {str(exception)}")
             return False
-        finally:
-            iw.close()
 
     @staticmethod
     async def remove_virtual_interface() -> bool:
@@ -975,19 +1078,11 @@ class NetworkService(metaclass=Singleton):
         Remove a previously-created virtual network interface (wlan1) using 'netlink' (pyroute2) and
         return a boolean indicating success. Currently, only 'wlan1' is supported.
         """
-        iw = IW()
         try:
-            for interface in iw.get_interfaces_dump():
-                if str(interface.get_attr("NL80211_ATTR_IFNAME")) != "wlan1":
-                    continue
-
-                iw.del_interface(interface.get_attr("NL80211_ATTR_IFINDEX"))
-                return True
+            return Nl80211Service().del_interface("wlan1")
         except Exception as exception:
             syslog(LOG_ERR, f"Unable to del interface: {str(exception)}")
             return False
-        finally:
-            iw.close()
 
     @staticmethod
     async def get_interface_statistics(
@@ -1049,11 +1144,59 @@ class NetworkService(metaclass=Singleton):
         return (False, default_result)
 
     @staticmethod
-    async def get_all_connection_profiles(is_legacy: bool = False) -> List[dict] | dict:
+    async def get_active_connection_index() -> Dict[str, bool]:
+        """
+        Retrieve a dictionary which maps the object path of each connection profile backing an
+        active connection to whether or not that active connection is fully activated. The active
+        connections' properties are queried concurrently.
+        """
+        manager_props = await NetworkManagerService().get_obj_properties(
+            NetworkManagerService().NM_CONNECTION_MANAGER_OBJ_PATH,
+            NetworkManagerService().NM_CONNECTION_MANAGER_IFACE,
+        )
+        all_active_connection_props = await NetworkService.gather_queries(
+            [
+                NetworkManagerService().get_obj_properties(
+                    active_connection,
+                    NetworkManagerService().NM_CONNECTION_ACTIVE_IFACE,
+                )
+                for active_connection in manager_props.get("ActiveConnections", [])
+            ]
+        )
+
+        active_connection_index = {}
+        for active_connection_props in all_active_connection_props:
+            if not active_connection_props:
+                continue
+            active_connection_connection_obj_path = active_connection_props.get(
+                "Connection", None
+            )
+            if not active_connection_connection_obj_path:
+                continue
+            active_connection_index[active_connection_connection_obj_path] = (
+                active_connection_props.get("State", 0)
+                == NMActiveConnectionState.NM_ACTIVE_CONNECTION_STATE_ACTIVATED
+            )
+        return active_connection_index
+
+    @staticmethod
+    async def get_all_connection_profiles(
+        is_legacy: bool = False, fields: Optional[List[str]] = None
+    ) -> List[dict] | dict:
         """
         Retrieve a list (or dictionary if legacy support is requested) of known, valid
         NetworkManager connection profiles.
+
+        If 'fields' is provided, only the requested fields (any of 'id', 'uuid', 'type' and
+        'activated') are included in each (non-legacy) entry and any queries that are only needed
+        for the omitted fields are skipped.
         """
+        if fields is not None:
+            invalid_fields = set(fields) - set(CONNECTION_PROFILE_FIELDS)
+            if invalid_fields:
+                raise ValueError(f"Invalid fields: {', '.join(sorted(invalid_fields))}")
+        include_activated = is_legacy or fields is None or "activated" in fields
+
         result = {}
         unmanaged_devices = (
             ServerConfig()
@@ -1070,23 +1213,28 @@ class NetworkService(metaclass=Singleton):
 
         connection_obj_paths = settings_props.get("Connections", [])
 
-        manager_props = await NetworkManagerService().get_obj_properties(
-            NetworkManagerService().NM_CONNECTION_MANAGER_OBJ_PATH,
-            NetworkManagerService().NM_CONNECTION_MANAGER_IFACE,
+        # Retrieve the settings for all connections concurrently, along with the index of active
+        # connections (only if needed)
+        settings_query = NetworkService.gather_queries(
+            [
+                NetworkManagerService().get_connection_settings(conn)
+                for conn in connection_obj_paths
+            ]
         )
-        active_connection_obj_paths = manager_props.get("ActiveConnections", [])
+        if include_activated:
+            (active_connection_index, all_connection_settings) = await asyncio.gather(
+                NetworkService.get_active_connection_index(), settings_query
+            )
+        else:
+            active_connection_index = {}
+            all_connection_settings = await settings_query
 
         # Loop through the connections and build a dictionary to return
-        for conn in connection_obj_paths:
-            try:
-                connection_settings = (
-                    await NetworkManagerService().get_connection_settings(conn)
-                )
-            except Exception as exception:
-                syslog(
-                    LOG_ERR,
-                    f"Unable to read connection settings for {str(conn)} - {str(exception)}",
-                )
+        for conn, connection_settings in zip(
+            connection_obj_paths, all_connection_settings
+        ):
+            if connection_settings is None:
+                syslog(LOG_ERR, f"Unable to read connection settings for {str(conn)}")
                 continue
 
             connection_settings_connection = connection_settings.get("connection", None)
@@ -1103,32 +1251,7 @@ class NetworkService(metaclass=Singleton):
                 continue
 
             entry = {}
-            entry["activated"] = False
-            for active_connection in active_connection_obj_paths:
-                try:
-                    active_connection_props = (
-                        await NetworkManagerService().get_obj_properties(
-                            active_connection,
-                            NetworkManagerService().NM_CONNECTION_ACTIVE_IFACE,
-                        )
-                    )
-                except Exception as exception:
-                    syslog(
-                        LOG_ERR,
-                        f"Unable to read properties of active connection - {str(exception)}",
-                    )
-                    continue
-                active_connection_connection_obj_path = (
-                    active_connection_props["Connection"]
-                    if active_connection_props.get("Connection", None) is not None
-                    else ""
-                )
-                if active_connection_connection_obj_path == conn:
-                    entry["activated"] = (
-                        active_connection_props.get("State", 0)
-                        == NMActiveConnectionState.NM_ACTIVE_CONNECTION_STATE_ACTIVATED
-                    )
-                    break
+            entry["activated"] = active_connection_index.get(conn, False)
             if is_legacy:
                 # Legacy endpoints return 0 or 1 for activated
                 entry["activated"] = 1 if entry["activated"] else 0
@@ -1179,14 +1302,15 @@ class NetworkService(metaclass=Singleton):
         # Return a list of connection profiles for non-legacy
         new_result = []
         for uuid, entry in result.items():
-            new_result.append(
-                {
-                    "id": entry.get("id", ""),
-                    "uuid": uuid,
-                    "type": entry.get("type", ""),
-                    "activated": entry.get("activated", 0),
-                }
-            )
+            new_entry = {
+                "id": entry.get("id", ""),
+                "uuid": uuid,
+                "type": entry.get("type", ""),
+                "activated": entry.get("activated", 0),
+            }
+            if fields is not None:
+                new_entry = {key: new_entry[key] for key in fields}
+            new_result.append(new_entry)
         return new_result
 
     @staticmethod
@@ -1351,7 +1475,9 @@ class NetworkService(metaclass=Singleton):
         """Lookup the UUID of a connection profile using the provided id (name)"""
         uuid = ""
 
-        for entry in await NetworkService.get_all_connection_profiles(is_legacy=False):
+        for entry in await NetworkService.get_all_connection_profiles(
+            is_legacy=False, fields=["id", "uuid"]
+        ):
             if entry.get("id", "") == id:
                 uuid = entry.get("uuid", "")
                 break
@@ -1368,7 +1494,9 @@ class NetworkService(metaclass=Singleton):
         """Lookup the id (name) of a connection profile using the provided UUID"""
         id = ""
 
-        for entry in await NetworkService.get_all_connection_profiles(is_legacy=False):
+        for entry in await NetworkService.get_all_connection_profiles(
+            is_legacy=False, fields=["id", "uuid"]
+        ):
             if entry.get("uuid", "") == uuid:
                 id = entry.get("id", "")
                 break
@@ -2375,10 +2503,14 @@ class NetworkService(metaclass=Singleton):
         return settings
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def get_access_point_security_description(
         flags: int, wpa_flags: int, rsn_flags: int
     ) -> Tuple[str, str]:
-        """Analyze the provided AP flags and return the security and key management supported"""
+        """
+        Analyze the provided AP flags and return the security and key management supported. The
+        result only depends on the flags, so it is memoized.
+        """
 
         security_string = ""
         keymgmt = ""
@@ -2504,16 +2636,37 @@ class NetworkService(metaclass=Singleton):
         return -1
 
     @staticmethod
-    async def get_access_points(is_legacy: bool = False) -> list:
-        """
-        Retrieve a list of info on the cached APs know to NetworkManager
-        """
-        access_points = []
-        dev_obj_paths = await NetworkManagerService().get_all_devices()
-        for dev_obj_path in dev_obj_paths:
-            dev_properties = await NetworkManagerService().get_obj_properties(
-                dev_obj_path, NetworkManagerService().NM_DEVICE_IFACE
-            )
+    def access_point_in_band(frequency: int, band: WifiBandEnum) -> bool:
+        """Determine whether or not the given frequency (in MHz) falls within the given band"""
+        low, high = WIFI_BAND_FREQUENCY_RANGES[band]
+        return low <= frequency < high
+
+    @staticmethod
+    async def get_access_points(
+        is_legacy: bool = False,
+        min_strength: Optional[int] = None,
+        ssid_prefix: Optional[str] = None,
+        band: Optional[WifiBandEnum] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+    ) -> list:
+        """
+        Retrieve a list of info on the cached APs know to NetworkManager.
+
+        The list can optionally be filtered by minimum signal strength (percent), SSID prefix and
+        band, and sorted by any of the returned (non-legacy) fields.
+        """
+        if sort is not None and sort not in ACCESS_POINT_SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {sort}")
+
+        # Retrieve the properties of every AP on every Wi-Fi device concurrently. AP properties are
+        # kept up to date from NetworkManager signals by the object cache, so these are normally
+        # served from memory.
+        ap_obj_paths = []
+        for (
+            dev_obj_path,
+            dev_properties,
+        ) in await NetworkService.get_all_device_properties():
             if (
                 dev_properties.get("DeviceType", NMDeviceType.NM_DEVICE_TYPE_UNKNOWN)
                 == NMDeviceType.NM_DEVICE_TYPE_WIFI
@@ -2522,50 +2675,66 @@ class NetworkService(metaclass=Singleton):
                     dev_obj_path,
                     NetworkManagerService().NM_DEVICE_WIRELESS_IFACE,
                 )
-                for ap_obj_path in wireless_properties.get("AccessPoints", []):
-                    ap = await NetworkManagerService().get_obj_properties(
-                        ap_obj_path,
-                        NetworkManagerService().NM_ACCESS_POINT_IFACE,
-                    )
-                    flags = ap.get("Flags", NM80211ApFlags.NM_802_11_AP_FLAGS_NONE)
-                    wpa_flags = ap.get(
-                        "WpaFlags", NM80211ApSecurityFlags.NM_802_11_AP_SEC_NONE
-                    )
-                    rsn_flags = ap.get(
-                        "RsnFlags", NM80211ApSecurityFlags.NM_802_11_AP_SEC_NONE
-                    )
-                    (
-                        security_string,
-                        keymgmt,
-                    ) = NetworkService.get_access_point_security_description(
-                        flags=flags, wpa_flags=wpa_flags, rsn_flags=rsn_flags
-                    )
-                    ssid = ap.get("Ssid", None)
-                    ap_data = {}
-                    ap_data["SSID" if is_legacy else "ssid"] = (
-                        ssid.decode("utf-8") if ssid is not None else ""
-                    )
-                    ap_data["HwAddress" if is_legacy else "hwAddress"] = ap.get(
-                        "HwAddress", ""
-                    )
-                    ap_data["Strength" if is_legacy else "strength"] = ap.get(
-                        "Strength", 0
-                    )
-                    ap_data["MaxBitrate" if is_legacy else "maxBitrate"] = ap.get(
-                        "MaxBitrate", 0
-                    )
-                    ap_data["Frequency" if is_legacy else "frequency"] = ap.get(
-                        "Frequency", 0
-                    )
-                    ap_data["Flags" if is_legacy else "flags"] = flags
-                    ap_data["WpaFlags" if is_legacy else "wpaFlags"] = wpa_flags
-                    ap_data["RsnFlags" if is_legacy else "rsnFlags"] = rsn_flags
-                    ap_data["LastSeen" if is_legacy else "lastSeen"] = ap.get(
-                        "LastSeen", -1
-                    )
-                    ap_data["Security" if is_legacy else "security"] = security_string
-                    ap_data["Keymgmt" if is_legacy else "keymgmt"] = keymgmt
-                    access_points.append(ap_data)
+                ap_obj_paths.extend(wireless_properties.get("AccessPoints", []))
+
+        aps = await NetworkService.gather_queries(
+            [
+                NetworkManagerService().get_obj_properties(
+                    ap_obj_path,
+                    NetworkManagerService().NM_ACCESS_POINT_IFACE,
+                )
+                for ap_obj_path in ap_obj_paths
+            ]
+        )
+
+        access_points = []
+        for ap in aps:
+            if ap is None:
+                # The AP disappeared while being queried
+                continue
+
+            ssid = ap.get("Ssid", None)
+            ssid = ssid.decode("utf-8", errors="replace") if ssid is not None else ""
+            strength = ap.get("Strength", 0)
+            frequency = ap.get("Frequency", 0)
+            if min_strength is not None and strength < min_strength:
+                continue
+            if ssid_prefix is not None and not ssid.startswith(ssid_prefix):
+                continue
+            if band is not None and not NetworkService.access_point_in_band(
+                frequency, band
+            ):
+                continue
+
+            flags = ap.get("Flags", NM80211ApFlags.NM_802_11_AP_FLAGS_NONE)
+            wpa_flags = ap.get("WpaFlags", NM80211ApSecurityFlags.NM_802_11_AP_SEC_NONE)
+            rsn_flags = ap.get("RsnFlags", NM80211ApSecurityFlags.NM_802_11_AP_SEC_NONE)
+            (
+                security_string,
+                keymgmt,
+            ) = NetworkService.get_access_point_security_description(
+                flags=flags, wpa_flags=wpa_flags, rsn_flags=rsn_flags
+            )
+            ap_data = {}
+            ap_data["SSID" if is_legacy else "ssid"] = ssid
+            ap_data["HwAddress" if is_legacy else "hwAddress"] = ap.get("HwAddress", "")
+            ap_data["Strength" if is_legacy else "strength"] = strength
+            ap_data["MaxBitrate" if is_legacy else "maxBitrate"] = ap.get(
+                "MaxBitrate", 0
+            )
+            ap_data["Frequency" if is_legacy else "frequency"] = frequency
+            ap_data["Flags" if is_legacy else "flags"] = flags
+            ap_data["WpaFlags" if is_legacy else "wpaFlags"] = wpa_flags
+            ap_data["RsnFlags" if is_legacy else "rsnFlags"] = rsn_flags
+            ap_data["LastSeen" if is_legacy else "lastSeen"] = ap.get("LastSeen", -1)
+            ap_data["Security" if is_legacy else "security"] = security_string
+            ap_data["Keymgmt" if is_legacy else "keymgmt"] = keymgmt
+            access_points.append(ap_data)
+
+        if sort is not None:
+            sort_key = ACCESS_POINT_SORT_FIELDS[sort][0 if is_legacy else 1]
+            access_points.sort(key=lambda ap: ap[sort_key], reverse=descending)
+
         return access_points
 
     @staticmethod
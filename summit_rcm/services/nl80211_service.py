@@ -0,0 +1,279 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to provide a persistent nl80211 (pyroute2) client shared by the networking services.
+"""
+
+import os
+import select
+from syslog import LOG_ERR, syslog
+from threading import RLock
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from pyroute2 import IPRoute
+    from pyroute2.iwutil import IW
+    from pyroute2.netlink import NLM_F_REQUEST, NLM_F_DUMP
+    from pyroute2.netlink.nl80211 import nl80211cmd, NL80211_NAMES
+    from pyroute2.netlink.rtnl import RTMGRP_LINK
+except ImportError as error:
+    # Ignore the error if the pyroute2 module is not available if generating documentation
+    if os.environ.get("DOCS_GENERATION") != "True":
+        raise error
+from summit_rcm.utils import Singleton
+
+
+class Nl80211Service(metaclass=Singleton):
+    """
+    Service that owns a single, long-lived nl80211 socket and caches the mapping of interface
+    names to interface/phy indexes. The cache is invalidated whenever the kernel reports a link
+    change on the rtnetlink link multicast group.
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._iw: Optional["IW"] = None
+        self._link_monitor: Optional["IPRoute"] = None
+        self._interfaces: Dict[str, Tuple[int, int]] = {}
+        self._interfaces_valid: bool = False
+
+    def _get_iw(self) -> "IW":
+        """
+        Retrieve the nl80211 socket, opening it if necessary. The caller must hold the lock.
+        """
+        if self._iw is None:
+            self._iw = IW()
+        return self._iw
+
+    def _reset(self) -> None:
+        """
+        Close the nl80211 socket and drop all cached state so the next request starts from a
+        fresh socket. The caller must hold the lock.
+        """
+        if self._iw is not None:
+            try:
+                self._iw.close()
+            except Exception:
+                pass
+        self._iw = None
+        self._interfaces = {}
+        self._interfaces_valid = False
+
+    def _process_link_events(self) -> None:
+        """
+        Drain any pending rtnetlink link notifications without blocking and invalidate the
+        interface cache if one was received. The caller must hold the lock.
+        """
+        try:
+            if self._link_monitor is None:
+                self._link_monitor = IPRoute()
+                self._link_monitor.bind(groups=RTMGRP_LINK)
+                # Nothing was being monitored before now, so the cache cannot be trusted
+                self._interfaces_valid = False
+                return
+
+            while select.select([self._link_monitor.fileno()], [], [], 0)[0]:
+                if self._link_monitor.get():
+                    self._interfaces_valid = False
+        except Exception as exception:
+            syslog(LOG_ERR, f"Unable to read link events: {str(exception)}")
+            if self._link_monitor is not None:
+                try:
+                    self._link_monitor.close()
+                except Exception:
+                    pass
+            self._link_monitor = None
+            self._interfaces_valid = False
+
+    def _refresh_interfaces(self) -> None:
+        """
+        Rebuild the interface cache from a single interface dump. The caller must hold the lock.
+        """
+        interfaces = {}
+        for interface in self._get_iw().get_interfaces_dump():
+            interfaces[str(interface.get_attr("NL80211_ATTR_IFNAME"))] = (
+                interface.get_attr("NL80211_ATTR_IFINDEX"),
+                interface.get_attr("NL80211_ATTR_WIPHY"),
+            )
+        self._interfaces = interfaces
+        self._interfaces_valid = True
+
+    def _lookup(self, ifname: str) -> Tuple[int, int]:
+        """
+        Retrieve the (ifindex, phy) tuple for the given interface name, refreshing the cache only
+        when it has been invalidated. The caller must hold the lock.
+        """
+        self._process_link_events()
+        if not self._interfaces_valid or ifname not in self._interfaces:
+            self._refresh_interfaces()
+
+        if ifname not in self._interfaces:
+            raise Exception("interface not found")
+
+        return self._interfaces[ifname]
+
+    def _request(self, cmd: str, ifindex: int, dump: bool = True) -> list:
+        """
+        Issue the given nl80211 command for the given interface index. The caller must hold the
+        lock.
+        """
+        iw = self._get_iw()
+        msg = nl80211cmd()
+        msg["cmd"] = NL80211_NAMES[cmd]
+        msg["attrs"] = [["NL80211_ATTR_IFINDEX", ifindex]]
+        return iw.nlm_request(
+            msg,
+            msg_type=iw.prid,
+            msg_flags=NLM_F_REQUEST | NLM_F_DUMP if dump else NLM_F_REQUEST,
+        )
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached interface name to index mapping
+        """
+        with self._lock:
+            self._interfaces_valid = False
+
+    def get_ifindex(self, ifname: str) -> int:
+        """
+        Retrieve the interface index for the given interface name
+        """
+        with self._lock:
+            try:
+                return self._lookup(ifname)[0]
+            except Exception:
+                self._reset()
+                raise
+
+    def get_phy(self, ifname: str) -> int:
+        """
+        Retrieve the phy index for the given interface name
+        """
+        with self._lock:
+            try:
+                return self._lookup(ifname)[1]
+            except Exception:
+                self._reset()
+                raise
+
+    @staticmethod
+    def _parse_bitrate(rate_info) -> Optional[float]:
+        """
+        Convert an NL80211_RATE_INFO attribute into a bitrate in Mbit/s
+        """
+        if rate_info is None:
+            return None
+
+        bitrate = rate_info.get_attr("NL80211_RATE_INFO_BITRATE32")
+        if bitrate is None:
+            bitrate = rate_info.get_attr("NL80211_RATE_INFO_BITRATE")
+        if bitrate is None:
+            return None
+
+        # Rates are reported in units of 100 kbit/s
+        return float(bitrate) / 10
+
+    def get_station_snapshot(self, ifname: str, include_frequency: bool = True) -> dict:
+        """
+        Retrieve the signal (dBm), TX/RX bitrates (Mbit/s) and operating frequency (MHz) of the
+        station associated on the given interface.
+
+        The station statistics are read with a single NL80211_CMD_GET_STATION request. The
+        operating frequency is not part of the station info, so it is read with a single
+        (non-dump) NL80211_CMD_GET_INTERFACE request for the cached interface index, which can be
+        skipped with 'include_frequency'.
+        """
+        with self._lock:
+            try:
+                ifindex = self._lookup(ifname)[0]
+
+                res = self._request("NL80211_CMD_GET_STATION", ifindex)
+                if not res:
+                    raise Exception("no station found")
+                sta_info = res[0].get_attr("NL80211_ATTR_STA_INFO")
+
+                frequency = None
+                if include_frequency:
+                    try:
+                        res = self._request(
+                            "NL80211_CMD_GET_INTERFACE", ifindex, dump=False
+                        )
+                        if res:
+                            frequency = res[0].get_attr("NL80211_ATTR_WIPHY_FREQ")
+                    except Exception:
+                        # Older kernels do not report the operating frequency here
+                        pass
+
+                signal = sta_info.get_attr("NL80211_STA_INFO_SIGNAL")
+                return {
+                    "signal": float(signal) if signal is not None else None,
+                    "txBitrate": self._parse_bitrate(
+                        sta_info.get_attr("NL80211_STA_INFO_TX_BITRATE")
+                    ),
+                    "rxBitrate": self._parse_bitrate(
+                        sta_info.get_attr("NL80211_STA_INFO_RX_BITRATE")
+                    ),
+                    "frequency": int(frequency) if frequency is not None else None,
+                }
+            except Exception:
+                self._reset()
+                raise
+
+    def get_scan_frequency(self, ifname: str) -> int:
+        """
+        Retrieve the frequency of the first BSS in the scan results of the given interface
+        """
+        with self._lock:
+            try:
+                res = self._request("NL80211_CMD_GET_SCAN", self._lookup(ifname)[0])
+                return int(
+                    res[0]
+                    .get_attr("NL80211_ATTR_BSS")
+                    .get_attr("NL80211_BSS_FREQUENCY")
+                )
+            except Exception:
+                self._reset()
+                raise
+
+    def get_regulatory_domain(self) -> List:
+        """
+        Retrieve the regulatory domain info for all phys
+        """
+        with self._lock:
+            try:
+                return self._get_iw().get_regulatory_domain()
+            except Exception:
+                self._reset()
+                raise
+
+    def add_interface(self, ifname: str, iftype: str, phy: int) -> None:
+        """
+        Add a virtual interface on the given phy
+        """
+        with self._lock:
+            try:
+                self._get_iw().add_interface(ifname=ifname, iftype=iftype, phy=phy)
+            except Exception:
+                self._reset()
+                raise
+            self._interfaces_valid = False
+
+    def del_interface(self, ifname: str) -> bool:
+        """
+        Delete the given virtual interface and return a boolean indicating whether it existed
+        """
+        with self._lock:
+            try:
+                self._process_link_events()
+                self._refresh_interfaces()
+                if ifname not in self._interfaces:
+                    return False
+
+                self._get_iw().del_interface(self._interfaces[ifname][0])
+            except Exception:
+                self._reset()
+                raise
+            self._interfaces_valid = False
+            return True
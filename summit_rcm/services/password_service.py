@@ -0,0 +1,128 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to handle password hashing
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import hmac
+from summit_rcm.settings import ServerConfig
+from summit_rcm.utils import Singleton
+
+PASSWORD_HASH_SCHEME = "pbkdf2_sha256"
+DEFAULT_PASSWORD_HASH_ITERATIONS = 100000
+DEFAULT_PASSWORD_HASH_WORKERS = 1
+DEFAULT_PASSWORD_VERIFY_MAX_PENDING = 4
+
+
+class PasswordServiceBusyError(Exception):
+    """
+    Custom error for when a password can't be verified because too many verifications are
+    already in progress.
+    """
+
+
+class PasswordService(metaclass=Singleton):
+    """
+    Service to hash and verify passwords. Passwords are hashed with PBKDF2-HMAC-SHA256 and stored
+    as 'pbkdf2_sha256$<iterations>$<hash>'. Hashes without a scheme are legacy salted SHA-256
+    hashes, which are still accepted so they can be upgraded on the next successful login.
+
+    The key derivation is deliberately slow, so it is run in a small, dedicated thread pool to
+    keep it off the event loop. The number of verifications in progress is capped, and any beyond
+    the cap are rejected rather than queued, so a burst of login attempts can't build up an
+    unbounded backlog of hashing jobs.
+    """
+
+    def __init__(self) -> None:
+        parser = ServerConfig().get_parser()
+        self._iterations: int = max(
+            1,
+            parser.getint(
+                "summit-rcm",
+                "password_hash_iterations",
+                fallback=DEFAULT_PASSWORD_HASH_ITERATIONS,
+            ),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(
+                1,
+                parser.getint(
+                    "summit-rcm",
+                    "password_hash_workers",
+                    fallback=DEFAULT_PASSWORD_HASH_WORKERS,
+                ),
+            ),
+            thread_name_prefix="password-hash",
+        )
+        self._verify_slots = asyncio.Semaphore(
+            max(
+                1,
+                parser.getint(
+                    "summit-rcm",
+                    "password_verify_max_pending",
+                    fallback=DEFAULT_PASSWORD_VERIFY_MAX_PENDING,
+                ),
+            )
+        )
+
+    def hash_password(self, salt: str, password: str) -> str:
+        """Hash the given password with the given salt (blocking)"""
+        digest = hashlib.pbkdf2_hmac(
+            "sha256", password.encode(), salt.encode(), self._iterations
+        )
+        return f"{PASSWORD_HASH_SCHEME}${self._iterations}${digest.hex()}"
+
+    @staticmethod
+    def check_password(salt: str, password: str, password_hash: str) -> bool:
+        """
+        Check the given password against the given stored hash in constant time (blocking)
+        """
+        if "$" not in password_hash:
+            # Legacy salted SHA-256 hash
+            attempt = hashlib.sha256(salt.encode() + password.encode()).hexdigest()
+            return hmac.compare_digest(attempt, password_hash)
+
+        try:
+            scheme, iterations, expected = password_hash.split("$", 2)
+            if scheme != PASSWORD_HASH_SCHEME:
+                return False
+            attempt = hashlib.pbkdf2_hmac(
+                "sha256", password.encode(), salt.encode(), int(iterations)
+            ).hex()
+        except ValueError:
+            return False
+        return hmac.compare_digest(attempt, expected)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Retrieve whether or not the given stored hash is a legacy hash or was generated with
+        different parameters than those currently configured
+        """
+        return not password_hash.startswith(
+            f"{PASSWORD_HASH_SCHEME}${self._iterations}$"
+        )
+
+    async def hash(self, salt: str, password: str) -> str:
+        """Hash the given password with the given salt in the password hashing thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.hash_password, salt, password
+        )
+
+    async def verify(self, salt: str, password: str, password_hash: str) -> bool:
+        """
+        Check the given password against the given stored hash in the password hashing thread
+        pool. Raises PasswordServiceBusyError if the maximum number of verifications is already
+        in progress.
+        """
+        if self._verify_slots.locked():
+            raise PasswordServiceBusyError()
+
+        async with self._verify_slots:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.check_password, salt, password, password_hash
+            )
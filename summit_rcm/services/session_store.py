@@ -0,0 +1,269 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to hold the session stores used by the login service
+"""
+
+import asyncio
+import heapq
+import json
+import os
+from pathlib import Path
+from syslog import LOG_ERR, syslog
+from threading import Lock
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_SESSION_STORE_PATH = "/data/secret/summit-rcm/sessions.json"
+SESSION_STORE_PERSIST_INTERVAL_S = 60
+SESSION_STORE_SAVE_DELAY_S = 0.5
+
+
+class Session:
+    """Data class to hold info about a session"""
+
+    id: str
+    expiry: int
+    username: str
+
+    def __init__(self, id: str, expiry: int, username: str) -> None:
+        self.id = id
+        self.expiry = expiry
+        self.username = username
+
+
+class MemorySessionStore:
+    """
+    In-memory session store. A store only has to keep track of sessions; the login service
+    decides when they expire. Sessions are indexed by ID and by username, and a min-heap ordered
+    by expiry lets expired sessions be found without scanning every session.
+
+    The heap holds one entry per session. Extending a session's expiry does not touch the heap;
+    instead, when an entry reaches the top of the heap and the session turns out to have been
+    extended, it is pushed back with its current expiry.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, Session] = {}
+        self._sessions_by_username: Dict[str, Set[str]] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
+
+    def _discard(self, session_id: str) -> Optional[Session]:
+        """
+        Remove the session with the given ID from the indexes. Its heap entry is left behind and
+        discarded once it reaches the top of the heap.
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return None
+
+        user_sessions = self._sessions_by_username.get(session.username, None)
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._sessions_by_username[session.username]
+        return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """Retrieve the session with the given ID, if it exists"""
+        return self._sessions.get(session_id, None)
+
+    def add(self, session: Session) -> None:
+        """Add the given session, replacing any existing session with the same ID"""
+        self._discard(session.id)
+        self._sessions[session.id] = session
+        self._sessions_by_username.setdefault(session.username, set()).add(session.id)
+        heapq.heappush(self._expiry_heap, (session.expiry, session.id))
+
+    def remove(self, session_id: str) -> Optional[Session]:
+        """Remove and return the session with the given ID, if it exists"""
+        return self._discard(session_id)
+
+    def touch(self, session_id: str, expiry: int) -> bool:
+        """Update the expiry of the session with the given ID and return whether it exists"""
+        session = self._sessions.get(session_id, None)
+        if session is None:
+            return False
+
+        session.expiry = expiry
+        return True
+
+    def has_user(self, username: str) -> bool:
+        """Retrieve whether or not the given user has at least one session"""
+        return username in self._sessions_by_username
+
+    def sweep(self, now: int) -> int:
+        """Remove every session that has expired by 'now' and return the number removed"""
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, session_id = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(session_id, None)
+            if session is None:
+                # Stale entry for a session that was already removed
+                continue
+
+            if session.expiry > now:
+                # The session was kept alive, so requeue it with its current expiry
+                heapq.heappush(self._expiry_heap, (session.expiry, session_id))
+                continue
+
+            self._discard(session_id)
+            removed += 1
+
+        # Drop stale entries left behind by removed sessions once they outnumber live ones
+        if len(self._expiry_heap) > 2 * len(self._sessions) + 16:
+            self._expiry_heap = [
+                (session.expiry, session.id) for session in self._sessions.values()
+            ]
+            heapq.heapify(self._expiry_heap)
+        return removed
+
+    def flush(self) -> None:
+        """Write out any changes that are waiting to be persisted"""
+
+    def __iter__(self) -> Iterator[Session]:
+        return iter(list(self._sessions.values()))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class FileSessionStore(MemorySessionStore):
+    """
+    Session store that keeps sessions in memory and persists them to a JSON file so they survive
+    service restarts. The file is rewritten atomically whenever a session is added or removed;
+    expiry updates from keepalives are written at most every SESSION_STORE_PERSIST_INTERVAL_S
+    seconds.
+
+    When called from the event loop, writes are deferred by SESSION_STORE_SAVE_DELAY_S so that
+    changes made close together are written once, and they are performed off the event loop.
+    """
+
+    def __init__(self, path: str = DEFAULT_SESSION_STORE_PATH) -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._dirty: bool = False
+        self._last_persisted: float = 0.0
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._write_lock = Lock()
+        self._generation: int = 0
+        self._saved_generation: int = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Load any previously persisted sessions"""
+        try:
+            if not self._path.exists():
+                return
+
+            with open(self._path, "r") as sessions_file:
+                for entry in json.load(sessions_file):
+                    super().add(
+                        Session(
+                            id=str(entry["id"]),
+                            expiry=int(entry["expiry"]),
+                            username=str(entry["username"]),
+                        )
+                    )
+        except Exception as exception:
+            syslog(LOG_ERR, f"Unable to load persisted sessions - {str(exception)}")
+
+    def _snapshot(self) -> Tuple[int, List[dict]]:
+        """Capture the current sessions for writing"""
+        self._generation += 1
+        self._dirty = False
+        self._last_persisted = time.monotonic()
+        return (
+            self._generation,
+            [
+                {
+                    "id": session.id,
+                    "expiry": session.expiry,
+                    "username": session.username,
+                }
+                for session in self._sessions.values()
+            ],
+        )
+
+    def _write(self, generation: int, sessions: List[dict]) -> None:
+        """
+        Atomically rewrite the sessions file with the given snapshot, unless a newer snapshot has
+        already been written
+        """
+        with self._write_lock:
+            if generation <= self._saved_generation:
+                return
+
+            tmp_path = self._path.with_name(self._path.name + ".tmp")
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as sessions_file:
+                    json.dump(sessions, sessions_file)
+                    sessions_file.flush()
+                    os.fsync(sessions_file.fileno())
+                os.replace(tmp_path, self._path)
+                self._saved_generation = generation
+            except Exception as exception:
+                syslog(LOG_ERR, f"Unable to persist sessions - {str(exception)}")
+                tmp_path.unlink(missing_ok=True)
+
+    def _write_behind(self) -> None:
+        """Write the sessions file from the default executor"""
+        self._save_handle = None
+        asyncio.get_running_loop().run_in_executor(None, self._write, *self._snapshot())
+
+    def _persist(self) -> None:
+        """
+        Persist the sessions. When called from the event loop, the write is deferred and
+        performed off the event loop. Otherwise, the sessions are written immediately.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(*self._snapshot())
+            return
+
+        self._dirty = True
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(
+                SESSION_STORE_SAVE_DELAY_S, self._write_behind
+            )
+
+    def flush(self) -> None:
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._dirty:
+            self._write(*self._snapshot())
+
+    def add(self, session: Session) -> None:
+        super().add(session)
+        self._persist()
+
+    def remove(self, session_id: str) -> Optional[Session]:
+        session = super().remove(session_id)
+        if session is not None:
+            self._persist()
+        return session
+
+    def touch(self, session_id: str, expiry: int) -> bool:
+        if not super().touch(session_id, expiry):
+            return False
+
+        self._dirty = True
+        if time.monotonic() - self._last_persisted >= SESSION_STORE_PERSIST_INTERVAL_S:
+            self._persist()
+        return True
+
+    def sweep(self, now: int) -> int:
+        removed = super().sweep(now)
+        if removed or (
+            self._dirty
+            and time.monotonic() - self._last_persisted
+            >= SESSION_STORE_PERSIST_INTERVAL_S
+        ):
+            self._persist()
+        return removed
@@ -6,8 +6,9 @@
 Module to handle user management interactions
 """
 
-import hashlib
 import uuid
+from summit_rcm.services.login_service import LoginService
+from summit_rcm.services.password_service import PasswordService
 from summit_rcm.settings import (
     ServerConfig,
     SummitRCMConfigManage,
@@ -20,17 +21,34 @@ class UserService(metaclass=Singleton):
     """Service to handle user management"""
 
     @staticmethod
-    def verify(username: str, password: str) -> bool:
-        """Verify the provided username and password are correct"""
+    async def verify(username: str, password: str) -> bool:
+        """
+        Verify the provided username and password are correct. Blocked users and passwords that
+        recently failed for the user are rejected without hashing them again, and a password
+        stored with a legacy or outdated hash is re-hashed once it has been verified.
 
-        key = SummitRCMConfigManage.get_key_from_section(username, "salt")
-        if not key:
-            return False
+        Raises PasswordServiceBusyError if too many passwords are already being verified.
+        """
 
-        attempt = hashlib.sha256(key.encode() + password.encode()).hexdigest()
-        return attempt == SummitRCMConfigManage.get_key_from_section(
+        key = SummitRCMConfigManage.get_key_from_section(username, "salt")
+        password_hash = SummitRCMConfigManage.get_key_from_section(
             username, "password", None
         )
+        if not key or not password_hash or password is None:
+            return False
+
+        if LoginService().is_user_blocked(username):
+            return False
+
+        if LoginService().is_failed_password(username, password):
+            return False
+
+        if not await PasswordService().verify(key, password, password_hash):
+            return False
+
+        if PasswordService().needs_rehash(password_hash):
+            await UserService.update_password(username, password)
+        return True
 
     @staticmethod
     def user_exists(username: str) -> bool:
@@ -39,46 +57,55 @@ class UserService(metaclass=Singleton):
         return SummitRCMConfigManage.verify_section(username)
 
     @staticmethod
-    def delete_user(username: str) -> bool:
+    async def delete_user(username: str) -> bool:
         """Delete the user with the specified username"""
 
         if SummitRCMConfigManage.remove_section(username):
-            return SummitRCMConfigManage.save()
+            LoginService().forget_failed_passwords(username)
+            return await SummitRCMConfigManage.flush_async()
         return False
 
     @staticmethod
-    def add_user(username: str, password: str, permission: str = None) -> bool:
+    async def add_user(username: str, password: str, permission: str = None) -> bool:
         """Add a new user with the specified username, password, and permissions"""
 
+        if SummitRCMConfigManage.verify_section(username):
+            return False
+
+        salt = uuid.uuid4().hex
+        password_hash = await PasswordService().hash(salt, password)
         if SummitRCMConfigManage.add_section(username):
-            salt = uuid.uuid4().hex
+            LoginService().forget_failed_passwords(username)
             SummitRCMConfigManage.update_key_from_section(username, "salt", salt)
             SummitRCMConfigManage.update_key_from_section(
-                username,
-                "password",
-                hashlib.sha256(salt.encode() + password.encode()).hexdigest(),
+                username, "password", password_hash
             )
             if permission:
                 SummitRCMConfigManage.update_key_from_section(
                     username, "permission", permission
                 )
-            return SummitRCMConfigManage.save()
+            return await SummitRCMConfigManage.flush_async()
         return False
 
     @staticmethod
-    def update_password(username: str, password: str) -> bool:
+    async def update_password(username: str, password: str) -> bool:
         """Update the password for the user with the specified username"""
 
-        if SummitRCMConfigManage.get_key_from_section(username, "salt", None):
-            salt = uuid.uuid4().hex
-            SummitRCMConfigManage.update_key_from_section(username, "salt", salt)
-            SummitRCMConfigManage.update_key_from_section(
-                username,
-                "password",
-                hashlib.sha256(salt.encode() + password.encode()).hexdigest(),
-            )
-            return SummitRCMConfigManage.save()
-        return False
+        if not SummitRCMConfigManage.get_key_from_section(username, "salt", None):
+            return False
+
+        salt = uuid.uuid4().hex
+        password_hash = await PasswordService().hash(salt, password)
+        if not SummitRCMConfigManage.get_key_from_section(username, "salt", None):
+            # The user was deleted while the password was being hashed
+            return False
+
+        LoginService().forget_failed_passwords(username)
+        SummitRCMConfigManage.update_key_from_section(username, "salt", salt)
+        SummitRCMConfigManage.update_key_from_section(
+            username, "password", password_hash
+        )
+        return await SummitRCMConfigManage.flush_async()
 
     @staticmethod
     def get_permission(username: str) -> str:
@@ -122,13 +149,13 @@ class UserService(metaclass=Singleton):
         return user_dict
 
     @staticmethod
-    def update_user(username: str, password: str, permission: str) -> bool:
+    async def update_user(username: str, password: str, permission: str) -> bool:
         """
         Update the password and permissions for the user with the specified username, new password,
         and new permissions
         """
 
-        return UserService.update_password(
+        return await UserService.update_password(
             username, password
         ) and UserService.update_permission(username, permission)
 
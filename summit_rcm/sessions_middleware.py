@@ -6,8 +6,10 @@
 Module for handling 'sessions' as a Falcon middleware
 """
 
+from collections import OrderedDict
+from datetime import datetime
 from syslog import syslog
-from typing import Any
+from typing import Any, Optional
 import falcon.asgi
 from summit_rcm.services.login_service import LoginService
 from summit_rcm.settings import SystemSettingsManage
@@ -16,34 +18,99 @@ from summit_rcm.utils import (
     convert_dict_to_base64_string,
 )
 
+SESSION_CACHE_SIZE = 128
+
+
+class SessionCacheEntry:
+    """Decoded payload of a session cookie and when the client was last told it expires"""
+
+    def __init__(self, payload: dict, cookie_expiry: Optional[int] = None) -> None:
+        self.payload = payload
+        self.cookie_expiry = cookie_expiry
+
 
 class SessionsMiddleware:
     """
-    Middleware to enable sessions
+    Middleware to enable sessions. Decoded session cookies are cached by cookie value, and the
+    cookie is only sent back to the client when its content changes or the session now outlives
+    the cookie.
     """
 
     def __init__(self, session_cookie: str = "session_id") -> None:
         self._session_cookie = session_cookie
+        self._session_cache: "OrderedDict[str, SessionCacheEntry]" = OrderedDict()
+
+    def _get_cache_entry(self, cookie_value: str) -> SessionCacheEntry:
+        entry = self._session_cache.get(cookie_value, None)
+        if entry is not None:
+            self._session_cache.move_to_end(cookie_value)
+            return entry
+
+        entry = SessionCacheEntry(convert_base64_string_to_dict(cookie_value))
+        self._cache_entry(cookie_value, entry)
+        return entry
+
+    def _cache_entry(self, cookie_value: str, entry: SessionCacheEntry) -> None:
+        self._session_cache[cookie_value] = entry
+        self._session_cache.move_to_end(cookie_value)
+        while len(self._session_cache) > SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
 
     def _load_session_cookie(self, req: falcon.asgi.Request) -> dict:
         try:
             session_cookie = req.get_cookie_values(self._session_cookie)
             if not session_cookie:
                 raise Exception("No cookie found")
-            return convert_base64_string_to_dict(session_cookie[0])
+            # Hand out a copy so the cached payload can't be modified by a request
+            return dict(self._get_cache_entry(session_cookie[0]).payload)
         except Exception:
             return {}
 
+    def _set_session_cookie(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response, session: dict
+    ) -> None:
+        """
+        Send the session cookie to the client if its content changed or if the session will
+        outlive the cookie the client already has
+        """
+        now = int(round(datetime.utcnow().timestamp()))
+        max_age = SystemSettingsManage.get_session_timeout() * 60
+        session_cookie = req.get_cookie_values(self._session_cookie)
+        cookie_value = session_cookie[0] if session_cookie else None
+
+        entry = self._session_cache.get(cookie_value, None)
+        if entry is not None and entry.payload == session:
+            session_expiry = LoginService().get_session_expiry(cookie_value)
+            if session_expiry is None:
+                # The session is gone (e.g., after logging out), so don't refresh its cookie
+                self._session_cache.pop(cookie_value, None)
+                return
+
+            if (
+                entry.cookie_expiry is not None
+                and entry.cookie_expiry >= session_expiry
+            ):
+                return
+        else:
+            cookie_value = convert_dict_to_base64_string(session)
+            entry = SessionCacheEntry(dict(session))
+
+        resp.set_cookie(
+            self._session_cookie,
+            cookie_value,
+            path="/",
+            max_age=max_age,
+        )
+        entry.cookie_expiry = now + max_age
+        self._cache_entry(cookie_value, entry)
+
     async def process_request(
         self, req: falcon.asgi.Request, resp: falcon.asgi.Response
     ) -> None:
-        LoginService().cleanup_expired_sessions()
-
         req.context.valid_session = False
         session_cookie = req.get_cookie_values(self._session_cookie)
         try:
             if session_cookie:
-                LoginService().cleanup_expired_sessions()
                 req.context.session_id = session_cookie[0]
                 req.context.valid_session = LoginService().session_is_valid(
                     req.context.session_id
@@ -74,13 +141,10 @@ class SessionsMiddleware:
     async def process_request_ws(
         self, req: falcon.asgi.Request, _: falcon.asgi.WebSocket
     ) -> None:
-        LoginService().cleanup_expired_sessions()
-
         req.context.valid_session = False
         session_cookie = req.get_cookie_values(self._session_cookie)
         try:
             if session_cookie:
-                LoginService().cleanup_expired_sessions()
                 req.context.session_id = session_cookie[0]
                 req.context.valid_session = LoginService().session_is_valid(
                     req.context.session_id
@@ -110,22 +174,12 @@ class SessionsMiddleware:
 
             if hasattr(req.context, "_session") and req.context.valid_session:
                 # Session was previously validated in process_request()
-                resp.set_cookie(
-                    self._session_cookie,
-                    convert_dict_to_base64_string(req.context._session),
-                    path="/",
-                    max_age=SystemSettingsManage.get_session_timeout() * 60,
-                )
+                self._set_session_cookie(req, resp, req.context._session)
                 return
 
             if hasattr(resp.context, "_session") and resp.context.valid_session:
                 # Session was just validated by a login request
-                resp.set_cookie(
-                    self._session_cookie,
-                    convert_dict_to_base64_string(resp.context._session),
-                    path="/",
-                    max_age=SystemSettingsManage.get_session_timeout() * 60,
-                )
+                self._set_session_cookie(req, resp, resp.context._session)
                 return
         except Exception as exception:
             syslog(f"Error processing response - {str(exception)}")
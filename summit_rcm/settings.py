@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: LicenseRef-Ezurio-Clause
 # Copyright (C) 2024 Ezurio LLC.
 #
+import asyncio
 import os
 import configparser
+import io
 from syslog import LOG_ERR, syslog
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from threading import Lock
 
 try:
@@ -21,6 +23,8 @@ except ImportError as error:
 from summit_rcm.utils import Singleton
 from summit_rcm import definition
 
+SETTINGS_SAVE_DELAY_S = 0.5
+""" Changes saved within this window are coalesced into a single write """
 
 """
     Summit RCM system settings manage based on configParser
@@ -39,6 +43,16 @@ class SummitRCMConfigManage(object):
     _filename = definition.SUMMIT_RCM_SETTINGS_FILE
     if os.path.isfile(_filename):
         _parser.read(_filename)
+    # Incremented whenever a setting changes so callers can cache derived values
+    _generation = 0
+    # Serializes writes of the settings file
+    _save_lock = Lock()
+    _saved_generation = 0
+    _save_handle: Optional[asyncio.TimerHandle] = None
+
+    @classmethod
+    def get_generation(cls) -> int:
+        return cls._generation
 
     @classmethod
     def verify_section(cls, section):
@@ -52,6 +66,7 @@ class SummitRCMConfigManage(object):
         with cls._lock:
             if not cls._parser.has_section(section):
                 cls._parser.add_section(section)
+                cls._generation += 1
                 return True
         return False
 
@@ -60,6 +75,7 @@ class SummitRCMConfigManage(object):
         with cls._lock:
             if cls._parser.has_section(section):
                 cls._parser.remove_section(section)
+                cls._generation += 1
                 return True
         return False
 
@@ -68,6 +84,7 @@ class SummitRCMConfigManage(object):
         with cls._lock:
             if cls._parser.has_section(section):
                 cls._parser.set(section, key, val)
+                cls._generation += 1
                 return True
         return False
 
@@ -88,6 +105,7 @@ class SummitRCMConfigManage(object):
         with cls._lock:
             if cls._parser.has_section(section):
                 cls._parser.remove_option(section, key)
+                cls._generation += 1
 
     @classmethod
     def get_section_size_by_key(cls, key):
@@ -116,13 +134,90 @@ class SummitRCMConfigManage(object):
                     result[k] = cls._parser.get(k, key)
         return result
 
+    @classmethod
+    def _write(cls) -> bool:
+        """
+        Atomically write the settings file (temp file + fsync + rename) if anything has changed
+        since it was last written
+        """
+        with cls._save_lock:
+            with cls._lock:
+                generation = cls._generation
+                if generation == cls._saved_generation:
+                    return True
+                contents = io.StringIO()
+                cls._parser.write(contents)
+
+            tmp_filename = f"{cls._filename}.tmp"
+            try:
+                fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as fp:
+                    if os.path.isfile(cls._filename):
+                        os.fchmod(fp.fileno(), os.stat(cls._filename).st_mode & 0o7777)
+                    fp.write(contents.getvalue())
+                    fp.flush()
+                    os.fsync(fp.fileno())
+                os.replace(tmp_filename, cls._filename)
+
+                dir_fd = os.open(os.path.dirname(cls._filename) or ".", os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except Exception as exception:
+                syslog(LOG_ERR, f"Unable to save settings - {str(exception)}")
+                try:
+                    os.unlink(tmp_filename)
+                except OSError:
+                    pass
+                return False
+
+            cls._saved_generation = generation
+            return True
+
+    @classmethod
+    def _write_behind(cls) -> None:
+        """Write the settings file from the default executor"""
+        cls._save_handle = None
+        asyncio.get_running_loop().run_in_executor(None, cls._write)
+
     @classmethod
     def save(cls):
-        with cls._lock:
-            with open(cls._filename, "w") as fp:
-                cls._parser.write(fp)
-                return True
-        return False
+        """
+        Save the settings. When called from the event loop, the write is deferred by
+        SETTINGS_SAVE_DELAY_S so that changes made close together are written once, and it is
+        performed off the event loop. Otherwise, the settings are written immediately.
+
+        A deferred write always reports success; callers that must know whether the settings
+        reached storage should await 'flush_async' instead.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return cls._write()
+
+        if cls._save_handle is None:
+            cls._save_handle = loop.call_later(SETTINGS_SAVE_DELAY_S, cls._write_behind)
+        return True
+
+    @classmethod
+    def flush(cls) -> bool:
+        """Immediately write any pending changes"""
+        if cls._save_handle is not None:
+            cls._save_handle.cancel()
+            cls._save_handle = None
+        return cls._write()
+
+    @classmethod
+    async def flush_async(cls) -> bool:
+        """
+        Immediately write any pending changes, off the event loop, and return whether the write
+        succeeded
+        """
+        if cls._save_handle is not None:
+            cls._save_handle.cancel()
+            cls._save_handle = None
+        return await asyncio.get_running_loop().run_in_executor(None, cls._write)
 
 
 class SystemSettingsManage(object):
@@ -130,6 +225,29 @@ class SystemSettingsManage(object):
 
     section = "settings"
     __initialized = False
+    # Parsed values of frequently read settings, discarded whenever a setting changes
+    _typed_cache: Dict[str, Any] = {}
+    _typed_cache_generation = -1
+
+    @classmethod
+    def _get_typed(cls, key: str, fallback: Any, convert: Callable[[Any], Any]) -> Any:
+        """
+        Retrieve the given setting converted with 'convert', parsing it only once per change to
+        the settings
+        """
+        generation = SummitRCMConfigManage.get_generation()
+        if generation != cls._typed_cache_generation:
+            cls._typed_cache = {}
+            cls._typed_cache_generation = generation
+
+        try:
+            return cls._typed_cache[key]
+        except KeyError:
+            value = convert(
+                SummitRCMConfigManage.get_key_from_section(cls.section, key, fallback)
+            )
+            cls._typed_cache[key] = value
+            return value
 
     @classmethod
     def check_init(cls):
@@ -187,61 +305,38 @@ class SystemSettingsManage(object):
     @classmethod
     def get_session_timeout(cls):
         "Unit: Minute"
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "session_timeout", 10
-            )
-        )
+        return cls._get_typed("session_timeout", 10, int)
 
     @classmethod
     def get_tamper_protection_timeout(cls):
         "Unit: Second"
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "tamper_protection_timeout", 600
-            )
-        )
+        return cls._get_typed("tamper_protection_timeout", 600, int)
 
     @classmethod
     def get_max_web_clients(cls):
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "max_web_clients", 1
-            )
-        )
+        return cls._get_typed("max_web_clients", 1, int)
 
     @classmethod
     def get_user_callback_timeout(cls):
         "Unit: Second"
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "user_callback_timeout", 10
-            )
-        )
+        return cls._get_typed("user_callback_timeout", 10, int)
 
     @classmethod
     def get_login_retry_times(cls):
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "login_retry_times", 5
-            )
-        )
+        return cls._get_typed("login_retry_times", 5, int)
 
     @classmethod
     def get_login_retry_window(cls):
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "login_retry_window", 600
-            )
-        )
+        return cls._get_typed("login_retry_window", 600, int)
 
     @classmethod
     def get_log_data_streaming_size(cls):
-        return int(
-            SummitRCMConfigManage.get_key_from_section(
-                cls.section, "log_data_streaming_size", 100
-            )
-        )
+        return cls._get_typed("log_data_streaming_size", 100, int)
+
+    @classmethod
+    def get_log_tail_queue_size(cls):
+        "Unit: Log entries"
+        return max(1, cls._get_typed("log_tail_queue_size", 256, int))
 
     @classmethod
     def get_cert_for_file_encryption(cls):
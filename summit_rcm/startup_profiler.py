@@ -0,0 +1,209 @@
+#
+# SPDX-License-Identifier: LicenseRef-Ezurio-Clause
+# Copyright (C) 2024 Ezurio LLC.
+#
+"""
+Module to profile where time is spent while Summit RCM starts up.
+
+This module is imported before anything else in the summit_rcm package, so it may only depend on
+the standard library.
+"""
+
+from contextlib import contextmanager
+import configparser
+import importlib.abc
+import os
+import sys
+from syslog import LOG_INFO, syslog
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+STARTUP_PROFILE_ENV_VAR = "SUMMIT_RCM_STARTUP_PROFILE"
+"""Environment variable that enables the startup profiler when set to 'True'"""
+
+STARTUP_PROFILE_CONF_FILE = "/etc/summit-rcm.ini"
+"""Server config file, read directly as summit_rcm.definition can't be imported this early"""
+
+STARTUP_PROFILE_LOG_TOP_N = 20
+"""Number of slowest module imports logged to syslog"""
+
+
+class ModuleImportTiming:
+    """Time spent executing a module, with and without the modules it imported itself"""
+
+    def __init__(self, name: str, cumulative: float, self_time: float) -> None:
+        self.name = name
+        self.cumulative = cumulative
+        self.self_time = self_time
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "cumulativeMs": round(self.cumulative * 1000, 3),
+            "selfMs": round(self.self_time * 1000, 3),
+        }
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader wrapper that times module execution and then restores the original loader"""
+
+    def __init__(self, loader, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.time_import(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loaders found by the other finders with _TimedLoader"""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Records how long each module takes to import and how long each named startup phase (e.g.,
+    a plugin's config hooks) takes, until the server starts listening. The profiler is enabled
+    with the 'startup_profile' option in the [summit-rcm] section of the server config file or
+    the SUMMIT_RCM_STARTUP_PROFILE environment variable. When disabled, nothing is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = self._is_enabled()
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._finder: Optional[_ImportTimingFinder] = None
+        self._local = threading.local()
+        self._imports: Dict[str, ModuleImportTiming] = {}
+        self._phases: Dict[str, float] = {}
+
+        if self.enabled:
+            self._finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    @staticmethod
+    def _is_enabled() -> bool:
+        if os.environ.get(STARTUP_PROFILE_ENV_VAR, "False") == "True":
+            return True
+
+        try:
+            parser = configparser.ConfigParser()
+            parser.read(STARTUP_PROFILE_CONF_FILE)
+            return parser.getboolean("summit-rcm", "startup_profile", fallback=False)
+        except Exception:
+            return False
+
+    @property
+    def recording(self) -> bool:
+        """Determine whether or not the profiler is still recording"""
+        return self.enabled and self._finished is None
+
+    @contextmanager
+    def time_import(self, name: str) -> Iterator[None]:
+        """Time the import of the given module, excluding it from its importer's own time"""
+        if not self.recording:
+            yield
+            return
+
+        stack: List[list] = self._local.__dict__.setdefault("stack", [])
+        frame = [time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            cumulative = time.perf_counter() - frame[0]
+            if stack:
+                stack[-1][1] += cumulative
+            self._imports[name] = ModuleImportTiming(
+                name, cumulative, cumulative - frame[1]
+            )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the given named startup phase"""
+        if not self.recording:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def finish(self) -> None:
+        """Stop recording, remove the import hook and log the results"""
+        if not self.recording:
+            return
+
+        self._finished = time.perf_counter()
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self.log()
+
+    def log(self) -> None:
+        """Log the startup time, each phase and the slowest module imports to syslog"""
+        profile = self.to_dict()
+        syslog(LOG_INFO, f"Startup profile: ready in {profile['totalMs']} ms")
+        for phase in profile["phases"]:
+            syslog(LOG_INFO, f"Startup profile: {phase['name']} - {phase['ms']} ms")
+        for module in profile["imports"][:STARTUP_PROFILE_LOG_TOP_N]:
+            syslog(
+                LOG_INFO,
+                f"Startup profile: import {module['name']} - "
+                f"{module['cumulativeMs']} ms ({module['selfMs']} ms self)",
+            )
+
+    def to_dict(self) -> dict:
+        """Retrieve the recorded timings, with imports sorted slowest first"""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return {
+            "enabled": self.enabled,
+            "complete": self._finished is not None,
+            "totalMs": round((end - self._started) * 1000, 3) if self.enabled else 0,
+            "phases": [
+                {"name": name, "ms": round(duration * 1000, 3)}
+                for name, duration in self._phases.items()
+            ],
+            "imports": [
+                timing.to_dict()
+                for timing in sorted(
+                    self._imports.values(),
+                    key=lambda timing: timing.cumulative,
+                    reverse=True,
+                )
+            ],
+        }
+
+
+startup_profiler = StartupProfiler()
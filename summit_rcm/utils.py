@@ -8,7 +8,7 @@ import base64
 import json
 from re import sub
 import shlex
-from typing import Any
+from typing import Any, AsyncIterator
 import os
 import subprocess
 import asyncio
@@ -36,6 +36,97 @@ class InProgressException(Exception):
     """
 
 
+class VersionedList(list):
+    """
+    List that counts modifications, so that structures derived from its contents can be rebuilt
+    only when it changes
+    """
+
+    version: int = 0
+
+    def append(self, value) -> None:
+        super().append(value)
+        self.version += 1
+
+    def extend(self, values) -> None:
+        super().extend(values)
+        self.version += 1
+
+    def insert(self, index, value) -> None:
+        super().insert(index, value)
+        self.version += 1
+
+    def remove(self, value) -> None:
+        super().remove(value)
+        self.version += 1
+
+    def pop(self, *args) -> Any:
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, values):
+        result = super().__iadd__(values)
+        self.version += 1
+        return result
+
+
+class PrefixTrie:
+    """
+    Character trie mapping string prefixes to values. A lookup walks the trie once and finds
+    every stored prefix of the given string.
+    """
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+        self._terminal = object()
+
+    def insert(self, prefix: str, value: Any = True) -> None:
+        """Add the given value for the given prefix"""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(self._terminal, []).append(value)
+
+    def find_prefixes(self, string: str) -> list:
+        """
+        Retrieve the values of every stored prefix of the given string, shortest prefix first
+        """
+        values = []
+        node = self._root
+        for char in string:
+            if self._terminal in node:
+                values.extend(node[self._terminal])
+            node = node.get(char, None)
+            if node is None:
+                return values
+        values.extend(node.get(self._terminal, []))
+        return values
+
+    def has_prefix(self, string: str) -> bool:
+        """Retrieve whether or not any stored prefix is a prefix of the given string"""
+        node = self._root
+        for char in string:
+            if self._terminal in node:
+                return True
+            node = node.get(char, None)
+            if node is None:
+                return False
+        return self._terminal in node
+
+
 def to_camel_case(string: str) -> str:
     """
     Return the given string formatted as camelCase.
@@ -133,3 +224,29 @@ def convert_base64_string_to_dict(base64_string: str) -> dict:
         raise ValueError(f"Expected 'str' not '{type(base64_string)}'")
 
     return json.loads(base64.urlsafe_b64decode(base64_string.encode()).decode())
+
+
+async def prime_async_iterator(iterator: AsyncIterator) -> AsyncIterator:
+    """
+    Retrieve the first item from the given async iterator before returning an iterator over all of
+    its items. This allows errors that occur while starting a stream (e.g., a failed subprocess) to
+    be handled before a response is started.
+    """
+    try:
+        first = await iterator.__anext__()
+        empty = False
+    except StopAsyncIteration:
+        first = None
+        empty = True
+
+    async def primed() -> AsyncIterator:
+        try:
+            if empty:
+                return
+            yield first
+            async for item in iterator:
+                yield item
+        finally:
+            await iterator.aclose()
+
+    return primed()